@@ -0,0 +1,150 @@
+import re
+from itertools import islice
+
+import pandas as pd
+
+from lectores import abrir, leer_encabezados
+
+# Configuración
+chunksize = 100000
+MUESTRA = 1000  # Filas que se miran al principio para saber cuántos campos traen
+HOLGURA = 8     # Campos de más que se aceptan sobre los vistos en la muestra
+
+# Columnas del export "Acumuladores de Agentes", en orden. Hay exportaciones con el
+# encabezado cortado (unas 40 columnas) cuyas filas traen igual todos estos campos,
+# y otras con filas que terminan en ';' (un campo vacío de más); el lector acepta
+# filas de cualquier ancho.
+COLUMNAS_ACUMULADORES = [
+    "Intervalo", "Cantidad Agentes Únicos", "Cantidad Agentes Simultáneos", "Grupo", "Login Id", "Agente",
+    "LogIn", "Internas Entrantes No Atendidas", "Internas Entrantes Atendidas",
+    "Internas Salientes No Atendidas", "Internas Salientes Atendidas", "Entrantes No Atendidas",
+    "Entrantes Atendidas", "Salientes No Atendidas", "Salientes Atendidas", "Discador No Atendidas",
+    "Discador Atendidas", "Transfer In", "Transfer Out", "Unstaffed", "Avail", "Preview", "Dial", "Ring",
+    "Connect", "Hold", "ACW", "Not Ready", "Break", "Lunch", "Coaching", "Administrativo", "Baño",
+    "Llamada_Manual", "Tipo de Break 6", "Tipo de Break 7", "Tipo de Break 8", "Tipo de Break 9",
+    "Auxiliar Total", "Auxiliar %", "Tiempo Real de Logueo", "Utilización", "Connect % Real", "Ring % Real",
+    "Avail % Real", "AHT", "ATT", "Avail Count", "Hold Count", "Not Ready Count", "Avail Max", "Hold Max",
+    "Not Ready Max", "Talking Time Internas Entrantes", "Talking Time Internas Salientes",
+    "Tipificación Otro", "Tipificación Exitoso", "Tipificación No Exitoso", "Tipificación No Efectivo",
+    "Tipificación Neutro", "FechaRango", "CE", "%CE", "Exitos / CE", "Exitos por Hora Real", "idAgente",
+    "idGrupo"
+]
+# Columnas que quedan como texto; el resto se convierte a número con coma decimal
+COLUMNAS_TEXTO = ["Intervalo", "Grupo", "Login Id", "Agente", "FechaRango"]
+PREFIJO_EXTRA = "Campo extra"
+
+# Mensaje del parser de C cuando una fila trae más campos que nombres
+CAMPOS_DE_MAS = re.compile(r"Expected \d+ fields in line \d+, saw (\d+)")
+
+
+def _anchos_en_muestra(archivo):
+    """Cantidades de campos distintas en las primeras MUESTRA filas de datos."""
+    with abrir(archivo) as file:
+        file.readline()
+        return {linea.rstrip(b'\r\n').count(b';') + 1 for linea in islice(file, MUESTRA)}
+
+
+def nombres_campos(archivo, anchos=None):
+    """Nombre de cada campo de las filas: los del encabezado y, después, los conocidos del export.
+
+    Si el encabezado es el principio de COLUMNAS_ACUMULADORES, los campos que
+    siguen toman los nombres que faltan; los que sobran (el ';' final u otros)
+    se llaman "Campo extra N". Se dejan HOLGURA nombres de más para filas más
+    largas que las de la muestra.
+    """
+    encabezado = leer_encabezados(archivo)
+    nombres = list(encabezado)
+    if encabezado == COLUMNAS_ACUMULADORES[:len(encabezado)]:
+        nombres = list(COLUMNAS_ACUMULADORES)
+    if anchos is None:
+        anchos = _anchos_en_muestra(archivo)
+    return _completar(nombres, max(anchos | {len(encabezado)}) + HOLGURA)
+
+
+def _completar(nombres, cantidad):
+    """Agrega nombres "Campo extra N" hasta tener 'cantidad'."""
+    nombres = list(nombres)
+    extra = sum(nombre.startswith(PREFIJO_EXTRA) for nombre in nombres) + 1
+    while len(nombres) < cantidad:
+        nombres.append(f"{PREFIJO_EXTRA} {extra}")
+        extra += 1
+    return nombres
+
+
+def columnas_disponibles(archivo):
+    """Columnas con nombre del archivo (sin los campos extra)."""
+    return [nombre for nombre in nombres_campos(archivo) if not nombre.startswith(PREFIJO_EXTRA)]
+
+
+def _a_numero(chunk, columnas):
+    """Convierte con coma decimal las columnas que el parser dejó como texto (algún valor raro)."""
+    for columna in columnas:
+        if not pd.api.types.is_numeric_dtype(chunk[columna]):
+            texto = chunk[columna].astype(str).str.replace(",", ".", regex=False)
+            chunk[columna] = pd.to_numeric(texto, errors="coerce")
+    return chunk
+
+
+def _leer(archivo, nombres, usecols, texto, chunksize, saltar=1):
+    with abrir(archivo) as file:
+        yield from pd.read_csv(
+            file,
+            sep=';',
+            decimal=',',
+            header=None,
+            skiprows=saltar,
+            names=nombres,
+            usecols=usecols,
+            dtype={col: str for col in texto},
+            encoding='utf-8-sig',
+            chunksize=chunksize
+        )
+
+
+def leer_acumuladores(archivo, columnas=None, chunksize=chunksize):
+    """Lee el export en chunks con "Intervalo", "Agente" y las columnas pedidas (None: todas las conocidas).
+
+    Todo pasa por el parser de C de pandas con un nombre para cada campo, así
+    las filas con campos de más o de menos (';' final, encabezado cortado) se
+    leen completas en lugar de descartarse, y "0,9161" o 12,75 llegan como
+    float sin pasar por Python. Las columnas de COLUMNAS_TEXTO quedan como texto.
+
+    Si las filas de la muestra tienen todas el mismo ancho se leen solo las
+    columnas pedidas (usecols). Con usecols el parser de C rechaza un chunk
+    cuyas filas son todas más cortas que los nombres; si pasa, el resto del
+    archivo se lee con todos los campos. Si más adelante aparece una fila con
+    más campos que nombres, se agregan nombres y se relee desde ese chunk.
+    """
+    anchos = _anchos_en_muestra(archivo)
+    nombres = nombres_campos(archivo, anchos)
+    if columnas is None:
+        columnas = [nombre for nombre in nombres if not nombre.startswith(PREFIJO_EXTRA)]
+    usadas = list(dict.fromkeys(["Intervalo", "Agente", *columnas]))
+    faltantes = set(usadas) - set(nombres)
+    if faltantes:
+        raise ValueError(f"Faltan las columnas {sorted(faltantes)} en '{archivo}'. Columnas: {nombres}")
+    texto = [col for col in usadas if col in COLUMNAS_TEXTO]
+    numericas = [col for col in usadas if col not in COLUMNAS_TEXTO]
+
+    filas = 0
+    if len(anchos) == 1:
+        ancho = anchos.pop()
+        if set(usadas) <= set(nombres[:ancho]):
+            try:
+                for chunk in _leer(archivo, nombres[:ancho], usadas, texto, chunksize):
+                    filas += len(chunk)
+                    yield _a_numero(chunk[usadas], numericas)
+                return
+            except pd.errors.ParserError:
+                pass
+    while True:
+        try:
+            for chunk in _leer(archivo, nombres, None, texto, chunksize, saltar=1 + filas):
+                filas += len(chunk)
+                yield _a_numero(chunk[usadas], numericas)
+            return
+        except pd.errors.ParserError as e:
+            campos = CAMPOS_DE_MAS.search(str(e))
+            if campos is None or int(campos.group(1)) <= len(nombres):
+                raise
+            nombres = _completar(nombres, int(campos.group(1)) + HOLGURA)
@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+
+
+class DigestoCuantiles:
+    """Histograma logarítmico combinable (tipo DDSketch) para percentiles con error relativo acotado.
+
+    Cada valor positivo cae en el balde ceil(log_gamma(x)); el cuantil devuelto
+    difiere del real en menos de 'error_relativo'. La memoria depende solo del
+    rango de valores, no de la cantidad de filas.
+    """
+
+    def __init__(self, error_relativo=0.01):
+        self.error_relativo = error_relativo
+        self.gamma = (1 + error_relativo) / (1 - error_relativo)
+        self.log_gamma = np.log(self.gamma)
+        self.baldes = np.zeros(0, dtype=np.int64)
+        self.ceros = 0
+        self.cantidad = 0
+        self.maximo = None
+
+    def indices(self, valores):
+        """Balde de cada valor (-1 para los valores <= 0)."""
+        valores = np.asarray(valores, dtype=np.float64)
+        positivos = valores > 0
+        indices = np.full(len(valores), -1, dtype=np.int64)
+        indices[positivos] = np.ceil(np.log(valores[positivos]) / self.log_gamma).astype(np.int64)
+        return indices
+
+    def agregar_indices(self, indices, maximo=None):
+        """Suma al histograma los baldes ya calculados con indices()."""
+        indices = np.asarray(indices, dtype=np.int64)
+        positivos = indices[indices >= 0]
+        self.ceros += len(indices) - len(positivos)
+        self.cantidad += len(indices)
+        if len(positivos):
+            conteo = np.bincount(positivos)
+            if len(conteo) > len(self.baldes):
+                self.baldes = np.pad(self.baldes, (0, len(conteo) - len(self.baldes)))
+            self.baldes[:len(conteo)] += conteo
+        if maximo is not None and (self.maximo is None or maximo > self.maximo):
+            self.maximo = maximo
+
+    def agregar(self, valores):
+        valores = np.asarray(valores, dtype=np.float64)
+        valores = valores[~np.isnan(valores)]
+        self.agregar_indices(self.indices(valores), valores.max() if len(valores) else None)
+
+    def combinar(self, otro):
+        if len(otro.baldes) > len(self.baldes):
+            self.baldes = np.pad(self.baldes, (0, len(otro.baldes) - len(self.baldes)))
+        self.baldes[:len(otro.baldes)] += otro.baldes
+        self.ceros += otro.ceros
+        self.cantidad += otro.cantidad
+        if otro.maximo is not None and (self.maximo is None or otro.maximo > self.maximo):
+            self.maximo = otro.maximo
+
+    def cuantil(self, q):
+        """Valor aproximado del cuantil q (0 a 1)."""
+        if self.cantidad == 0:
+            return np.nan
+        if q >= 1 and self.maximo is not None:
+            return self.maximo
+        rango = q * (self.cantidad - 1)
+        if rango < self.ceros:
+            return 0.0
+        balde = int(np.searchsorted(np.cumsum(self.baldes), rango - self.ceros, side='right'))
+        valor = 2 * self.gamma ** balde / (self.gamma + 1)
+        return min(valor, self.maximo) if self.maximo is not None else valor
+
+
+def _ceros_iniciales(valores):
+    """Cantidad de ceros a la izquierda de cada entero de 64 bits (vectorizado)."""
+    valores = valores.astype(np.uint64)
+    ceros = np.zeros(len(valores), dtype=np.int64)
+    for bits in (32, 16, 8, 4, 2, 1):
+        sin_bits_altos = (valores >> np.uint64(64 - bits)) == 0
+        ceros += np.where(sin_bits_altos, bits, 0)
+        valores = np.where(sin_bits_altos, valores << np.uint64(bits), valores)
+    return ceros + (valores == 0)
+
+
+class HyperLogLog:
+    """Contador aproximado de valores distintos con memoria fija (2**precision bytes)."""
+
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.registros = np.zeros(1 << precision, dtype=np.uint8)
+
+    def agregar_hashes(self, hashes):
+        """Agrega valores ya convertidos a hash de 64 bits."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if not len(hashes):
+            return
+        registro = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        resto = hashes << np.uint64(self.precision)
+        rango = np.minimum(_ceros_iniciales(resto) + 1, 64 - self.precision + 1).astype(np.uint8)
+        np.maximum.at(self.registros, registro, rango)
+
+    def agregar(self, valores):
+        valores = pd.Series(valores).dropna()
+        self.agregar_hashes(pd.util.hash_array(valores.astype(str).to_numpy(dtype=object), categorize=False))
+
+    def combinar(self, otro):
+        np.maximum(self.registros, otro.registros, out=self.registros)
+
+    def estimar(self):
+        """Cantidad estimada de valores distintos."""
+        m = len(self.registros)
+        alfa = 0.7213 / (1 + 1.079 / m)
+        estimado = alfa * m * m / np.sum(2.0 ** -self.registros.astype(np.float64))
+        vacios = np.count_nonzero(self.registros == 0)
+        if estimado <= 2.5 * m and vacios:
+            # Conteo lineal para cardinalidades chicas
+            estimado = m * np.log(m / vacios)
+        return int(round(estimado))
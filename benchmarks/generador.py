@@ -0,0 +1,245 @@
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Encabezados reales de las exportaciones
+COLUMNAS_INTERACCIONES = [
+    "Empresa", "Campaña", "Lote", "Inicio", "idInteraccion", "Segmento", "Tipo Contacto", "Cliente",
+    "idAgenteCliente", "LoginID Agente Cliente", "Agente Cliente", "DNIS", "Sentido", "LoginId",
+    "Nombre Agente", "idCliente", "Nombre Cliente", "Duración", "Tiempo Tarifado", "Preview", "Dialing",
+    "Ringing", "TalkingTime", "Hold", "ACW", "EnCola", "Tipificación", "Tipos Tipificación", "CRM", "Sitio",
+    "Equipo", "Troncal", "Canal IVR", "idTarea", "Entrante", "Derivada", "Abandonada", "FlowIn", "FlowOut",
+    "TransferIn", "TransferOut", "Origen Corte", "Contexto", "Causa Terminación", "idCausaQ850",
+    "CausaQ850", "idEmpresa", "idCampania", "idLote"
+]
+
+COLUMNAS_ACUMULADORES = [
+    "Intervalo", "Cantidad Agentes Únicos", "Cantidad Agentes Simultáneos", "Grupo", "Login Id", "Agente",
+    "LogIn", "Internas Entrantes No Atendidas", "Internas Entrantes Atendidas",
+    "Internas Salientes No Atendidas", "Internas Salientes Atendidas", "Entrantes No Atendidas",
+    "Entrantes Atendidas", "Salientes No Atendidas", "Salientes Atendidas", "Discador No Atendidas",
+    "Discador Atendidas", "Transfer In", "Transfer Out", "Unstaffed", "Avail", "Preview", "Dial", "Ring",
+    "Connect", "Hold", "ACW", "Not Ready", "Break", "Lunch", "Coaching", "Administrativo", "Baño",
+    "Llamada_Manual", "Tipo de Break 6", "Tipo de Break 7", "Tipo de Break 8", "Tipo de Break 9",
+    "Auxiliar Total", "Auxiliar %", "Tiempo Real de Logueo", "Utilización", "Connect % Real", "Ring % Real",
+    "Avail % Real", "AHT", "ATT", "Avail Count", "Hold Count", "Not Ready Count", "Avail Max", "Hold Max",
+    "Not Ready Max", "Talking Time Internas Entrantes", "Talking Time Internas Salientes",
+    "Tipificación Otro", "Tipificación Exitoso", "Tipificación No Exitoso", "Tipificación No Efectivo",
+    "Tipificación Neutro", "FechaRango", "CE", "%CE", "Exitos / CE", "Exitos por Hora Real", "idAgente",
+    "idGrupo"
+]
+
+TIPIFICACIONES = [
+    ("Se Corto Llamada", "No Exitoso"), ("Conforme con plan-prestador actual", "No Exitoso"),
+    ("No quiere volver a ser contactado", "No Exitoso"), ("Cliente Ocupado", "No Exitoso"),
+    ("Contestador", "No Exitoso"), ("Agendado por el Vdor", "Exitoso"), ("Venta", "Exitoso"),
+]
+
+CAUSAS = [
+    ("Llamada no atendida por parte del abonado B", "19", "No answer from user (user alerted)"),
+    ("Atiende un contestador", "131", "CONTESTADOR"),
+    ("Se contacta con el operador", "136", "OPERADOR"),
+    ("El Cliente Atiende y No Habla", "132", "NO HABLA"),
+    ("Congestion", "18", "No user responding"),
+]
+
+# Horario de discado: de 8:00 a 21:00
+SEGUNDO_DESDE = 8 * 3600
+SEGUNDO_HASTA = 21 * 3600
+
+
+def _texto(valores):
+    """Convierte un arreglo a texto (arreglo de objetos str, más rápido de unir que una Series)."""
+    return np.asarray(valores).astype(str).astype(object)
+
+
+def _constante(valor, n):
+    return np.full(n, valor, dtype=object)
+
+
+def _citar(valores):
+    """Cita los valores que empiezan con cero, como hace la exportación ("0", "0111...", "0,91")."""
+    codigos, unicos = pd.factorize(valores)
+    citados = np.array([f'"{v}"' if v.startswith('0') else v for v in unicos] + [''], dtype=object)
+    return citados[codigos]
+
+
+def _decimal_coma(valores):
+    """Formatea floats con coma decimal (12,75)."""
+    texto = pd.Series(_texto(np.round(valores, 4)), dtype=object)
+    return texto.str.replace('.', ',', regex=False).str.replace(r',0$', '', regex=True).to_numpy(dtype=object)
+
+
+def _unir(columnas):
+    """Une las columnas en líneas del CSV separadas por ';'."""
+    return list(map(';'.join, zip(*columnas)))
+
+
+def _fecha_hora(fechas):
+    """Formatea fechas como 'd/m/aaaa hh:mm:ss' (día y mes sin cero inicial, como la exportación)."""
+    return (_texto(fechas.day) + '/' + _texto(fechas.month) + '/'
+            + pd.DatetimeIndex(fechas).strftime('%Y %H:%M:%S').to_numpy(dtype=object))
+
+
+def _por_dia(desde, dias, formato):
+    """Texto de cada día del período; se indexa con el número de día de cada fila."""
+    return pd.date_range(desde, periods=dias).strftime(formato).to_numpy(dtype=object)
+
+
+def _por_segundo(formato):
+    """Texto de cada segundo del día; se indexa con el segundo de cada fila."""
+    return pd.date_range('2000-01-01', periods=86400, freq='s').strftime(formato).to_numpy(dtype=object)
+
+
+def _elegir(opciones, indices):
+    return np.array(opciones, dtype=object)[np.asarray(indices, dtype=np.int64)]
+
+
+def generar_interacciones(archivo, filas, agentes, desde, dias, semilla=0, filas_por_bloque=500000):
+    """Escribe una exportación sintética de "Detalle Interacciones", mayormente ordenada por Inicio."""
+    rng = np.random.default_rng(semilla)
+    id_tarea = 66550000
+    # Formatear cada fecha por separado es lo más lento: se arma con tablas por día y por segundo
+    fecha_dia = np.array([f"{d.day}/{d.month}/{d.year}" for d in pd.date_range(desde, periods=dias)], dtype=object)
+    lote_dia = _por_dia(desde, dias, '%Y%m%d_Mza_DNI_Personal')
+    id_dia = _por_dia(desde, dias, '%y%m%d')
+    hora_segundo = _por_segundo(' %H:%M:%S')
+    id_segundo = _por_segundo('%H%M%S')
+
+    with open(archivo, 'w', encoding='utf-8-sig', newline='') as file:
+        file.write(';'.join(COLUMNAS_INTERACCIONES) + '\n')
+
+        for base in range(0, filas, filas_por_bloque):
+            n = min(filas_por_bloque, filas - base)
+            # Cada bloque cubre su tramo de días; dentro del día las llamadas salen en tandas cada 3 segundos
+            dia = (base + np.arange(n)) * dias // filas
+            segundo = rng.integers(SEGUNDO_DESDE, SEGUNDO_HASTA, n) // 3 * 3
+            orden = np.lexsort((segundo, dia))
+            dia, segundo = dia[orden], segundo[orden]
+
+            atendida = rng.random(n) < 0.4
+            agente = _texto(rng.integers(1, agentes + 1, n))
+            talking = np.where(atendida, rng.lognormal(3.5, 1.1, n).astype(np.int64), 0)
+            duracion = talking + rng.integers(10, 40, n)
+            tip = rng.integers(0, len(TIPIFICACIONES), n)
+            causa = rng.integers(0, len(CAUSAS), n)
+            cliente = '0' + _texto(rng.integers(11_0000_0000, 3_9999_9999_99, n))
+            vacio = _constante('', n)
+            cero = _constante('0', n)
+
+            columnas = {col: vacio for col in COLUMNAS_INTERACCIONES}
+            columnas.update({
+                "Empresa": _constante('AZO', n),
+                "Campaña": _elegir(['MVS_MZA', 'MVS_SJ'], rng.random(n) < 0.2),
+                "Lote": lote_dia[dia],
+                "Inicio": fecha_dia[dia] + hora_segundo[segundo],
+                "idInteraccion": id_dia[dia] + id_segundo[segundo]
+                + _texto(rng.integers(100, 999, n)) + '_ACD_' + _texto(rng.integers(10000, 99999, n)),
+                "Segmento": _elegir(['1', '2'], rng.random(n) < 0.1),
+                "Tipo Contacto": _constante('Llamada', n),
+                "Cliente": cliente,
+                "Sentido": _constante('Discador Predictivo', n),
+                "LoginId": np.where(atendida, 'mza' + agente, ''),
+                "Nombre Agente": np.where(atendida, 'MZA ' + agente, ''),
+                "idCliente": cliente,
+                "Duración": _texto(duracion),
+                "Tiempo Tarifado": _texto(talking),
+                "Preview": cero, "Dialing": cero, "Ringing": cero, "Hold": cero, "EnCola": cero,
+                "TalkingTime": _texto(talking),
+                "ACW": _texto(np.where(atendida, rng.integers(0, 30, n), 0)),
+                "Tipificación": np.where(atendida, _elegir([t for t, _ in TIPIFICACIONES], tip), 'No Disp.'),
+                "Tipos Tipificación": np.where(atendida, _elegir([t for _, t in TIPIFICACIONES], tip), ''),
+                "Sitio": cero,
+                "Equipo": _texto(rng.integers(0, 5, n)),
+                "Troncal": _texto(rng.integers(1, 40, n)),
+                "Canal IVR": _texto(rng.integers(1, 300, n)),
+                "idTarea": _texto(id_tarea + base + np.arange(n)),
+                "Entrante": _texto(atendida.astype(int)), "Derivada": _texto(atendida.astype(int)),
+                "Abandonada": cero, "FlowIn": cero, "FlowOut": cero, "TransferIn": cero, "TransferOut": cero,
+                "Origen Corte": _elegir(['Agente', 'Cliente'], rng.random(n) < 0.3),
+                "Causa Terminación": _elegir([c[0] for c in CAUSAS], causa),
+                "idCausaQ850": _elegir([c[1] for c in CAUSAS], causa),
+                "CausaQ850": _elegir([c[2] for c in CAUSAS], causa),
+                "idEmpresa": _constante('1', n), "idCampania": _constante('23', n),
+                "idLote": _constante('1550', n),
+            })
+            lineas = _unir([_citar(columnas[col]) for col in COLUMNAS_INTERACCIONES])
+            file.write('\n'.join(lineas) + '\n')
+            print(f"  {base + n}/{filas} filas")
+
+
+def generar_acumuladores(archivo, agentes, desde, dias, semilla=0, campos_extra=0):
+    """Escribe una exportación sintética de "Acumuladores de Agentes" (un intervalo de 30 minutos por fila).
+
+    'campos_extra' agrega campos sobrantes al final de cada fila, como en las exportaciones desparejas.
+    """
+    rng = np.random.default_rng(semilla + 1)
+    # Intervalos de 30 minutos de 9:00 a 20:30 de cada día
+    fechas = pd.DatetimeIndex([
+        inicio for dia in pd.date_range(desde, periods=dias)
+        for inicio in pd.date_range(dia + pd.Timedelta(hours=9), periods=24, freq='30min')
+    ])
+    agente = _texto(np.tile(np.arange(1, agentes + 1), len(fechas)))
+    fechas = fechas.repeat(agentes)
+    n = len(fechas)
+
+    segundos = {col: rng.integers(0, 900, n) * (rng.random(n) < 0.5) for col in
+                ("Avail", "Connect", "ACW", "Not Ready", "Break", "Lunch", "Baño", "Administrativo")}
+    logueo = sum(segundos.values()) + rng.integers(0, 120, n)
+    auxiliar = segundos["Break"] + segundos["Lunch"] + segundos["Baño"] + segundos["Administrativo"]
+    vacio = _constante('', n)
+
+    columnas = {col: _texto(rng.integers(0, 3, n)) for col in COLUMNAS_ACUMULADORES}
+    columnas.update({col: _texto(valor) for col, valor in segundos.items()})
+    columnas.update({
+        "Intervalo": _fecha_hora(fechas),
+        "Cantidad Agentes Únicos": vacio, "Cantidad Agentes Simultáneos": vacio, "FechaRango": vacio,
+        "idGrupo": vacio,
+        "Grupo": _constante('Mendoza1', n),
+        "Login Id": 'mza' + agente,
+        "Agente": 'MZA ' + agente,
+        "LogIn": _texto(logueo),
+        "Auxiliar Total": _texto(auxiliar),
+        "Auxiliar %": _decimal_coma(auxiliar / np.maximum(logueo, 1)),
+        "Tiempo Real de Logueo": _texto(logueo),
+        "Utilización": _decimal_coma(segundos["Connect"] / np.maximum(logueo, 1)),
+        "ATT": _decimal_coma(rng.integers(0, 4000, n) / 100),
+        "Exitos / CE": _decimal_coma(rng.random(n)),
+        "Exitos por Hora Real": _decimal_coma(rng.random(n) * 20),
+        "idAgente": '2' + _texto(np.char.zfill(agente.astype(str), 3)),
+    })
+    # Las filas terminan con ';' como en la exportación original
+    fin = ';' * (1 + campos_extra)
+    lineas = _unir([_citar(columnas[col]) for col in COLUMNAS_ACUMULADORES])
+    with open(archivo, 'w', encoding='utf-8-sig', newline='') as file:
+        file.write(';'.join(COLUMNAS_ACUMULADORES) + '\n')
+        file.write(f'{fin}\n'.join(lineas) + f'{fin}\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera exportaciones sintéticas para los benchmarks.")
+    parser.add_argument("--filas", type=int, default=100000, help="Filas de Detalle Interacciones.")
+    parser.add_argument("--agentes", type=int, default=60)
+    # origenCorte y Agendado solo cuentan diciembre: el período por defecto empieza ahí
+    parser.add_argument("--desde", default="2024-12-01", help="Primer día (aaaa-mm-dd).")
+    parser.add_argument("--dias", type=int, default=28)
+    parser.add_argument("--campos-extra", type=int, default=0, help="Campos sobrantes por fila en acumuladores.")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", default=str(Path(__file__).resolve().parent / "datos"))
+    args = parser.parse_args()
+
+    carpeta = Path(args.salida)
+    carpeta.mkdir(parents=True, exist_ok=True)
+    interacciones = carpeta / "Detalle Interacciones (Campaña - Lote).csv"
+    acumuladores = carpeta / "Acumuladores de Agentes (2).csv"
+
+    print(f"Generando {interacciones} ({args.filas} filas)...")
+    generar_interacciones(interacciones, args.filas, args.agentes, args.desde, args.dias, args.semilla)
+    print(f"Generando {acumuladores}...")
+    generar_acumuladores(acumuladores, args.agentes, args.desde, args.dias, args.semilla, args.campos_extra)
+
+
+if __name__ == '__main__':
+    main()
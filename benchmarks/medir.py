@@ -0,0 +1,190 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+# Configuración
+carpeta_datos = RAIZ / "benchmarks" / "datos"
+carpeta_resultados = RAIZ / "benchmarks" / "resultados"
+ARCHIVO_INTERACCIONES = "Detalle Interacciones (Campaña - Lote).csv"
+ARCHIVO_ACUMULADORES = "Acumuladores de Agentes (2).csv"
+
+# Lógica de break por turno del cuaderno "Estadisticas Febrero/Estadistica.ipynb" (sin los gráficos).
+# index_col=False: con el ';' al final de cada fila pandas tomaría la primera columna como índice
+CUADERNO_BREAKS = """
+import pandas as pd
+df = pd.read_csv('Acumuladores de Agentes (2).csv', sep=';', index_col=False)
+df['Intervalo'] = pd.to_datetime(df['Intervalo'], dayfirst=True)
+df['Fecha'] = df['Intervalo'].dt.date
+df['Turno'] = df['Intervalo'].apply(lambda x: 'Mañana' if x.hour >= 9 and x.hour < 14 else 'Tarde')
+promedio_turno = df.groupby(['Agente', 'Fecha', 'Turno'])['Break'].sum().reset_index()
+promedio_turno['Promedio por Break (min)'] = (promedio_turno['Break'] / 60).astype(int)
+rangos = {'Mañana': '09:30:00 hasta 14:30:00', 'Tarde': '15:00:00 hasta 20:00:00'}
+promedio_turno['Rango de hora'] = promedio_turno['Turno'].apply(lambda turno: rangos.get(turno, ''))
+df_final = promedio_turno.pivot_table(index=['Agente', 'Fecha'], columns='Rango de hora',
+                                      values='Promedio por Break (min)', aggfunc='sum')
+df_final.columns = [f'Promedio por Break: {col}' for col in df_final.columns]
+df_final = df_final.astype(object).fillna('Sin datos')
+df_final.to_csv('Estadisticas.csv', index=True, sep=';', encoding='utf8')
+"""
+
+# estadisticaBreaks.py sin los gráficos: la misma salida que "breaks", para comparar tiempos
+# (con los gráficos se mide aparte, en "estadisticaBreaks_graficos")
+SIN_GRAFICOS_BREAKS = """
+import estadisticaBreaks
+estadisticaBreaks.guardar_estadisticas(estadisticaBreaks.calcular_totales(estadisticaBreaks.archivo_entrada))
+"""
+
+# Comando de cada pipeline (se ejecuta en una carpeta temporal con los archivos de entrada)
+PIPELINES = {
+    "origenCorte": [str(RAIZ / "origenCorte.py")],
+    "Agendado": [str(RAIZ / "Agendado.py")],
+    "origenXagente": [str(RAIZ / "origenXagente.py")],
+    "origenXagenteDiaria": [str(RAIZ / "origenXagenteDiaria.py")],
+    "origenXagenteDiana": [str(RAIZ / "origenXagenteDiana.py")],
+    "mayora_1Min": [str(RAIZ / "mayora_1Min.py")],
+    "fecha": [str(RAIZ / "fecha.py")],
+    "breaks": ["-c", CUADERNO_BREAKS],
+    "estadisticaBreaks": ["-c", SIN_GRAFICOS_BREAKS],
+    "estadisticaBreaks_graficos": [str(RAIZ / "estadisticaBreaks.py")],
+    "intervalos": [str(RAIZ / "intervalos.py")],
+    "clientes": [str(RAIZ / "clientes.py")],
+}
+
+# Nombre con el que cada script busca su archivo de entrada
+ENTRADAS = {
+    "datos.csv": ARCHIVO_INTERACCIONES,
+    "archivo.csv": ARCHIVO_INTERACCIONES,
+    ARCHIVO_ACUMULADORES: ARCHIVO_ACUMULADORES,
+}
+
+
+def _enlazar(origen, destino):
+    """Enlaza el archivo de entrada en la carpeta de trabajo (copia si no se permiten enlaces)."""
+    try:
+        os.symlink(origen, destino)
+    except OSError:
+        shutil.copy(origen, destino)
+
+
+def _memoria_pico_mb(uso):
+    # ru_maxrss viene en KB en Linux y en bytes en macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(uso.ru_maxrss / divisor, 1)
+
+
+def ejecutar(comando, carpeta, lector=None):
+    """Ejecuta un pipeline y devuelve segundos, memoria pico (MB, None si no se puede medir) y código de salida."""
+    entorno = dict(os.environ, MPLBACKEND="Agg", PYTHONPATH=str(RAIZ))
+    if lector:
+        entorno["LECTOR"] = lector
+    inicio = time.perf_counter()
+    proceso = subprocess.Popen([sys.executable, *comando], cwd=carpeta, env=entorno,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if hasattr(os, "wait4"):
+        # wait4 devuelve el uso de recursos del proceso hijo, incluido el pico de memoria
+        _, estado, uso = os.wait4(proceso.pid, 0)
+        segundos = time.perf_counter() - inicio
+        codigo = os.waitstatus_to_exitcode(estado)
+        memoria = _memoria_pico_mb(uso)
+        proceso.returncode = codigo
+        error = proceso.stderr.read().decode(errors="replace")
+    else:
+        error = proceso.communicate()[1].decode(errors="replace")
+        segundos = time.perf_counter() - inicio
+        codigo = proceso.returncode
+        memoria = None
+    proceso.stderr.close()
+    if codigo != 0:
+        print(error.strip().splitlines()[-1] if error.strip() else f"Código de salida {codigo}")
+    return round(segundos, 3), memoria, codigo
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def medir(datos, pipelines, repeticiones=1, lector=None):
+    """Corre cada pipeline sobre los archivos de 'datos' y devuelve el resultado listo para guardar como JSON."""
+    datos = Path(datos).resolve()
+    for archivo in set(ENTRADAS.values()):
+        if not (datos / archivo).exists():
+            raise ValueError(f"No se encontró '{datos / archivo}'. Generarlo con benchmarks/generador.py")
+
+    resultados = []
+    for nombre in pipelines:
+        for repeticion in range(repeticiones):
+            # Carpeta nueva en cada corrida para que ningún caché o salida previa influya
+            with tempfile.TemporaryDirectory(prefix="bench_") as carpeta:
+                for destino, origen in ENTRADAS.items():
+                    _enlazar(datos / origen, Path(carpeta) / destino)
+                segundos, memoria, codigo = ejecutar(PIPELINES[nombre], carpeta, lector)
+            print(f"{nombre:<22} {segundos:>9.2f} s {memoria if memoria is not None else '-':>9} MB")
+            resultados.append({"pipeline": nombre, "repeticion": repeticion, "segundos": segundos,
+                               "memoria_pico_mb": memoria, "codigo_salida": codigo})
+
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "plataforma": platform.platform(),
+        "lector": lector or os.environ.get("LECTOR", "config.py"),
+        "datos": {archivo: (datos / archivo).stat().st_size for archivo in set(ENTRADAS.values())},
+        "resultados": resultados,
+    }
+
+
+def comparar(actual, anterior):
+    """Muestra la diferencia de tiempo y memoria (mejor corrida de cada pipeline) contra una corrida anterior."""
+    def mejores(corrida):
+        tabla = pd.DataFrame(corrida["resultados"])
+        return tabla[tabla["codigo_salida"] == 0].groupby("pipeline")[["segundos", "memoria_pico_mb"]].min()
+
+    tabla = mejores(actual).join(mejores(anterior), rsuffix=" anterior", how="inner")
+    tabla["tiempo %"] = (100 * (tabla["segundos"] / tabla["segundos anterior"] - 1)).round(1)
+    tabla["memoria %"] = (100 * (tabla["memoria_pico_mb"] / tabla["memoria_pico_mb anterior"] - 1)).round(1)
+    print(f"\nComparación contra la corrida del {anterior['fecha']} (commit {anterior['commit']}):")
+    print(tabla.to_string())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mide tiempo y memoria pico de cada pipeline.")
+    parser.add_argument("--datos", default=str(carpeta_datos), help="Carpeta con los archivos generados.")
+    parser.add_argument("--pipelines", nargs="+", choices=list(PIPELINES), default=list(PIPELINES))
+    parser.add_argument("--repeticiones", type=int, default=1)
+    parser.add_argument("--comparar", help="JSON de una corrida anterior para comparar.")
+    parser.add_argument("--lector", choices=["pandas", "arrow", "streaming"],
+                        help="Lector de CSV de los pipelines (lectores.py); por defecto el de config.py.")
+    args = parser.parse_args()
+
+    resultado = medir(args.datos, args.pipelines, args.repeticiones, args.lector)
+
+    carpeta_resultados.mkdir(parents=True, exist_ok=True)
+    archivo = carpeta_resultados / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    with open(archivo, 'w', encoding='utf-8') as file:
+        json.dump(resultado, file, ensure_ascii=False, indent=2)
+    print(f"Resultados guardados en '{archivo}'.")
+
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as file:
+            comparar(resultado, json.load(file))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+from lectores import leer_csv, leer_encabezados, ruta_derivada
+from parseo_fechas import parsear_inicio
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:  # El caché es opcional: sin pyarrow se lee siempre el CSV
+    pa = None
+    ds = None
+
+# Configuración
+chunksize = 100000
+ARCHIVO_FIRMA = "_firma.json"
+
+# Columnas numéricas de "Detalle Interacciones" (llegan como texto con comillas, p. ej. "0")
+COLUMNAS_NUMERICAS = [
+    "Segmento", "Duración", "Tiempo Tarifado", "Preview", "Dialing", "Ringing",
+    "TalkingTime", "Hold", "ACW", "EnCola", "Sitio", "Equipo", "Troncal",
+    "Canal IVR", "idTarea", "Entrante", "Derivada", "Abandonada", "FlowIn",
+    "FlowOut", "TransferIn", "TransferOut", "idCausaQ850", "idEmpresa",
+    "idCampania", "idLote"
+]
+
+
+def ruta_cache(archivo):
+    """Devuelve la carpeta del caché columnar, al lado del archivo fuente."""
+    return ruta_derivada(archivo, ".parquet")
+
+
+def calcular_hash(archivo):
+    """Calcula el SHA-1 del archivo leyendo bloques de 1 MB."""
+    sha1 = hashlib.sha1()
+    with open(archivo, 'rb') as file:
+        for bloque in iter(lambda: file.read(1 << 20), b''):
+            sha1.update(bloque)
+    return sha1.hexdigest()
+
+
+def leer_firma(archivo):
+    """Lee la firma (tamaño, mtime y hash) con la que se generó el caché."""
+    ruta = ruta_cache(archivo) / ARCHIVO_FIRMA
+    if not ruta.exists():
+        return None
+    with open(ruta, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def cache_valido(archivo):
+    """Indica si existe un caché generado a partir del contenido actual del archivo."""
+    if pa is None:
+        return False
+    firma = leer_firma(archivo)
+    if firma is None:
+        return False
+
+    estado = os.stat(archivo)
+    if firma["tamanio"] != estado.st_size:
+        return False
+    if firma["mtime_ns"] == estado.st_mtime_ns:
+        return True
+
+    # Cambió solo el mtime (copia, descarga repetida): confirmar por hash
+    if firma["sha1"] != calcular_hash(archivo):
+        return False
+    firma["mtime_ns"] = estado.st_mtime_ns
+    with open(ruta_cache(archivo) / ARCHIVO_FIRMA, 'w', encoding='utf-8') as file:
+        json.dump(firma, file, ensure_ascii=False, indent=2)
+    return True
+
+
+def _esquema(columnas):
+    """Arma el esquema tipado del caché a partir de los encabezados del CSV."""
+    campos = []
+    for col in columnas:
+        if col == "Inicio":
+            campos.append(pa.field(col, pa.timestamp("ns")))
+        elif col in COLUMNAS_NUMERICAS:
+            campos.append(pa.field(col, pa.int64()))
+        else:
+            campos.append(pa.field(col, pa.string()))
+    campos.append(pa.field("Dia", pa.string()))
+    return pa.schema(campos)
+
+
+def _tipar_chunk(chunk):
+    """Convierte un chunk leído como texto a sus tipos reales."""
+    if "Inicio" in chunk.columns:
+        chunk["Inicio"] = parsear_inicio(chunk["Inicio"])
+        chunk["Dia"] = chunk["Inicio"].dt.strftime("%Y-%m-%d")
+    else:
+        chunk["Dia"] = None
+    for col in chunk.columns.intersection(COLUMNAS_NUMERICAS):
+        chunk[col] = pd.to_numeric(chunk[col], errors="coerce").round().astype("Int64")
+    return chunk
+
+
+def convertir(archivo, forzar=False):
+    """Genera el caché Parquet particionado por día si no existe o quedó desactualizado."""
+    if pa is None:
+        raise ValueError("Se necesita pyarrow para generar el caché columnar.")
+
+    destino = ruta_cache(archivo)
+    if not forzar and cache_valido(archivo):
+        return destino
+
+    estado = os.stat(archivo)
+    temporal = destino.with_name(destino.name + ".tmp")
+    shutil.rmtree(temporal, ignore_errors=True)
+
+    columnas = leer_encabezados(archivo)
+    esquema = _esquema(columnas)
+    particiones = ds.partitioning(pa.schema([("Dia", pa.string())]), flavor="hive")
+
+    # Se lee todo como texto (con el lector configurado) y _tipar_chunk convierte fechas y números
+    for i, chunk in enumerate(leer_csv(archivo, chunksize=chunksize)):
+        tabla = pa.Table.from_pandas(_tipar_chunk(chunk), schema=esquema, preserve_index=False)
+        ds.write_dataset(
+            tabla,
+            temporal,
+            format="parquet",
+            partitioning=particiones,
+            basename_template=f"parte-{i}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore"
+        )
+
+    temporal.mkdir(parents=True, exist_ok=True)
+    firma = {
+        "tamanio": estado.st_size,
+        "mtime_ns": estado.st_mtime_ns,
+        "sha1": calcular_hash(archivo),
+        "columnas": columnas,
+    }
+    with open(temporal / ARCHIVO_FIRMA, 'w', encoding='utf-8') as file:
+        json.dump(firma, file, ensure_ascii=False, indent=2)
+
+    shutil.rmtree(destino, ignore_errors=True)
+    temporal.rename(destino)
+    return destino
+
+
+def _dataset(archivo):
+    """Abre el caché como dataset particionado por 'Dia'."""
+    particiones = ds.partitioning(pa.schema([("Dia", pa.string())]), flavor="hive")
+    return ds.dataset(ruta_cache(archivo), format="parquet", partitioning=particiones,
+                      exclude_invalid_files=True)
+
+
+def _filtro(dias, filtro):
+    """Combina el filtro de días con una expresión de pyarrow adicional."""
+    expresion = None if dias is None else ds.field("Dia").isin([str(dia) for dia in dias])
+    if filtro is not None:
+        expresion = filtro if expresion is None else expresion & filtro
+    return expresion
+
+
+def dias_en_cache(archivo):
+    """Lista los días presentes en el caché, sin leer datos."""
+    dias = set()
+    for carpeta in ruta_cache(archivo).glob("Dia=*"):
+        try:
+            dias.add(pd.Timestamp(carpeta.name.split("=", 1)[1]).date())
+        except ValueError:
+            continue  # Partición de filas con 'Inicio' inválido
+    return sorted(dias)
+
+
+def leer_cache(archivo, columnas=None, dias=None, filtro=None):
+    """Lee del caché solo las columnas, los días y las filas (expresión 'filtro') pedidos."""
+    if columnas is None:
+        columnas = leer_firma(archivo)["columnas"]
+    tabla = _dataset(archivo).to_table(columns=list(columnas), filter=_filtro(dias, filtro))
+    return tabla.to_pandas()
+
+
+def iterar_cache(archivo, columnas=None, chunksize=chunksize, dias=None, filtro=None):
+    """Recorre el caché en lotes de DataFrames, como un read_csv con chunksize."""
+    if columnas is None:
+        columnas = leer_firma(archivo)["columnas"]
+    for lote in _dataset(archivo).to_batches(
+        columns=list(columnas), filter=_filtro(dias, filtro), batch_size=chunksize
+    ):
+        if lote.num_rows:
+            yield lote.to_pandas()
+
+
+def main():
+    """Convierte a caché columnar los archivos indicados por línea de comandos."""
+    archivos = sys.argv[1:] or ["datos.csv"]
+    for archivo in archivos:
+        if cache_valido(archivo):
+            print(f"Caché al día para '{archivo}'.")
+            continue
+        print(f"Generando caché de '{archivo}'...")
+        destino = convertir(archivo, forzar=True)
+        print(f"Caché guardado en '{destino}' ({len(dias_en_cache(archivo))} días).")
+
+
+if __name__ == '__main__':
+    main()
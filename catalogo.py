@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from config import ARCHIVO_CATALOGO
+from lectores import leer_encabezados
+from motor import Acumulador, RangoFechas, procesar
+
+# Columnas que los scripts buscan por aproximación en los encabezados ('Inicio' in col)
+COLUMNAS_BUSCADAS = ["Inicio", "Origen Corte", "Tipificación", "Nombre Agente", "Campaña"]
+
+
+class ResumenArchivo(Acumulador):
+    """Filas, agentes y campañas de un archivo, para el catálogo."""
+
+    def __init__(self, columnas=("Nombre Agente", "Campaña")):
+        # Solo las columnas que el archivo tiene
+        self.columnas = tuple(columnas)
+        self.filas = 0
+        self.agentes = set()
+        self.campanias = set()
+
+    def procesar(self, chunk):
+        self.filas += len(chunk)
+        if "Nombre Agente" in chunk.columns:
+            self.agentes.update(chunk["Nombre Agente"].dropna().unique())
+        if "Campaña" in chunk.columns:
+            self.campanias.update(chunk["Campaña"].dropna().unique())
+
+    def combinar(self, otro):
+        self.filas += otro.filas
+        self.agentes |= otro.agentes
+        self.campanias |= otro.campanias
+
+    def resultado(self):
+        return self.filas, sorted(self.agentes), sorted(self.campanias)
+
+
+def cargar_catalogo(ruta=ARCHIVO_CATALOGO):
+    """Lee el catálogo: ruta absoluta del archivo -> entrada."""
+    if not os.path.exists(ruta):
+        return {}
+    with open(ruta, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def guardar_catalogo(catalogo, ruta=ARCHIVO_CATALOGO):
+    temporal = f"{ruta}.tmp"
+    with open(temporal, 'w', encoding='utf-8') as file:
+        json.dump(catalogo, file, ensure_ascii=False, indent=2)
+    os.replace(temporal, ruta)
+
+
+def _clave(archivo):
+    return str(Path(archivo).resolve())
+
+
+def _firma(archivo):
+    estado = os.stat(archivo)
+    return {"tamanio": estado.st_size, "mtime_ns": estado.st_mtime_ns}
+
+
+def _esquema(archivo):
+    """Encabezados, su huella y la columna real de cada una de COLUMNAS_BUSCADAS."""
+    columnas = leer_encabezados(archivo)
+    return {
+        "esquema": hashlib.sha1(";".join(columnas).encode("utf-8")).hexdigest(),
+        "columnas": columnas,
+        "mapeo": {
+            buscada: next((col for col in columnas if buscada in col), None)
+            for buscada in COLUMNAS_BUSCADAS
+        },
+    }
+
+
+def _estadisticas(archivo, mapeo):
+    """Recorre el archivo una vez (caché o índice si están al día): filas, rango de 'Inicio', agentes y campañas."""
+    resumen = ResumenArchivo([col for col in ("Nombre Agente", "Campaña") if mapeo.get(col) == col])
+    acumuladores = [resumen]
+    rango = None
+    if mapeo.get("Inicio") == "Inicio":
+        rango = RangoFechas()
+        acumuladores.append(rango)
+    procesar(archivo, acumuladores)
+    filas, agentes, campanias = resumen.resultado()
+    fecha_min, fecha_max = rango.resultado() if rango is not None else (None, None)
+    return {
+        "filas": filas,
+        "desde": None if fecha_min is None else fecha_min.isoformat(),
+        "hasta": None if fecha_max is None else fecha_max.isoformat(),
+        "agentes": agentes,
+        "campanias": campanias,
+    }
+
+
+def describir(archivo, catalogo, estadisticas=True):
+    """Entrada del archivo, actualizada en 'catalogo' si el archivo cambió (tamaño o mtime).
+
+    El esquema se lee solo del encabezado; las estadísticas, que recorren el
+    archivo, se calculan solo si se piden y no están. Devuelve (entrada, cambió).
+    """
+    clave = _clave(archivo)
+    firma = _firma(archivo)
+    entrada = catalogo.get(clave)
+    cambio = False
+    if entrada is None or entrada["tamanio"] != firma["tamanio"] or entrada["mtime_ns"] != firma["mtime_ns"]:
+        entrada = {**firma, **_esquema(archivo)}
+        cambio = True
+    if estadisticas and "filas" not in entrada:
+        entrada.update(_estadisticas(archivo, entrada["mapeo"]))
+        cambio = True
+    catalogo[clave] = entrada
+    return entrada, cambio
+
+
+def actualizar(archivos, estadisticas=True, ruta=ARCHIVO_CATALOGO):
+    """Entradas de los archivos (archivo -> entrada); solo se releen los que cambiaron."""
+    catalogo = cargar_catalogo(ruta)
+    entradas = {}
+    cambios = False
+    for archivo in archivos:
+        entradas[archivo], cambio = describir(archivo, catalogo, estadisticas)
+        cambios |= cambio
+    if cambios:
+        guardar_catalogo(catalogo, ruta)
+    return entradas
+
+
+def resolver_columnas(archivo, ruta=ARCHIVO_CATALOGO):
+    """Encabezados del archivo y columna real de cada una de COLUMNAS_BUSCADAS, sin releer si no cambió."""
+    entrada = actualizar([archivo], estadisticas=False, ruta=ruta)[archivo]
+    return entrada["columnas"], entrada["mapeo"]
+
+
+def rango_fechas(archivos, ruta=ARCHIVO_CATALOGO):
+    """Fecha mínima y máxima de 'Inicio' entre todos los archivos (None si no hay fechas)."""
+    entradas = actualizar(archivos, ruta=ruta).values()
+    desde = [pd.Timestamp(entrada["desde"]) for entrada in entradas if entrada["desde"] is not None]
+    hasta = [pd.Timestamp(entrada["hasta"]) for entrada in entradas if entrada["hasta"] is not None]
+    return (min(desde) if desde else None), (max(hasta) if hasta else None)
+
+
+def puede_coincidir(entrada, desde=None, hasta=None, agentes=None, campanias=None):
+    """Indica si el archivo puede tener filas del rango, agentes y campañas pedidos."""
+    if desde is not None or hasta is not None:
+        if entrada["desde"] is None:
+            return False
+        if desde is not None and pd.Timestamp(entrada["hasta"]) < desde:
+            return False
+        if hasta is not None and pd.Timestamp(entrada["desde"]) > hasta:
+            return False
+    if agentes and not set(agentes) & set(entrada["agentes"]):
+        return False
+    if campanias and not set(campanias) & set(entrada["campanias"]):
+        return False
+    return True
+
+
+def podar(archivos, filtro=None, campanias=None, ruta=ARCHIVO_CATALOGO):
+    """Archivos que pueden tener filas del filtro (filtros.Filtro) según el catálogo, sin abrir los demás."""
+    if filtro is None and not campanias:
+        return list(archivos)
+    desde, hasta = (filtro.rango() if filtro is not None else None) or (None, None)
+    agentes = filtro.agentes if filtro is not None else None
+    entradas = actualizar(archivos, ruta=ruta)
+    return [
+        archivo for archivo, entrada in entradas.items()
+        if puede_coincidir(entrada, desde, hasta, agentes, campanias)
+    ]
+
+
+def main():
+    """Actualiza el catálogo con los archivos indicados y muestra lo que hay en cada uno."""
+    archivos = sys.argv[1:] or ["datos.csv"]
+    entradas = actualizar(archivos)
+    for archivo, entrada in entradas.items():
+        print(f"'{archivo}': {entrada['filas']} filas, {entrada['desde']} a {entrada['hasta']}, "
+              f"{len(entrada['agentes'])} agentes, {len(entrada['campanias'])} campañas.")
+    desde, hasta = rango_fechas(archivos)
+    if desde is not None:
+        print(f"Datos desde {desde.strftime('%d/%m/%Y')} hasta {hasta.strftime('%d/%m/%Y')}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from medicion import etapa
+from motor import Acumulador, procesar
+
+# Configuración
+archivo_entrada = "datos.csv"
+archivo_resumen = "clientes_repetidos.csv"
+archivo_detalle = "clientes_repetidos_agentes.csv"
+UMBRAL_TALKING = 90     # Solo interacciones con TalkingTime mayor a este valor (segundos)
+MINIMO_CONTACTOS = 2    # Clientes contactados al menos esta cantidad de veces
+PRESUPUESTO_MB = 256    # Memoria para los parciales antes de pasarlos a disco
+PARTICIONES = 64        # Particiones en disco (por número de cliente)
+
+# Registro de cada parcial: claves codificadas como enteros y cantidad
+REGISTRO = np.dtype([("Cliente", np.int64), ("Agente", np.int32), ("Campaña", np.int32),
+                     ("Lote", np.int32), ("Cantidad", np.int64)])
+CODIGOS = ("Agente", "Campaña", "Lote")
+
+
+def codificar_clientes(clientes):
+    """Convierte los números de 'Cliente' a int64 (-1 si no tiene dígitos).
+
+    Se quitan comillas, espacios y guiones; el 0 inicial se pierde, igual que
+    al leer la columna como número en el cuaderno ("0111532141410" -> 111532141410).
+    """
+    texto = clientes.fillna("").astype(str).str.strip()
+    limpios = texto.str.isdigit()
+    if not limpios.all():
+        texto = texto.where(limpios, texto.str.replace(r"\D", "", regex=True))
+    validos = texto.str.len().between(1, 18)
+    codigos = np.full(len(texto), -1, dtype=np.int64)
+    codigos[validos.to_numpy()] = texto[validos].astype(np.int64).to_numpy()
+    return codigos
+
+
+def _codificar(valores, diccionario):
+    """Código entero de cada valor de texto según 'diccionario' (que se amplía); -1 para nulos."""
+    posiciones, unicos = pd.factorize(valores)
+    codigos = np.array([diccionario.setdefault(valor, len(diccionario)) for valor in unicos], dtype=np.int32)
+    return np.where(posiciones >= 0, codigos[posiciones] if len(codigos) else -1, -1).astype(np.int32)
+
+
+def _sumar(registros):
+    """Suma la cantidad de los registros con las mismas claves."""
+    if not len(registros):
+        return registros
+    df = pd.DataFrame(registros)
+    df = df.groupby(list(REGISTRO.names[:-1]), sort=False)["Cantidad"].sum().reset_index()
+    return df.to_records(index=False).astype(REGISTRO)
+
+
+class ClientesRepetidos(Acumulador):
+    """Clientes contactados varias veces: cantidad, agentes distintos, campañas y lotes.
+
+    Los números de cliente se codifican como int64 y agente, campaña y lote con
+    diccionarios chicos, así cada parcial ocupa 32 bytes por clave. Cuando los
+    parciales superan el presupuesto de memoria se reparten por número de cliente
+    en archivos binarios; resultado() suma cada partición por separado, así que el
+    pico de memoria queda en el presupuesto o en una partición, lo que sea mayor.
+    Las particiones quedan en disco hasta llamar a cerrar(), así resultado() se
+    puede pedir más de una vez.
+    """
+
+    columnas = ("Cliente", "Nombre Agente", "Campaña", "Lote", "TalkingTime")
+
+    def __init__(self, umbral=UMBRAL_TALKING, minimo=MINIMO_CONTACTOS, presupuesto_mb=PRESUPUESTO_MB,
+                 particiones=PARTICIONES):
+        self.umbral = umbral
+        self.minimo = minimo
+        self.presupuesto = presupuesto_mb * 1024 * 1024
+        self.particiones = particiones
+        self.diccionarios = {nombre: {} for nombre in CODIGOS}
+        self.parciales = []
+        self.bytes = 0
+        # Carpetas con particiones en disco y, para las de otros acumuladores,
+        # cómo traducir sus códigos a los de este: [(carpeta, {nombre: array})]
+        self.derrames = []
+        self.carpeta = None
+
+    def procesar(self, chunk):
+        talking = pd.to_numeric(chunk["TalkingTime"], errors="coerce")
+        chunk = chunk[(talking > self.umbral) & chunk["Nombre Agente"].notna()]
+        if chunk.empty:
+            return
+        registros = np.empty(len(chunk), dtype=REGISTRO)
+        registros["Cliente"] = codificar_clientes(chunk["Cliente"])
+        registros["Agente"] = _codificar(chunk["Nombre Agente"], self.diccionarios["Agente"])
+        registros["Campaña"] = _codificar(chunk["Campaña"], self.diccionarios["Campaña"])
+        registros["Lote"] = _codificar(chunk["Lote"], self.diccionarios["Lote"])
+        registros["Cantidad"] = 1
+        self._agregar(_sumar(registros[registros["Cliente"] >= 0]))
+
+    def _agregar(self, registros):
+        self.parciales.append(registros)
+        self.bytes += registros.nbytes
+        if self.bytes <= self.presupuesto:
+            return
+        # Primero se compactan; si siguen ocupando más de la mitad, van a disco
+        compactos = _sumar(np.concatenate(self.parciales))
+        if compactos.nbytes > self.presupuesto // 2:
+            self._derramar(compactos)
+            compactos = compactos[:0]
+        self.parciales = [compactos]
+        self.bytes = compactos.nbytes
+
+    def _derramar(self, registros):
+        """Agrega los registros a los archivos de su partición (cliente % particiones)."""
+        with etapa("derramar_clientes") as medicion:
+            medicion.entrada(len(registros))
+            if self.carpeta is None:
+                self.carpeta = tempfile.mkdtemp(prefix="clientes_")
+                self.derrames.append((self.carpeta, None))
+            particion = registros["Cliente"] % self.particiones
+            orden = np.argsort(particion, kind="stable")
+            limites = np.searchsorted(particion[orden], np.arange(self.particiones + 1))
+            for numero in range(self.particiones):
+                parte = registros[orden[limites[numero]:limites[numero + 1]]]
+                if len(parte):
+                    with open(os.path.join(self.carpeta, f"{numero}.bin"), "ab") as file:
+                        parte.tofile(file)
+
+    def combinar(self, otro):
+        # Códigos del otro acumulador -> códigos de este
+        traducciones = {}
+        for nombre in CODIGOS:
+            valores = sorted(otro.diccionarios[nombre], key=otro.diccionarios[nombre].get)
+            traducciones[nombre] = np.array(
+                [self.diccionarios[nombre].setdefault(valor, len(self.diccionarios[nombre])) for valor in valores],
+                dtype=np.int32
+            )
+        for registros in otro.parciales:
+            self._agregar(self._traducir(registros, traducciones))
+        for carpeta, previas in otro.derrames:
+            if previas is not None:
+                # Derrame que el otro ya había recibido de un tercero: se encadenan las traducciones
+                traducciones_carpeta = {nombre: traducciones[nombre][previas[nombre]] for nombre in CODIGOS}
+            else:
+                traducciones_carpeta = traducciones
+            self.derrames.append((carpeta, traducciones_carpeta))
+        otro.derrames = []
+
+    @staticmethod
+    def _traducir(registros, traducciones):
+        if traducciones is None or not len(registros):
+            return registros
+        registros = registros.copy()
+        for nombre in CODIGOS:
+            codigos = registros[nombre]
+            registros[nombre] = np.where(codigos >= 0, traducciones[nombre][np.maximum(codigos, 0)], -1)
+        return registros
+
+    def _particion(self, numero, memoria):
+        """Todos los registros de una partición, sumados por clave."""
+        partes = [memoria[memoria["Cliente"] % self.particiones == numero]]
+        for carpeta, traducciones in self.derrames:
+            ruta = os.path.join(carpeta, f"{numero}.bin")
+            if os.path.exists(ruta):
+                partes.append(self._traducir(np.fromfile(ruta, dtype=REGISTRO), traducciones))
+        return _sumar(np.concatenate(partes))
+
+    def _decodificar(self, nombre, codigos):
+        valores = np.array(sorted(self.diccionarios[nombre], key=self.diccionarios[nombre].get) + [None],
+                           dtype=object)
+        return valores[codigos]
+
+    def resultado(self):
+        """(resumen por cliente, detalle por cliente y agente) de los clientes con 'minimo' o más contactos."""
+        memoria = np.concatenate(self.parciales) if self.parciales else np.empty(0, dtype=REGISTRO)
+        resumenes, detalles = [], []
+        for numero in range(self.particiones):
+            registros = self._particion(numero, memoria)
+            if not len(registros):
+                continue
+            df = pd.DataFrame(registros)
+            contactos = df.groupby("Cliente")["Cantidad"].transform("sum")
+            df = df[contactos >= self.minimo]
+            if df.empty:
+                continue
+            for nombre in CODIGOS:
+                df[nombre] = self._decodificar(nombre, df[nombre].to_numpy())
+            resumen = df.groupby("Cliente").agg(Contactos=("Cantidad", "sum"), Agentes=("Agente", "nunique"))
+            for nombre, columna in (("Campaña", "Campañas"), ("Lote", "Lotes")):
+                distintos = df[["Cliente", nombre]].dropna().drop_duplicates().sort_values(["Cliente", nombre])
+                resumen[columna] = distintos.groupby("Cliente")[nombre].agg(", ".join)
+            resumenes.append(resumen)
+            detalles.append(df.groupby(["Cliente", "Agente"])["Cantidad"].sum())
+
+        if not resumenes:
+            return (pd.DataFrame(columns=["Cliente", "Contactos", "Agentes Distintos", "Campañas", "Lotes"]),
+                    pd.DataFrame(columns=["Cliente", "Nombre Agente", "Cantidad Interacciones"]))
+        resumen = pd.concat(resumenes).rename(columns={"Agentes": "Agentes Distintos"}).reset_index()
+        resumen = resumen.sort_values(["Contactos", "Cliente"], ascending=[False, True], ignore_index=True)
+        detalle = pd.concat(detalles).sort_index().reset_index()
+        detalle.columns = ["Cliente", "Nombre Agente", "Cantidad Interacciones"]
+        return resumen, detalle
+
+    def cerrar(self):
+        """Borra las particiones en disco (las propias y las recibidas de otros acumuladores)."""
+        for carpeta, _ in self.derrames:
+            shutil.rmtree(carpeta, ignore_errors=True)
+        self.derrames = []
+        self.carpeta = None
+
+
+def main():
+    """Clientes con TalkingTime > umbral contactados MINIMO_CONTACTOS o más veces."""
+    archivo = sys.argv[1] if len(sys.argv) > 1 else archivo_entrada
+    acumulador = ClientesRepetidos()
+
+    print(f"Procesando '{archivo}'...")
+    try:
+        procesar(archivo, [acumulador])
+        with etapa("resultado ClientesRepetidos") as medicion:
+            resumen, detalle = acumulador.resultado()
+            medicion.salida(len(resumen))
+    finally:
+        acumulador.cerrar()
+
+    resumen.to_csv(archivo_resumen, sep=';', index=False, encoding='utf-8-sig')
+    detalle.to_csv(archivo_detalle, sep=';', index=False, encoding='utf-8-sig')
+    print(f"Clientes con {MINIMO_CONTACTOS} o más contactos: {len(resumen)}")
+    print(f"Estadísticas guardadas en '{archivo_resumen}' y '{archivo_detalle}'.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# Configuración compartida por todos los reportes
+
+# Turnos: (nombre, desde, hasta) en HH:MM. Ambos extremos incluidos, con
+# precisión de minuto (14:30:59 todavía es turno mañana).
+TURNOS = [
+    ("Mañana", "09:00", "14:30"),
+    ("Tarde", "15:00", "20:00"),
+]
+
+# Nombre del turno para lo que cae fuera de los rangos anteriores
+FUERA_DE_HORARIO = "Fuera de horario"
+
+# Archivo donde se guardan las filas con "Inicio" inválido (None para no guardarlas)
+ARCHIVO_CUARENTENA = None
+
+# Carpeta del histórico incremental de agregados diarios (historico.py)
+CARPETA_HISTORICO = "historico"
+
+# Diccionario persistente de valores de las columnas categóricas (esquema.py)
+ARCHIVO_DICCIONARIO = "diccionario_categorias.json"
+
+# Catálogo de exportaciones (catalogo.py): esquema, filas, rango de fechas, agentes
+# y campañas de cada archivo, recalculados solo cuando el archivo cambia
+ARCHIVO_CATALOGO = "catalogo_exportaciones.json"
+
+# Medición por etapa (medicion.py): JSON con tiempo, filas y memoria de cada etapa
+# y volcado de cProfile. None para desactivar; las variables de entorno MEDICION
+# y PERFIL los reemplazan sin tocar este archivo.
+ARCHIVO_MEDICION = None
+ARCHIVO_PERFIL = None
+
+# Gráficos en modo lote (graficos.py): sin ventanas, en paralelo y salteando los
+# que no cambiaron. La variable de entorno GRAFICOS_EN_LOTE=1 lo activa.
+GRAFICOS_EN_LOTE = False
+
+# Lector de CSV (lectores.py): "pandas" (parser de C, un hilo), "arrow" (pyarrow
+# multihilo) o "streaming" (pyarrow por lotes). La variable de entorno LECTOR lo reemplaza.
+LECTOR = "pandas"
+
+# Descartar interacciones repetidas (mismo idInteraccion) al leer, para exportaciones
+# que se superponen (deduplicacion.py)
+DEDUPLICAR = False
+
+# Equipos: coordinadora -> agentes a cargo
+EQUIPOS = {
+    "Diana": [
+        "MZA 33", "MZA 34", "MZA 35", "MZA 15", "MZA 16", "MZA 18", "MZA 19",
+        "MZA 20", "MZA 21", "MZA 22", "MZA 31", "MZA 12", "MZA 13", "MZA 14",
+        "MZA 41", "MZA 42", "MZA 43", "MZA 48", "MZA 49", "MZA 50"
+    ],
+    "Priscila": ["MZA 7", "MZA 9", "MZA 22", "MZA 33", "MZA 39"],
+}
@@ -0,0 +1,261 @@
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from config import FUERA_DE_HORARIO
+from historico import calcular_estadisticas
+from lectores import ruta_derivada
+from motor import Acumulador, agentes_turnos, columnas_por_turno, procesar
+from turnos import NOMBRES_TURNO, clasificar_turno
+
+try:
+    import pyarrow  # noqa: F401  (solo para saber si se puede guardar en Parquet)
+except ImportError:  # Sin pyarrow el cubo se guarda como CSV
+    pyarrow = None
+
+# Configuración
+archivo_entrada = "datos.csv"
+UMBRAL_LLAMADA_LARGA = 60  # Segundos de TalkingTime (mayora_1Min.py)
+
+DIMENSIONES = ["Fecha", "MediaHora", "Turno", "Nombre Agente", "Origen Corte", "Tipificación", "Sentido"]
+MEDIDAS = ["Cantidad", "TalkingTime", "Duración", "ACW", "Llamadas Largas"]
+
+# Cada cuántos chunks se compactan los parciales (acota la memoria en archivos grandes)
+COMPACTAR_CADA = 20
+
+
+def ruta_cubo(archivo):
+    """Archivo del cubo, al lado del CSV (Parquet con pyarrow, si no CSV)."""
+    return ruta_derivada(archivo, ".cubo.parquet" if pyarrow is not None else ".cubo.csv")
+
+
+def _ruta_firma(archivo):
+    return ruta_derivada(archivo, ".cubo.json")
+
+
+def _firma(archivo):
+    estado = os.stat(archivo)
+    return {"tamanio": estado.st_size, "mtime_ns": estado.st_mtime_ns}
+
+
+class CuboMediaHora(Acumulador):
+    """Cantidad y sumas de tiempos por día, media hora, turno, agente, Origen Corte, Tipificación y Sentido."""
+
+    columnas = ("Nombre Agente", "Origen Corte", "Tipificación", "Sentido", "TalkingTime", "Duración", "ACW", "Inicio")
+    usa_fecha = True
+
+    def __init__(self, umbral=UMBRAL_LLAMADA_LARGA):
+        self.umbral = umbral
+        self.parciales = []
+
+    def procesar(self, chunk):
+        fechas = chunk["FechaHora"]
+        talking = pd.to_numeric(chunk["TalkingTime"], errors="coerce")
+        # Las filas sin fecha válida se conservan (Fecha nula) para los conteos que no usan la fecha
+        datos = pd.DataFrame({
+            "Fecha": fechas.dt.normalize(),
+            "MediaHora": (fechas.dt.hour * 2 + fechas.dt.minute // 30).fillna(-1).astype(np.int8),
+            "Turno": clasificar_turno(fechas),
+            "Nombre Agente": chunk["Nombre Agente"],
+            "Origen Corte": chunk["Origen Corte"],
+            "Tipificación": chunk["Tipificación"],
+            "Sentido": chunk["Sentido"],
+            "Cantidad": 1,
+            "TalkingTime": talking.fillna(0),
+            "Duración": pd.to_numeric(chunk["Duración"], errors="coerce").fillna(0),
+            "ACW": pd.to_numeric(chunk["ACW"], errors="coerce").fillna(0),
+            "Llamadas Largas": (talking > self.umbral).astype(np.int64),
+        })
+        self.parciales.append(datos.groupby(DIMENSIONES, dropna=False, observed=True)[MEDIDAS].sum())
+        if len(self.parciales) >= COMPACTAR_CADA:
+            self.parciales = [self._sumar()]
+
+    def _sumar(self):
+        return pd.concat(self.parciales).groupby(level=DIMENSIONES, dropna=False, observed=True).sum()
+
+    def combinar(self, otro):
+        self.parciales.extend(otro.parciales)
+
+    def resultado(self):
+        if not self.parciales:
+            return _tipar(pd.DataFrame(columns=[*DIMENSIONES, *MEDIDAS]))
+        return _tipar(self._sumar().reset_index())
+
+
+def _tipar(cubo):
+    """Tipos compactos: dimensiones de texto categóricas y medidas enteras."""
+    cubo["Fecha"] = pd.to_datetime(cubo["Fecha"])
+    cubo["MediaHora"] = cubo["MediaHora"].astype(np.int8)
+    cubo["Turno"] = pd.Categorical(cubo["Turno"], categories=NOMBRES_TURNO)
+    for col in ("Nombre Agente", "Origen Corte", "Tipificación", "Sentido"):
+        cubo[col] = cubo[col].astype("category")
+    for col in MEDIDAS:
+        cubo[col] = cubo[col].round().astype(np.int64)
+    return cubo
+
+
+def guardar_cubo(cubo, archivo):
+    """Guarda el cubo y la firma del archivo de origen."""
+    ruta = ruta_cubo(archivo)
+    if pyarrow is not None:
+        cubo.to_parquet(ruta, index=False)
+    else:
+        cubo.to_csv(ruta, sep=';', index=False, encoding='utf-8-sig')
+    with open(_ruta_firma(archivo), 'w', encoding='utf-8') as file:
+        json.dump({**_firma(archivo), "filas": len(cubo)}, file)
+    return ruta
+
+
+def cargar_cubo(archivo):
+    """Devuelve el cubo guardado si corresponde al archivo actual; si no, None."""
+    ruta, ruta_firma = ruta_cubo(archivo), _ruta_firma(archivo)
+    if not ruta.exists() or not ruta_firma.exists():
+        return None
+    with open(ruta_firma, 'r', encoding='utf-8') as file:
+        firma = json.load(file)
+    actual = _firma(archivo)
+    if firma["tamanio"] != actual["tamanio"] or firma["mtime_ns"] != actual["mtime_ns"]:
+        return None
+    if pyarrow is not None:
+        return _tipar(pd.read_parquet(ruta))
+    return _tipar(pd.read_csv(ruta, sep=';', encoding='utf-8-sig', dtype={col: str for col in DIMENSIONES[3:]}))
+
+
+def construir_cubo(archivo, forzar=False):
+    """Carga el cubo del archivo, o lo arma con una pasada por el CSV si no existe o quedó viejo."""
+    if not forzar:
+        cubo = cargar_cubo(archivo)
+        if cubo is not None:
+            return cubo
+    acumulador = CuboMediaHora()
+    procesar(archivo, [acumulador])
+    cubo = acumulador.resultado()
+    guardar_cubo(cubo, archivo)
+    return cubo
+
+
+def consultar(cubo, por=(), filtros=None, desde=None, hasta=None, medidas=MEDIDAS):
+    """Filtra el cubo y suma las medidas agrupando por las dimensiones 'por'.
+
+    'filtros' es {dimensión: valor o lista de valores}, p. ej. {"Origen Corte": "Agente",
+    "Turno": ["Mañana"]}; 'desde'/'hasta' limitan la Fecha (ambos incluidos). Sin 'por'
+    devuelve los totales en una Serie.
+    """
+    mascara = np.ones(len(cubo), dtype=bool)
+    for dimension, valores in (filtros or {}).items():
+        valores = valores if isinstance(valores, (list, tuple, set)) else [valores]
+        mascara &= cubo[dimension].isin(valores).to_numpy()
+    if desde is not None:
+        mascara &= (cubo["Fecha"] >= pd.Timestamp(desde)).to_numpy()
+    if hasta is not None:
+        mascara &= (cubo["Fecha"] <= pd.Timestamp(hasta)).to_numpy()
+
+    seleccion = cubo.loc[mascara, [*por, *medidas]]
+    if not por:
+        return seleccion[list(medidas)].sum()
+    return seleccion.groupby(list(por), observed=True, dropna=False)[list(medidas)].sum().reset_index()
+
+
+def _solo_agentes(cubo):
+    """Filas atendidas por un agente (Nombre Agente no nulo)."""
+    return cubo[cubo["Nombre Agente"].notna()]
+
+
+def cortes_por_agente(cubo):
+    """Mismo resultado que CortesPorAgente (origenXagente.py), ordenado por agente."""
+    conteo = consultar(_solo_agentes(cubo), ["Nombre Agente"], {"Origen Corte": "Agente"}, medidas=["Cantidad"])
+    conteo = conteo.rename(columns={"Cantidad": "Cantidad de Cortes"})
+    conteo["Nombre Agente"] = conteo["Nombre Agente"].astype(str)
+    total = pd.DataFrame({"Nombre Agente": ["Total"], "Cantidad de Cortes": [conteo["Cantidad de Cortes"].sum()]})
+    return pd.concat([conteo, total], ignore_index=True)
+
+
+def cortes_por_agente_diarios(cubo):
+    """Mismo resultado que CortesPorAgenteDiarios (origenXagenteDiaria.py)."""
+    cubo = _solo_agentes(cubo)
+    conteo = consultar(cubo[cubo["Fecha"].notna()], ["Nombre Agente", "Fecha"], {"Origen Corte": "Agente"},
+                       medidas=["Cantidad"])
+    conteo["Fecha"] = conteo["Fecha"].dt.strftime("%d/%m")
+    conteo = conteo.groupby(["Nombre Agente", "Fecha"], observed=True)["Cantidad"].sum()
+    return conteo.reset_index(name="Cantidad de Cortes")
+
+
+def _por_turno(cubo, medida, nombre):
+    """Tabla agente x turno como la de _ConteoPorTurno: solo agentes con algún valor en Mañana o Tarde."""
+    turnos = [turno for turno in NOMBRES_TURNO if turno != FUERA_DE_HORARIO]
+    conteo = consultar(_solo_agentes(cubo), ["Nombre Agente", "Turno"], {"Turno": turnos}, medidas=[medida])
+    # El cubo tiene a todos los agentes; el acumulador solo ve las filas que pasan el filtro
+    conteo = conteo[conteo[medida] > 0]
+    renombrar = {turno: f"{nombre} {turno}" for turno in turnos}
+    if conteo.empty:
+        return pd.DataFrame(columns=columnas_por_turno(renombrar))
+    tabla = (
+        conteo.pivot_table(index="Nombre Agente", columns="Turno", values=medida, aggfunc="sum",
+                           fill_value=0, observed=True)
+        .reset_index()
+    )
+    tabla.columns.name = None
+    tabla["Nombre Agente"] = tabla["Nombre Agente"].astype(str)
+    return tabla.rename(columns=renombrar).reindex(columns=columnas_por_turno(renombrar), fill_value=0)
+
+
+def cortes_por_agente_turno(cubo, agentes=None):
+    """Mismo resultado que CortesPorAgenteTurno (origenXagenteDiana.py)."""
+    cubo = cubo[cubo["Origen Corte"] == "Agente"]
+    if agentes is not None:
+        cubo = cubo[cubo["Nombre Agente"].isin(agentes)]
+    return _por_turno(cubo, "Cantidad", "Cortes Turno")
+
+
+def llamadas_largas_por_turno(cubo):
+    """Mismo resultado que LlamadasLargasPorTurno (mayora_1Min.py), con el umbral con que se armó el cubo."""
+    return _por_turno(cubo, "Llamadas Largas", "Llamadas Largas")
+
+
+def estadisticas_horario(cubo, tipificacion=None, desde=None, hasta=None):
+    """Estadísticas mensual y diaria de origenCorte.py (o Agendado.py con 'tipificacion')."""
+    diario = consultar(cubo[cubo["Fecha"].notna()], ["Fecha", "Turno", "Origen Corte", "Tipificación"],
+                       desde=desde, hasta=hasta, medidas=["Cantidad"])
+    diario["Fecha"] = diario["Fecha"].dt.strftime("%Y-%m-%d")
+    diario["Turno"] = diario["Turno"].astype(str)
+    for col in ("Origen Corte", "Tipificación"):
+        diario[col] = diario[col].astype(object)
+    return calcular_estadisticas(diario, tipificacion)
+
+
+def main():
+    """Arma (o carga) el cubo y genera desde él los reportes de origenXagente*, mayora_1Min, origenCorte y Agendado."""
+    archivo = sys.argv[1] if len(sys.argv) > 1 else archivo_entrada
+    inicio = time.perf_counter()
+    cubo = construir_cubo(archivo)
+    print(f"Cubo de '{archivo}': {len(cubo)} filas, {cubo.memory_usage(deep=True).sum() / 1024 ** 2:.1f} MB "
+          f"({time.perf_counter() - inicio:.2f} s)")
+
+    # origenCorte.py y Agendado.py solo cuentan diciembre
+    diciembre = cubo[cubo["Fecha"].dt.month == 12]
+
+    reportes = {
+        "estadisticas_agentes.csv": lambda: cortes_por_agente(cubo),
+        "estadisticas_agentes_por_dia.csv": lambda: cortes_por_agente_diarios(cubo),
+        "estadisticas_agentes_turnos.csv": lambda: cortes_por_agente_turno(cubo, agentes_turnos),
+        "estadisticas_llamadas_largas_turnos.csv": lambda: llamadas_largas_por_turno(cubo),
+        "estadistica_mensual.csv": lambda: estadisticas_horario(diciembre)[0],
+        "estadistica_diaria.csv": lambda: estadisticas_horario(diciembre)[1],
+        "estadistica_mensual_agendado.csv": lambda: estadisticas_horario(diciembre, "Agendado por el Vdor")[0],
+        "estadistica_diaria_agendado.csv": lambda: estadisticas_horario(diciembre, "Agendado por el Vdor")[1],
+    }
+    for archivo_salida, reporte in reportes.items():
+        inicio = time.perf_counter()
+        resultado = reporte()
+        milisegundos = (time.perf_counter() - inicio) * 1000
+        codificacion = 'utf-8-sig' if archivo_salida.startswith("estadistica_") else 'utf-8'
+        resultado.to_csv(archivo_salida, sep=';', index=False, encoding=codificacion)
+        print(f"'{archivo_salida}' generado desde el cubo en {milisegundos:.0f} ms.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+import math
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Configuración
+CAPACIDAD = 50_000_000     # idInteraccion esperados; con más, el filtro de Bloom da más falsos positivos
+ERROR_BLOOM = 0.01         # Falsos positivos del filtro de Bloom con CAPACIDAD ids
+LIMITE_MEMORIA = 5_000_000  # ids en memoria antes de pasarlos a una corrida ordenada en disco
+MAXIMO_CORRIDAS = 16       # Corridas en memoria antes de unirlas en una sola
+
+
+class ConjuntoIds:
+    """Conjunto de idInteraccion ya vistos: filtro de Bloom y confirmación exacta.
+
+    El filtro de Bloom (CAPACIDAD * 9,6 bits con 1 % de error) descarta sin más
+    búsqueda los ids nuevos. Los que pasan el filtro se confirman contra los ids
+    guardados: corridas ordenadas de bytes, en memoria y, pasado LIMITE_MEMORIA,
+    en archivos .npy que se leen mapeados y se buscan por bisección. Así el
+    resultado es exacto y la memoria no crece con los cientos de millones de ids.
+    """
+
+    def __init__(self, capacidad=CAPACIDAD, error=ERROR_BLOOM, limite_memoria=LIMITE_MEMORIA):
+        self.bits = max(64, math.ceil(-capacidad * math.log(error) / math.log(2) ** 2))
+        self.funciones = max(1, round(self.bits / capacidad * math.log(2)))
+        self.bloom = np.zeros((self.bits + 7) // 8, dtype=np.uint8)
+        self.limite_memoria = limite_memoria
+        self.memoria = []   # Corridas ordenadas en memoria
+        self.en_memoria = 0
+        self.disco = []     # Corridas ordenadas en disco (np.memmap)
+        self.carpeta = None
+        self.vistos = 0
+        self.duplicados = 0
+        self.falsos_positivos = 0
+
+    def _posiciones(self, texto):
+        """Bits de cada id en el filtro (doble hash a partir de un hash de 64 bits): matriz n x funciones."""
+        hashes = pd.util.hash_array(texto.to_numpy(dtype=object), categorize=False)
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        pasos = np.arange(self.funciones, dtype=np.uint64)
+        return (h1[:, None] + pasos[None, :] * h2[:, None]) % np.uint64(self.bits)
+
+    def _en_bloom(self, posiciones):
+        bytes_ = self.bloom[(posiciones >> np.uint64(3)).astype(np.int64)]
+        return ((bytes_ >> (posiciones & np.uint64(7)).astype(np.uint8)) & 1).astype(bool).all(axis=1)
+
+    def _marcar(self, posiciones):
+        posiciones = posiciones.ravel()
+        np.bitwise_or.at(self.bloom, (posiciones >> np.uint64(3)).astype(np.int64),
+                         (np.uint8(1) << (posiciones & np.uint64(7)).astype(np.uint8)))
+
+    @staticmethod
+    def _en_corrida(corrida, claves):
+        """Indica qué claves están en una corrida ordenada."""
+        encontradas = np.zeros(len(claves), dtype=bool)
+        # Una clave más larga que el ancho de la corrida no puede estar en ella (y al convertirla se truncaría)
+        caben = np.char.str_len(claves) <= corrida.dtype.itemsize
+        if not caben.any() or not len(corrida):
+            return encontradas
+        buscadas = claves[caben].astype(corrida.dtype)
+        posiciones = np.minimum(np.searchsorted(corrida, buscadas), len(corrida) - 1)
+        encontradas[caben] = corrida[posiciones] == buscadas
+        return encontradas
+
+    def _guardar(self, claves):
+        self.memoria.append(np.sort(claves))
+        self.en_memoria += len(claves)
+        if len(self.memoria) > MAXIMO_CORRIDAS:
+            self.memoria = [np.sort(np.concatenate(self.memoria))]
+        if self.en_memoria < self.limite_memoria:
+            return
+        if self.carpeta is None:
+            self.carpeta = tempfile.mkdtemp(prefix="idinteraccion_")
+        ruta = os.path.join(self.carpeta, f"corrida_{len(self.disco):04d}.npy")
+        np.save(ruta, np.sort(np.concatenate(self.memoria)))
+        self.disco.append(np.load(ruta, mmap_mode="r"))
+        self.memoria = []
+        self.en_memoria = 0
+
+    def nuevos(self, ids):
+        """Marca como vistos los ids y devuelve la máscara de las filas que no se habían visto.
+
+        Las filas sin idInteraccion se conservan siempre.
+        """
+        ids = pd.Series(ids)
+        validos = ids.notna().to_numpy()
+        nuevos = np.ones(len(ids), dtype=bool)
+        if not validos.any():
+            return nuevos
+
+        texto = ids[validos].astype(str)
+        claves = np.array(texto.str.encode("utf-8").tolist(), dtype="S")
+        repetidos = texto.duplicated().to_numpy().copy()
+        posiciones = self._posiciones(texto)
+        candidatos = self._en_bloom(posiciones) & ~repetidos
+        if candidatos.any():
+            confirmados = np.zeros(candidatos.sum(), dtype=bool)
+            for corrida in (*self.memoria, *self.disco):
+                confirmados |= self._en_corrida(corrida, claves[candidatos])
+            self.falsos_positivos += int((~confirmados).sum())
+            repetidos[np.flatnonzero(candidatos)[confirmados]] = True
+
+        if (~repetidos).any():
+            self._marcar(posiciones[~repetidos])
+            self._guardar(claves[~repetidos])
+        self.vistos += len(claves)
+        self.duplicados += int(repetidos.sum())
+        nuevos[validos] = ~repetidos
+        return nuevos
+
+    def cerrar(self):
+        """Borra las corridas en disco."""
+        self.disco = []
+        if self.carpeta is not None:
+            shutil.rmtree(self.carpeta, ignore_errors=True)
+            self.carpeta = None
+
+
+def informar_duplicados(ids):
+    """Muestra cuántas interacciones repetidas se descartaron."""
+    if ids.duplicados:
+        print(f"Interacciones duplicadas descartadas (idInteraccion): {ids.duplicados} de {ids.vistos}")
+
+
+def descartar_duplicados(df, columna="idInteraccion"):
+    """Quita de un DataFrame ya cargado las filas con idInteraccion repetido e informa cuántas eran."""
+    ids = ConjuntoIds(capacidad=max(len(df), 1))
+    try:
+        df = df[ids.nuevos(df[columna])]
+    finally:
+        ids.cerrar()
+    informar_duplicados(ids)
+    return df
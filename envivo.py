@@ -0,0 +1,186 @@
+import argparse
+import io
+import os
+import time
+
+import pandas as pd
+
+from config import DEDUPLICAR, EQUIPOS
+from deduplicacion import ConjuntoIds, informar_duplicados
+from lectores import leer_todo
+from motor import TURNOS_VACIOS, CortesPorAgenteTurno, LlamadasLargasPorTurno, agentes_turnos
+from parseo_fechas import parsear_inicio
+
+# Configuración
+archivo_entrada = "datos.csv"
+archivo_salida = "envivo_turnos.csv"
+REFRESCO = 30            # Segundos entre resúmenes
+SONDEO = 1.0             # Segundos entre lecturas del archivo
+BLOQUE = 32 * 1024 * 1024  # Bytes leídos por vez (al arrancar con el archivo ya grande)
+UMBRAL_LLAMADA_LARGA = 60
+CAPACIDAD_IDS = 5_000_000  # idInteraccion esperados en el export de un día (filtro de Bloom de 6 MB)
+
+BOM = b'\xef\xbb\xbf'
+
+
+class ArchivoReemplazado(Exception):
+    """El archivo seguido se reemplazó por otro: hay que descartar los contadores."""
+
+
+class Seguidor:
+    """Sigue un CSV que se sigue escribiendo y devuelve solo las filas completas nuevas.
+
+    Guarda la posición en bytes de lo ya leído y la última línea incompleta,
+    que se completa en la lectura siguiente. Si el archivo se achica (se
+    reemplazó por el export de otro día) vuelve a empezar desde el principio.
+    """
+
+    def __init__(self, archivo, columnas):
+        self.archivo = archivo
+        self.columnas = list(columnas)
+        self.encabezado = None
+        self.posicion = 0
+        self.resto = b''
+
+    def reiniciar(self):
+        self.encabezado = None
+        self.posicion = 0
+        self.resto = b''
+
+    def _leer_bytes(self):
+        if not os.path.exists(self.archivo):
+            return b''
+        if os.path.getsize(self.archivo) < self.posicion:
+            print(f"'{self.archivo}' se achicó: se vuelve a leer desde el principio.")
+            self.reiniciar()
+            raise ArchivoReemplazado
+        with open(self.archivo, 'rb') as file:
+            file.seek(self.posicion)
+            datos = file.read(BLOQUE)
+        self.posicion += len(datos)
+        return datos
+
+    def nuevas(self):
+        """Filas completas escritas desde la última llamada (None si no hay)."""
+        datos = self.resto + self._leer_bytes()
+        fin = datos.rfind(b'\n')
+        if fin < 0:
+            self.resto = datos
+            return None
+        completas, self.resto = datos[:fin + 1], datos[fin + 1:]
+
+        if self.encabezado is None:
+            primera = completas.find(b'\n')
+            self.encabezado = completas[:primera + 1].removeprefix(BOM)
+            completas = completas[primera + 1:]
+            if not completas:
+                return None
+
+        return leer_todo(io.BytesIO(self.encabezado + completas), self.columnas)
+
+
+def crear_contadores(agentes):
+    return CortesPorAgenteTurno(agentes), LlamadasLargasPorTurno(umbral=UMBRAL_LLAMADA_LARGA)
+
+
+def crear_ids():
+    """idInteraccion vistos desde que se empezó a seguir el archivo (None sin config.DEDUPLICAR)."""
+    return ConjuntoIds(capacidad=CAPACIDAD_IDS) if DEDUPLICAR else None
+
+
+def procesar_bloque(chunk, contadores, ids=None):
+    """Suma un bloque de filas nuevas a los contadores y devuelve cuántas se contaron.
+
+    Con 'ids' se descartan las interacciones ya vistas en este bloque o en los
+    anteriores (el export en vivo puede reescribir filas); queda la primera.
+    """
+    if ids is not None:
+        chunk = chunk[ids.nuevos(chunk["idInteraccion"])]
+    chunk["FechaHora"] = parsear_inicio(chunk["Inicio"])
+    for contador in contadores:
+        contador.procesar(chunk)
+    return len(chunk)
+
+
+def resumen(cortes, llamadas):
+    """Cortes y llamadas largas por agente y turno, en una sola tabla."""
+    # Madrugada y Noche (siempre en 0) solo están por compatibilidad con los CSV por turno
+    tabla = pd.merge(cortes.resultado().drop(columns=list(TURNOS_VACIOS)),
+                     llamadas.resultado().drop(columns=list(TURNOS_VACIOS)), on="Nombre Agente", how="outer")
+    columnas = tabla.columns.drop("Nombre Agente")
+    tabla[columnas] = tabla[columnas].fillna(0).astype(int)
+    return tabla.sort_values("Nombre Agente", ignore_index=True)
+
+
+def guardar_resumen(tabla, archivo):
+    """Escribe el resumen de forma atómica (quien lo lee nunca ve un archivo a medio escribir)."""
+    temporal = f"{archivo}.tmp"
+    tabla.to_csv(temporal, sep=';', index=False, encoding='utf-8-sig')
+    os.replace(temporal, archivo)
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        description="Sigue el export del día mientras se escribe y actualiza los contadores por turno."
+    )
+    parser.add_argument("--archivo", default=archivo_entrada, help="Export que se está escribiendo (CSV ';').")
+    parser.add_argument("--salida", default=archivo_salida, help="Resumen que se reescribe en cada refresco.")
+    parser.add_argument("--cada", type=float, default=REFRESCO, help="Segundos entre resúmenes.")
+    parser.add_argument("--equipo", choices=sorted(EQUIPOS),
+                        help="Equipo de config.EQUIPOS para los cortes por turno (por defecto el de Diana).")
+    parser.add_argument("--una-vez", action="store_true", help="Procesar lo que ya está escrito y terminar.")
+    return parser
+
+
+def main():
+    """Modo en vivo: cortes por agente y turno y llamadas largas mientras el turno está en curso."""
+    args = crear_parser().parse_args()
+    agentes = EQUIPOS[args.equipo] if args.equipo else agentes_turnos
+    cortes, llamadas = crear_contadores(agentes)
+    ids = crear_ids()
+    columnas = set(cortes.columnas) | set(llamadas.columnas)
+    if ids is not None:
+        columnas.add("idInteraccion")
+    seguidor = Seguidor(args.archivo, sorted(columnas))
+
+    print(f"Siguiendo '{args.archivo}' (resumen cada {args.cada:g} s en '{args.salida}'; Ctrl+C para salir)...")
+    ultimo_resumen = 0.0
+    filas = 0
+    try:
+        while True:
+            try:
+                chunk = seguidor.nuevas()
+            except ArchivoReemplazado:
+                cortes, llamadas = crear_contadores(agentes)
+                if ids is not None:
+                    ids.cerrar()
+                    ids = crear_ids()
+                filas = 0
+                continue
+            if chunk is not None and not chunk.empty:
+                filas += procesar_bloque(chunk, (cortes, llamadas), ids)
+
+            pendiente = os.path.exists(args.archivo) and seguidor.posicion < os.path.getsize(args.archivo)
+            if args.una_vez and not pendiente:
+                break
+            ahora = time.monotonic()
+            if ahora - ultimo_resumen >= args.cada:
+                guardar_resumen(resumen(cortes, llamadas), args.salida)
+                ultimo_resumen = ahora
+                print(f"{time.strftime('%H:%M:%S')} - {filas} interacciones leídas")
+            if not pendiente:
+                time.sleep(SONDEO)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if ids is not None:
+            ids.cerrar()
+
+    guardar_resumen(resumen(cortes, llamadas), args.salida)
+    print(f"Resumen guardado en '{args.salida}' ({filas} interacciones).")
+    if ids is not None:
+        informar_duplicados(ids)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+import argparse
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from config import EQUIPOS
+from estadisticaBreaks import calcular_totales
+from graficos import Grafico, barras_agrupadas, renderizar
+from medicion import etapa
+from motor import Acumulador, procesar
+
+# Configuración
+archivo_entrada = "datos.csv"
+archivo_acumuladores = "Acumuladores de Agentes (2).csv"
+carpeta_salida = "Estadisticas Coordinadoras"
+UMBRAL_LLAMADA_LARGA = 90  # Segundos de TalkingTime (minuto y medio, como en Estadistica_TalkingTime.ipynb)
+
+COLUMNAS = ["Total Llamadas", "Llamadas Largas", "Máximo TalkingTime (s)", "Cantidad de Cortes"]
+
+
+class MetricasPorAgente(Acumulador):
+    """Llamadas, llamadas largas, máximo TalkingTime y cortes por agente, en un solo groupby por chunk.
+
+    Se calculan para todos los agentes de todos los equipos juntos: agregar una
+    coordinadora no agrega pasadas sobre los datos, solo filas al resultado.
+    """
+
+    columnas = ("Nombre Agente", "TalkingTime", "Origen Corte")
+
+    def __init__(self, agentes, umbral=UMBRAL_LLAMADA_LARGA):
+        self.agentes = set(agentes)
+        self.umbral = umbral
+        self.parciales = []
+
+    def procesar(self, chunk):
+        chunk = chunk[chunk["Nombre Agente"].isin(self.agentes)]
+        talking = pd.to_numeric(chunk["TalkingTime"], errors="coerce")
+        metricas = pd.DataFrame({
+            "Total Llamadas": 1,
+            "Llamadas Largas": talking > self.umbral,
+            "Máximo TalkingTime (s)": talking,
+            "Cantidad de Cortes": chunk["Origen Corte"] == "Agente",
+        })
+        self.parciales.append(metricas.groupby(chunk["Nombre Agente"]).agg({
+            "Total Llamadas": "sum",
+            "Llamadas Largas": "sum",
+            "Máximo TalkingTime (s)": "max",
+            "Cantidad de Cortes": "sum",
+        }))
+
+    def combinar(self, otro):
+        self.parciales.extend(otro.parciales)
+
+    def resultado(self):
+        """Una fila por agente (índice "Nombre Agente"); los agentes sin llamadas quedan en cero."""
+        if self.parciales:
+            metricas = pd.concat(self.parciales).groupby(level="Nombre Agente").agg({
+                "Total Llamadas": "sum",
+                "Llamadas Largas": "sum",
+                "Máximo TalkingTime (s)": "max",
+                "Cantidad de Cortes": "sum",
+            })
+        else:
+            metricas = pd.DataFrame(columns=COLUMNAS)
+        metricas = metricas.reindex(sorted(self.agentes)).fillna(0)
+        metricas.index.name = "Nombre Agente"
+        return metricas.astype(int)
+
+
+def minutos_de_break_por_agente(archivo):
+    """Minutos de Break de cada agente en todo el período (una sola pasada por los acumuladores)."""
+    totales = calcular_totales(archivo)
+    if "Break" not in totales.columns:
+        raise ValueError(f"El archivo '{archivo}' no tiene la columna 'Break'.")
+    return (totales["Break"].groupby(level="Agente").sum() // 60).astype(int).rename("Minutos de Break")
+
+
+def tabla_equipo(metricas, agentes, breaks=None):
+    """Métricas de los agentes de un equipo, en el orden de config.EQUIPOS."""
+    tabla = metricas.reindex(agentes).reset_index()
+    if breaks is not None:
+        tabla["Minutos de Break"] = tabla["Nombre Agente"].map(breaks).fillna(0).astype(int)
+    return tabla
+
+
+def rutas_equipo(coordinadora, carpeta=carpeta_salida):
+    """CSV y gráfico del equipo, en la carpeta de la coordinadora."""
+    carpeta = Path(carpeta) / f"Coor_{coordinadora}"
+    return carpeta / f"estadisticas_equipo_{coordinadora}.csv", carpeta / f"estadisticas_equipo_{coordinadora}.png"
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        description="Reportes de todos los equipos de coordinadoras (config.EQUIPOS) en una sola pasada."
+    )
+    parser.add_argument("--archivo", default=archivo_entrada, help="Exportación de interacciones (CSV ';').")
+    parser.add_argument("--acumuladores", default=archivo_acumuladores,
+                        help="Export de Acumuladores de Agentes para los minutos de Break (se omite si no existe).")
+    parser.add_argument("--equipos", nargs="+", choices=sorted(EQUIPOS), default=sorted(EQUIPOS),
+                        help="Equipos a generar (por defecto: todos).")
+    parser.add_argument("--umbral", type=int, default=UMBRAL_LLAMADA_LARGA,
+                        help="Segundos de TalkingTime a partir de los cuales una llamada es larga.")
+    parser.add_argument("--carpeta", default=carpeta_salida,
+                        help="Carpeta con una subcarpeta Coor_<nombre> por equipo.")
+    return parser
+
+
+def main():
+    """Métricas por agente de cada equipo, con su CSV y su gráfico."""
+    args = crear_parser().parse_args()
+    equipos = {coordinadora: EQUIPOS[coordinadora] for coordinadora in args.equipos}
+    agentes = {agente for integrantes in equipos.values() for agente in integrantes}
+
+    print(f"Procesando '{args.archivo}' para {len(equipos)} equipos ({len(agentes)} agentes)...")
+    acumulador = MetricasPorAgente(agentes, umbral=args.umbral)
+    procesar(args.archivo, [acumulador])
+    metricas = acumulador.resultado()
+
+    breaks = None
+    if os.path.exists(args.acumuladores):
+        print(f"Sumando minutos de Break de '{args.acumuladores}'...")
+        breaks = minutos_de_break_por_agente(args.acumuladores)
+    else:
+        print(f"No se encontró '{args.acumuladores}': los reportes van sin minutos de Break.")
+
+    largas = f"Llamadas > {args.umbral}s"
+    graficos = []
+    with etapa("guardar_estadisticas"):
+        for coordinadora, integrantes in equipos.items():
+            tabla = tabla_equipo(metricas, integrantes, breaks).rename(columns={"Llamadas Largas": largas})
+            archivo_csv, archivo_grafico = rutas_equipo(coordinadora, args.carpeta)
+            archivo_csv.parent.mkdir(parents=True, exist_ok=True)
+            tabla.to_csv(archivo_csv, sep=';', index=False, encoding='utf-8-sig')
+            print(f"Estadísticas del equipo de {coordinadora} guardadas en '{archivo_csv}'.")
+            graficos.append(Grafico(
+                barras_agrupadas, tabla[["Nombre Agente", "Total Llamadas", largas]], archivo_grafico,
+                mostrar=False, x="Nombre Agente", y=["Total Llamadas", largas],
+                titulo=f"Distribución del Tiempo Hablado por Agente del equipo de {coordinadora}",
+                xlabel="Agentes", ylabel="Cantidad de llamadas", colores=["blue", "red"]
+            ))
+
+    with etapa("generar_graficos"):
+        renderizar(graficos)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from cache import cache_valido, iterar_cache
+from config import ARCHIVO_DICCIONARIO
+from lectores import leer_csv
+from parseo_fechas import parsear_inicio
+
+# Configuración
+chunksize = 100000
+
+# Columnas de pocos valores distintos: se cargan como categóricas
+COLUMNAS_CATEGORICAS = [
+    "Empresa", "Campaña", "Lote", "Tipo Contacto", "Sentido", "Nombre Agente",
+    "LoginId", "Tipificación", "Tipos Tipificación", "Origen Corte",
+    "Causa Terminación", "CausaQ850"
+]
+
+# Columnas de tiempos en segundos (llegan como texto, p. ej. "0")
+COLUMNAS_TIEMPO = [
+    "Duración", "Tiempo Tarifado", "Preview", "Dialing", "Ringing",
+    "TalkingTime", "Hold", "ACW", "EnCola"
+]
+# Más de UInt32 (unos 136 años) no es un tiempo válido; hasta 65535 s (18 h) alcanza con UInt16
+MAX_SEGUNDOS = np.iinfo(np.uint32).max
+
+
+def leer_diccionario(archivo=ARCHIVO_DICCIONARIO):
+    """Lee el diccionario columna -> lista de valores conocidos (la posición es el código)."""
+    if not os.path.exists(archivo):
+        return {}
+    with open(archivo, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def guardar_diccionario(diccionario, archivo=ARCHIVO_DICCIONARIO):
+    temporal = f"{archivo}.tmp"
+    with open(temporal, 'w', encoding='utf-8') as file:
+        json.dump(diccionario, file, ensure_ascii=False, indent=2)
+    os.replace(temporal, archivo)
+
+
+def _memoria_mb(df):
+    return df.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+def tipar_interacciones(chunk, diccionario, invalidos=None):
+    """Convierte un chunk a categóricas (con códigos del diccionario) y enteros chicos.
+
+    Los valores nuevos se agregan al final del diccionario, así los códigos ya
+    asignados no cambian entre archivos ni entre meses. Los tiempos quedan como
+    UInt16 si el máximo del chunk entra, si no UInt32 (al concatenar, pandas
+    lleva todo al mayor). Los vacíos, ilegibles, negativos o mayores que
+    MAX_SEGUNDOS quedan como NA, no como 0, para no bajar promedios; si se pasa
+    'invalidos' se cuentan ahí por columna.
+    """
+    for col in chunk.columns.intersection(COLUMNAS_CATEGORICAS):
+        conocidos = diccionario.setdefault(col, [])
+        nuevos = pd.Index(chunk[col].dropna().unique()).difference(conocidos)
+        conocidos.extend(str(valor) for valor in nuevos)
+        chunk[col] = pd.Categorical(chunk[col], categories=conocidos)
+
+    for col in chunk.columns.intersection(COLUMNAS_TIEMPO):
+        segundos = pd.to_numeric(chunk[col], errors="coerce")
+        segundos = segundos.round().where((segundos >= 0) & (segundos <= MAX_SEGUNDOS))
+        if invalidos is not None:
+            invalidos[col] = invalidos.get(col, 0) + int(segundos.isna().sum())
+        chunk[col] = segundos.astype("UInt16" if not segundos.max() > np.iinfo(np.uint16).max else "UInt32")
+
+    return chunk
+
+
+def informar_tiempos_invalidos(invalidos):
+    """Muestra cuántos tiempos quedaron como NA en cada columna (sin volcar las filas)."""
+    invalidos = {col: cantidad for col, cantidad in invalidos.items() if cantidad}
+    if invalidos:
+        detalle = ", ".join(f"{col}: {cantidad}" for col, cantidad in invalidos.items())
+        print(f"Tiempos vacíos o inválidos (quedan como NA): {detalle}")
+
+
+def tipar_con_diccionario(df, archivo_diccionario=ARCHIVO_DICCIONARIO):
+    """Tipa un DataFrame ya cargado con el diccionario persistente y guarda los valores nuevos."""
+    diccionario = leer_diccionario(archivo_diccionario)
+    invalidos = {}
+    df = tipar_interacciones(df, diccionario, invalidos)
+    guardar_diccionario(diccionario, archivo_diccionario)
+    informar_tiempos_invalidos(invalidos)
+    return df
+
+
+def cargar_interacciones(archivo, columnas=None, chunksize=chunksize, archivo_diccionario=ARCHIVO_DICCIONARIO):
+    """Carga la exportación de interacciones con tipos compactos e informa la memoria usada."""
+    diccionario = leer_diccionario(archivo_diccionario)
+    memoria_texto = 0.0
+    partes = []
+    invalidos = {}
+
+    if cache_valido(archivo):
+        chunks = iterar_cache(archivo, columnas, chunksize)
+    else:
+        chunks = leer_csv(archivo, columnas, chunksize)
+
+    for chunk in chunks:
+        memoria_texto += _memoria_mb(chunk)
+        if "Inicio" in chunk.columns and not pd.api.types.is_datetime64_any_dtype(chunk["Inicio"]):
+            chunk["Inicio"] = parsear_inicio(chunk["Inicio"])
+        partes.append(tipar_interacciones(chunk, diccionario, invalidos))
+
+    guardar_diccionario(diccionario, archivo_diccionario)
+    informar_tiempos_invalidos(invalidos)
+    if not partes:
+        return pd.DataFrame(columns=columnas)
+
+    # Todas las partes con las mismas categorías para que concat no vuelva a texto
+    for parte in partes:
+        for col in parte.columns.intersection(COLUMNAS_CATEGORICAS):
+            parte[col] = parte[col].cat.set_categories(diccionario[col])
+    df = pd.concat(partes, ignore_index=True)
+
+    print(f"Memoria de '{archivo}': {memoria_texto:.1f} MB como texto -> {_memoria_mb(df):.1f} MB tipado.")
+    return df
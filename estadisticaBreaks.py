@@ -0,0 +1,150 @@
+"""Estadísticas de Break por agente, fecha y turno del export "Acumuladores de Agentes".
+
+Estadisticas.csv y los gráficos mantienen el formato del cuaderno
+(Estadisticas Febrero/Estadistica.ipynb): Mañana son los intervalos que empiezan
+de 9:00 a 13:59 y todos los demás (14:00, 14:30, la tarde, antes de las 9:00 y
+desde las 20:30) cuentan como Tarde; los minutos quedan truncados (como float,
+28.0, si a algún agente le falta un turno) y "Sin datos" marca solo al agente sin
+intervalos en ese turno (un Break de 0 minutos se escribe 0.0). El detalle de todos los estados
+(estadisticas_auxiliares_turnos.csv) usa los turnos de config.TURNOS, con lo que
+queda fuera de horario entre turnos y en los extremos.
+"""
+import numpy as np
+import pandas as pd
+
+from acumuladores import columnas_disponibles, leer_acumuladores
+from config import ARCHIVO_CUARENTENA
+from graficos import Grafico, barras, mostrar, renderizar
+from medicion import iterar, medida
+from parseo_fechas import informar_invalidos, parsear_inicio
+from turnos import clasificar_turno
+
+# Configuración
+archivo_entrada = "Acumuladores de Agentes (2).csv"
+archivo_salida = "Estadisticas.csv"
+archivo_totales = "estadisticas_auxiliares_turnos.csv"
+
+# Estados auxiliares de "Acumuladores de Agentes" (segundos por intervalo de 30 minutos)
+ESTADOS_AUXILIARES = [
+    "Not Ready", "Break", "Lunch", "Coaching", "Administrativo", "Baño", "Llamada_Manual",
+    "Tipo de Break 6", "Tipo de Break 7", "Tipo de Break 8", "Tipo de Break 9"
+]
+
+# Todas las columnas de tiempo que se totalizan (LogIn y Auxiliar Total para recalcular "Auxiliar %")
+COLUMNAS_TIEMPO = ESTADOS_AUXILIARES + ["ACW", "Avail", "Connect", "Hold", "Auxiliar Total", "LogIn"]
+
+# Turnos del cuaderno: Mañana de HORAS_MANANA[0] a HORAS_MANANA[1] (sin incluir), el resto es Tarde.
+# Los rangos son los que el cuaderno escribe en los encabezados de Estadisticas.csv.
+HORAS_MANANA = (9, 14)
+RANGOS_CUADERNO = {"Mañana": "09:30:00 hasta 14:30:00", "Tarde": "15:00:00 hasta 20:00:00"}
+
+
+def turno_cuaderno(intervalo):
+    """Mañana o Tarde como en el cuaderno, según la hora de inicio del intervalo."""
+    hora = intervalo.dt.hour
+    manana = (hora >= HORAS_MANANA[0]) & (hora < HORAS_MANANA[1])
+    return pd.Series(np.where(manana, "Mañana", "Tarde"), index=intervalo.index, name="Turno Cuaderno")
+
+
+def _totales_chunk(chunk, columnas):
+    """Suma las columnas de tiempo por agente, fecha y turno de un chunk."""
+    # "Intervalo" viene día primero (19/2/2025 09:30:00), igual que "Inicio"
+    intervalo = parsear_inicio(chunk["Intervalo"])
+    validos = intervalo.notna()
+    claves = [
+        chunk["Agente"][validos],
+        intervalo[validos].dt.normalize().rename("Fecha"),
+        clasificar_turno(intervalo[validos]),
+        turno_cuaderno(intervalo[validos]),
+    ]
+    tiempos = chunk.loc[validos, columnas].fillna(0)
+    return tiempos.groupby(claves, observed=True).sum(), int((~validos).sum())
+
+
+@medida
+def calcular_totales(archivo):
+    """Recorre el archivo una vez y devuelve los totales de cada estado por agente, fecha y turno.
+
+    El índice tiene los dos turnos: "Turno" (config.TURNOS) y "Turno Cuaderno".
+    """
+    # Con el encabezado cortado, las columnas que faltan se toman de los campos de más de cada fila
+    disponibles = columnas_disponibles(archivo)
+    columnas = [col for col in COLUMNAS_TIEMPO if col in disponibles]
+
+    parciales = []
+    invalidos = 0
+    for chunk in iterar("leer_csv", leer_acumuladores(archivo, columnas)):
+        parcial, cantidad = _totales_chunk(chunk, columnas)
+        parciales.append(parcial)
+        invalidos += cantidad
+    informar_invalidos(invalidos, ARCHIVO_CUARENTENA)
+
+    return pd.concat(parciales).groupby(level=["Agente", "Fecha", "Turno", "Turno Cuaderno"], observed=True).sum()
+
+
+def minutos_de_break(totales):
+    """Minutos de Break por agente, fecha y turno del cuaderno (truncados, como en el cuaderno original)."""
+    breaks = totales["Break"].groupby(level=["Agente", "Fecha", "Turno Cuaderno"], observed=True).sum()
+    return (breaks // 60).astype(int).rename("Promedio por Break (min)")
+
+
+def detalle_por_turno(totales):
+    """Totales de cada estado por agente, fecha y turno de config.TURNOS, con "Auxiliar %" recalculado."""
+    detalle = totales.groupby(level=["Agente", "Fecha", "Turno"], observed=True).sum()
+    if "Auxiliar Total" in detalle.columns and "LogIn" in detalle.columns:
+        # El porcentaje se recalcula sobre los totales (promediar porcentajes no da el total)
+        detalle["Auxiliar %"] = (detalle["Auxiliar Total"] / detalle["LogIn"].where(detalle["LogIn"] > 0)).round(4)
+    return detalle
+
+
+@medida
+def guardar_estadisticas(totales):
+    """Escribe Estadisticas.csv con el formato del cuaderno y el detalle de todos los estados."""
+    # Como el pivot del cuaderno: enteros, o float (28.0) en todas las columnas si falta algún turno
+    tabla = minutos_de_break(totales).unstack("Turno Cuaderno")
+    tabla = tabla.reindex(columns=list(RANGOS_CUADERNO))
+    tabla.columns = [f"Promedio por Break: {RANGOS_CUADERNO[turno]}" for turno in tabla.columns]
+    tabla = tabla.rename(index=lambda fecha: fecha.strftime("%Y-%m-%d"), level="Fecha")
+    tabla.astype(object).where(tabla.notna(), "Sin datos").to_csv(archivo_salida, sep=';', encoding='utf8')
+
+    detalle = detalle_por_turno(totales).reset_index()
+    detalle["Fecha"] = detalle["Fecha"].dt.strftime("%Y-%m-%d")
+    detalle.to_csv(archivo_totales, sep=';', index=False, decimal=',', encoding='utf-8-sig')
+    print(f"Estadísticas guardadas en '{archivo_salida}' y '{archivo_totales}'.")
+
+
+@medida
+def generar_graficos(totales):
+    """Un gráfico de minutos de Break por agente para cada fecha y turno (sin los agentes en cero)."""
+    minutos = minutos_de_break(totales).reset_index()
+    minutos = minutos[minutos["Promedio por Break (min)"] != 0]
+    graficos = [
+        Grafico(barras, grupo[["Agente", "Promedio por Break (min)"]].reset_index(drop=True),
+                f"breaks_{fecha:%Y%m%d}_{turno}.png", mostrar=False, x="Agente", y="Promedio por Break (min)",
+                titulo=f"Cantidad Total de Breaks - {fecha:%d/%m/%Y} (Turno {turno})", xlabel="Agente",
+                ylabel="Total de Breaks")
+        for (fecha, turno), grupo in minutos.groupby(["Fecha", "Turno Cuaderno"], observed=True)
+    ]
+    renderizar(graficos)
+    print(f"Gráficos generados: {len(graficos)}")
+
+
+def main():
+    """Ejecución principal del script."""
+    try:
+        print("Calculando totales por agente, fecha y turno...")
+        totales = calcular_totales(archivo_entrada)
+
+        print("Guardando estadísticas...")
+        guardar_estadisticas(totales)
+
+        print("Generando gráficos...")
+        generar_graficos(totales)
+        mostrar()
+
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,36 +1,35 @@
-from datetime import datetime
-from collections import defaultdict
-import matplotlib.pyplot as plt
+import pandas as pd
 
-# Definimos los rangos horarios
-RANGO_MANIANA = (9.5, 14.5)  # De 8:00 a 14:30 (14.5 es 14:30)
-RANGO_TARDE = (15, 20)     # De 15:00 a 20:00
+from config import FUERA_DE_HORARIO
+from graficos import Grafico, barras, mostrar, renderizar
+from turnos import NOMBRES_TURNO, clasificar_turno, rango_turno
+
+# Los rangos horarios se definen en config.TURNOS. Antes este script contaba la mañana
+# desde las 09:30 (RANGO_MANIANA = (9.5, 14.5)); ahora usa las 09:00 como el resto de los reportes,
+# así que las fechas entre 09:00 y 09:29 pasan de "Fuera de Rango" a la mañana.
+ETIQUETAS = {nombre: f"{nombre} ({rango_turno(nombre)})" for nombre in NOMBRES_TURNO}
+ETIQUETAS[FUERA_DE_HORARIO] = 'Fuera de Rango'
 
 def filtrar_por_horarios(archivo_txt):
-    conteo = defaultdict(int)
+    conteo = {}
 
     try:
         with open(archivo_txt, 'r', encoding='utf-8') as file:
-            for linea in file:
-                fecha = linea.strip()
-                try:
-                    # Convertir la fecha a un objeto datetime
-                    dt = datetime.strptime(fecha, "%d/%m/%Y %H:%M")
-                    # Obtener la hora en formato decimal (e.g., 10:30 -> 10.5)
-                    hora_decimal = dt.hour + dt.minute / 60
-
-                    # Verificar a qué rango pertenece
-                    if RANGO_MANIANA[0] <= hora_decimal <= RANGO_MANIANA[1]:
-                        conteo['Mañana (8:00-14:30)'] += 1
-                    elif RANGO_TARDE[0] <= hora_decimal <= RANGO_TARDE[1]:
-                        conteo['Tarde (15:00-20:00)'] += 1
-                    else:
-                        conteo['Fuera de Rango'] += 1
-
-                except ValueError:
-                    print(f"Fecha inválida: {fecha}")
+            fechas = pd.Series([linea.strip() for linea in file])
     except FileNotFoundError:
         print(f"El archivo {archivo_txt} no fue encontrado.")
+        return conteo
+
+    # Convertir todas las fechas de una vez
+    dt = pd.to_datetime(fechas, format="%d/%m/%Y %H:%M", errors="coerce")
+    for fecha in fechas[dt.isna()]:
+        print(f"Fecha inválida: {fecha}")
+
+    # Clasificar por turno en forma vectorizada
+    turnos = clasificar_turno(dt.dropna())
+    for nombre, cantidad in turnos.value_counts(sort=False).items():
+        if cantidad > 0:
+            conteo[ETIQUETAS[nombre]] = int(cantidad)
 
     return conteo
 
@@ -48,19 +47,10 @@ for rango, cantidad in conteo_horarios.items():
 horarios = list(conteo_horarios.keys())
 valores = list(conteo_horarios.values())
 
-# Crear la gráfica de barras
-plt.figure(figsize=(8, 6))
-plt.bar(horarios, valores)
-
-# Mostrar valores exactos encima de las barras
-for i, valor in enumerate(valores):
-    plt.text(i, valor + 5, str(valor), ha='center', va='bottom')
-
-plt.title('Distribución por Horarios')
-plt.ylabel('Cantidad')
-plt.xlabel('Horario')
-plt.tight_layout()
-
-# Guardar la imagen y mostrarla
-plt.savefig('estadistica_horarios.png')
-plt.show()
+# Crear la gráfica de barras, con los valores exactos encima de las barras
+renderizar([
+    Grafico(barras, pd.DataFrame({"Horario": horarios, "Cantidad": valores}), 'estadistica_horarios.png',
+            x="Horario", y="Cantidad", titulo='Distribución por Horarios', xlabel='Horario', ylabel='Cantidad',
+            figsize=(8, 6), rotacion=0, etiquetas=True),
+])
+mostrar()
@@ -0,0 +1,99 @@
+import pandas as pd
+
+from turnos import clasificar_turno
+
+try:
+    import pyarrow.dataset as ds
+except ImportError:
+    ds = None
+
+
+def parsear_fecha(texto):
+    """Acepta fechas dd/mm/aaaa o aaaa-mm-dd."""
+    if texto is None:
+        return None
+    if '/' in texto:
+        return pd.to_datetime(texto, format='%d/%m/%Y')
+    return pd.to_datetime(texto, format='%Y-%m-%d')
+
+
+class Filtro:
+    """Condiciones de un reporte: rango de fechas, turnos, agentes, Origen Corte y Tipificación.
+
+    Se aplican al leer: sobre el caché Parquet se empujan al escaneo
+    (particiones de día y estadísticas de cada archivo); sobre el CSV se
+    filtra cada chunk antes de convertir fechas.
+    """
+
+    def __init__(self, desde=None, hasta=None, turnos=None, agentes=None, origenes=None, tipificaciones=None):
+        self.desde = parsear_fecha(desde) if isinstance(desde, str) else desde
+        self.hasta = parsear_fecha(hasta) if isinstance(hasta, str) else hasta
+        self.turnos = list(turnos) if turnos else None
+        self.agentes = list(agentes) if agentes else None
+        self.origenes = list(origenes) if origenes else None
+        self.tipificaciones = list(tipificaciones) if tipificaciones else None
+
+    def rango(self):
+        """Primer y último instante pedidos (None si no hay filtro de fechas)."""
+        if self.desde is None and self.hasta is None:
+            return None
+        fin = None if self.hasta is None else self.hasta + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+        return self.desde, fin
+
+    def columnas(self):
+        """Columnas que hacen falta para evaluar el filtro."""
+        columnas = set()
+        if self.desde is not None or self.hasta is not None or self.turnos:
+            columnas.add("Inicio")
+        if self.agentes:
+            columnas.add("Nombre Agente")
+        if self.origenes:
+            columnas.add("Origen Corte")
+        if self.tipificaciones:
+            columnas.add("Tipificación")
+        return columnas
+
+    def _filtros_texto(self):
+        return [
+            (col, valores) for col, valores in (
+                ("Nombre Agente", self.agentes),
+                ("Origen Corte", self.origenes),
+                ("Tipificación", self.tipificaciones),
+            ) if valores
+        ]
+
+    def expresion_arrow(self):
+        """Expresión de pyarrow para filtrar el caché sin materializar filas descartadas."""
+        condiciones = []
+        if self.desde is not None:
+            condiciones.append(ds.field("Dia") >= self.desde.strftime("%Y-%m-%d"))
+        if self.hasta is not None:
+            condiciones.append(ds.field("Dia") <= self.hasta.strftime("%Y-%m-%d"))
+        for col, valores in self._filtros_texto():
+            condiciones.append(ds.field(col).isin(valores))
+        if not condiciones:
+            return None
+        expresion = condiciones[0]
+        for condicion in condiciones[1:]:
+            expresion = expresion & condicion
+        return expresion
+
+    def aplicar_texto(self, chunk):
+        """Filtra por las columnas de texto (antes de convertir fechas)."""
+        for col, valores in self._filtros_texto():
+            chunk = chunk[chunk[col].isin(valores)]
+        return chunk
+
+    def aplicar_fechas(self, chunk):
+        """Filtra por rango de días y turnos sobre la columna "FechaHora" ya convertida."""
+        if self.desde is None and self.hasta is None and not self.turnos:
+            return chunk
+        fechas = chunk["FechaHora"]
+        mascara = pd.Series(True, index=chunk.index)
+        if self.desde is not None:
+            mascara &= fechas >= self.desde
+        if self.hasta is not None:
+            mascara &= fechas < self.hasta + pd.Timedelta(days=1)
+        if self.turnos:
+            mascara &= clasificar_turno(fechas).isin(self.turnos)
+        return chunk[mascara]
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from config import GRAFICOS_EN_LOTE
+
+# Modo lote: backend sin ventanas, gráficos en paralelo y sin redibujar los que no cambiaron.
+# La variable de entorno GRAFICOS_EN_LOTE=1 lo activa sin tocar config.py.
+EN_LOTE = os.environ.get("GRAFICOS_EN_LOTE", "1" if GRAFICOS_EN_LOTE else "0") == "1"
+
+if EN_LOTE:
+    import matplotlib
+    matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+# Configuración
+ARCHIVO_HASHES = ".graficos.json"  # Hash de los datos de cada gráfico ya dibujado
+procesos = os.cpu_count()
+
+
+class Grafico:
+    """Un gráfico a dibujar: función de dibujo, datos, archivo de salida y opciones de la función."""
+
+    def __init__(self, funcion, datos, archivo, mostrar=True, **opciones):
+        self.funcion = funcion
+        self.datos = datos
+        self.archivo = str(archivo)
+        # En modo interactivo, si queda abierto para plt.show() al final
+        self.mostrar = mostrar
+        self.opciones = opciones
+
+    def hash(self):
+        """Hash de los datos, la función y las opciones: si no cambia, la imagen sería la misma."""
+        sha1 = hashlib.sha1()
+        sha1.update(pd.util.hash_pandas_object(self.datos, index=True).to_numpy().tobytes())
+        sha1.update(repr((self.funcion.__name__, list(self.datos.columns), sorted(self.opciones.items()))).encode())
+        return sha1.hexdigest()
+
+    def dibujar(self):
+        self.funcion(self.datos, self.archivo, **self.opciones)
+        if EN_LOTE or not self.mostrar:
+            plt.close("all")
+
+
+def anotar_inicio_segmentos(ax, valores):
+    """Anota cada segmento positivo de barras apiladas en su base (posiciones calculadas con numpy).
+
+    'valores' tiene una fila por barra y una columna por serie, en el orden en que se apilaron.
+    """
+    valores = np.nan_to_num(np.asarray(valores, dtype=np.float64))
+    bases = np.cumsum(valores, axis=1) - valores
+    barras, series = np.nonzero(valores > 0)
+    for x, y, altura in zip(barras, bases[barras, series], valores[barras, series]):
+        ax.annotate(f'{int(altura)}', (x, y), ha='center', va='bottom', fontsize=10, color='black',
+                    xytext=(0, -5), textcoords='offset points')
+
+
+def barras(datos, archivo, x, y, titulo, xlabel, ylabel, color=None, figsize=(12, 6), rotacion=45,
+           etiquetas=False):
+    """Barras simples; con 'etiquetas' muestra el valor encima de cada barra."""
+    plt.figure(figsize=figsize)
+    plt.bar(datos[x].astype(str), datos[y], color=color)
+    if etiquetas:
+        for i, valor in enumerate(datos[y]):
+            plt.text(i, valor + 5, str(valor), ha='center', va='bottom')
+    plt.title(titulo)
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    plt.xticks(rotation=rotacion, ha="right" if rotacion else "center")
+    plt.tight_layout()
+    plt.savefig(archivo)
+
+
+def barras_apiladas(datos, archivo, x, y, titulo, xlabel, ylabel, figsize=(12, 6), rotacion=None,
+                    anotar=False):
+    """Barras apiladas de las columnas 'y'; con 'anotar' muestra el valor al inicio de cada segmento."""
+    ax = datos.plot(x=x, y=y, kind='bar', stacked=True, legend=True, figsize=figsize)
+    if anotar:
+        anotar_inicio_segmentos(ax, datos[y].to_numpy())
+    plt.title(titulo)
+    plt.ylabel(ylabel)
+    plt.xlabel(xlabel)
+    if rotacion is not None:
+        plt.xticks(rotation=rotacion)
+    plt.tight_layout()
+    plt.savefig(archivo)
+
+
+def barras_agrupadas(datos, archivo, x, y, titulo, xlabel, ylabel, colores=None, figsize=(12, 6), rotacion=45):
+    """Barras de las columnas 'y' una al lado de la otra para cada valor de 'x'."""
+    posiciones = np.arange(len(datos))
+    ancho = 0.8 / len(y)
+    plt.figure(figsize=figsize)
+    for i, columna in enumerate(y):
+        plt.bar(posiciones + (i - (len(y) - 1) / 2) * ancho, datos[columna], width=ancho,
+                color=colores[i] if colores else None, label=columna)
+    plt.title(titulo)
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    plt.xticks(posiciones, datos[x].astype(str), rotation=rotacion)
+    plt.legend()
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    plt.tight_layout()
+    plt.savefig(archivo)
+
+
+def lineas(datos, archivo, x, y, titulo, xlabel, ylabel, figsize=(12, 6), rotacion=45):
+    plt.figure(figsize=figsize)
+    plt.plot(datos[x], datos[y], marker="o")
+    plt.title(titulo)
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    plt.xticks(rotation=rotacion)
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig(archivo)
+
+
+def _leer_hashes():
+    if not os.path.exists(ARCHIVO_HASHES):
+        return {}
+    with open(ARCHIVO_HASHES, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def _dibujar(grafico):
+    """Tarea de cada proceso del pool."""
+    grafico.dibujar()
+    return grafico.archivo
+
+
+def _dibujar_en_paralelo(graficos, procesos):
+    """Dibuja en un proceso aparte que reparte los gráficos en un pool.
+
+    Se usa un proceso intermedio porque los scripts de reportes no tienen
+    'if __name__ == "__main__"' y los procesos del pool los volverían a ejecutar.
+    """
+    with tempfile.NamedTemporaryFile(suffix=".pkl", delete=False) as file:
+        pickle.dump(graficos, file)
+    try:
+        subprocess.run([sys.executable, os.path.abspath(__file__), file.name, str(procesos)], check=True)
+    finally:
+        os.remove(file.name)
+
+
+def renderizar(graficos, procesos=procesos):
+    """Dibuja y guarda los gráficos.
+
+    En modo lote saltea los que tienen los mismos datos que la última vez y
+    dibuja el resto en paralelo; en modo interactivo los dibuja todos acá y
+    quedan abiertos para mostrar().
+    """
+    if not EN_LOTE:
+        for grafico in graficos:
+            grafico.dibujar()
+        return graficos
+
+    hashes = _leer_hashes()
+    pendientes = []
+    for grafico in graficos:
+        grafico_hash = grafico.hash()
+        if hashes.get(grafico.archivo) == grafico_hash and os.path.exists(grafico.archivo):
+            continue
+        pendientes.append((grafico, grafico_hash))
+
+    salteados = len(graficos) - len(pendientes)
+    if salteados:
+        print(f"Gráficos sin cambios (no se redibujan): {salteados}")
+
+    if len(pendientes) > 1 and procesos != 1:
+        _dibujar_en_paralelo([grafico for grafico, _ in pendientes], procesos)
+    else:
+        for grafico, _ in pendientes:
+            grafico.dibujar()
+
+    if pendientes:
+        hashes.update({grafico.archivo: grafico_hash for grafico, grafico_hash in pendientes})
+        with open(ARCHIVO_HASHES, 'w', encoding='utf-8') as file:
+            json.dump(hashes, file, ensure_ascii=False, indent=2)
+    return [grafico for grafico, _ in pendientes]
+
+
+def mostrar():
+    """plt.show() solo en modo interactivo (en modo lote no bloquea la ejecución)."""
+    if not EN_LOTE:
+        plt.show()
+
+
+def main():
+    """Dibuja en un pool los gráficos recibidos en un archivo pickle (ver _dibujar_en_paralelo)."""
+    with open(sys.argv[1], 'rb') as file:
+        graficos = pickle.load(file)
+    cantidad = int(sys.argv[2]) if len(sys.argv) > 2 else procesos
+    with ProcessPoolExecutor(max_workers=min(cantidad, len(graficos))) as pool:
+        for archivo in pool.map(_dibujar, graficos):
+            print(f"Gráfico guardado: {archivo}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+import argparse
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from cache import calcular_hash
+from config import CARPETA_HISTORICO
+from motor import AgregadoDiario, procesar
+from turnos import NOMBRES_TURNO, columnas_horario
+
+# Rutas de salida (mismos nombres que origenCorte.py)
+estadistica_mensual = 'estadistica_mensual.csv'
+estadistica_diaria = 'estadistica_diaria.csv'
+
+ARCHIVO_INGESTADOS = "_ingestados.json"
+
+
+def _ruta_dia(carpeta, dia):
+    return Path(carpeta) / f"dia={dia}.csv"
+
+
+def leer_ingestados(carpeta=CARPETA_HISTORICO):
+    """Lee el registro de archivos ya incorporados al histórico."""
+    ruta = Path(carpeta) / ARCHIVO_INGESTADOS
+    if not ruta.exists():
+        return {}
+    with open(ruta, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def _guardar_ingestados(ingestados, carpeta):
+    ruta = Path(carpeta) / ARCHIVO_INGESTADOS
+    temporal = ruta.with_suffix(".tmp")
+    with open(temporal, 'w', encoding='utf-8') as file:
+        json.dump(ingestados, file, ensure_ascii=False, indent=2)
+    os.replace(temporal, ruta)
+
+
+def _firma(archivo):
+    estado = os.stat(archivo)
+    return {"tamanio": estado.st_size, "mtime_ns": estado.st_mtime_ns}
+
+
+def ya_ingestado(archivo, carpeta=CARPETA_HISTORICO):
+    """Indica si el archivo ya fue incorporado con su contenido actual."""
+    registro = leer_ingestados(carpeta).get(str(Path(archivo).resolve()))
+    if registro is None:
+        return False
+    firma = _firma(archivo)
+    if registro["tamanio"] != firma["tamanio"]:
+        return False
+    if registro["mtime_ns"] == firma["mtime_ns"]:
+        return True
+    return registro["sha1"] == calcular_hash(archivo)
+
+
+def ingestar(archivo, carpeta=CARPETA_HISTORICO, forzar=False):
+    """Agrega los días del archivo al histórico; cada día presente reemplaza al guardado."""
+    if not forzar and ya_ingestado(archivo, carpeta):
+        return []
+
+    Path(carpeta).mkdir(parents=True, exist_ok=True)
+    agregado = procesar(archivo, [AgregadoDiario()])[0].resultado()
+
+    dias = sorted(agregado["Fecha"].unique())
+    for dia, filas in agregado.groupby("Fecha"):
+        ruta = _ruta_dia(carpeta, dia)
+        temporal = ruta.with_suffix(".tmp")
+        filas.to_csv(temporal, index=False, sep=';', encoding='utf-8-sig')
+        # Reemplazo atómico: re-exportar un día no duplica sus datos
+        os.replace(temporal, ruta)
+
+    ingestados = leer_ingestados(carpeta)
+    ingestados[str(Path(archivo).resolve())] = {**_firma(archivo), "sha1": calcular_hash(archivo), "dias": dias}
+    _guardar_ingestados(ingestados, carpeta)
+    return dias
+
+
+def dias_disponibles(carpeta=CARPETA_HISTORICO):
+    """Lista los días guardados en el histórico (solo nombres de archivo)."""
+    return sorted(ruta.stem.split("=", 1)[1] for ruta in Path(carpeta).glob("dia=*.csv"))
+
+
+def consultar(desde=None, hasta=None, carpeta=CARPETA_HISTORICO):
+    """Lee los agregados de los días entre 'desde' y 'hasta' (AAAA-MM-DD, ambos incluidos)."""
+    dias = [
+        dia for dia in dias_disponibles(carpeta)
+        if (desde is None or dia >= str(desde)) and (hasta is None or dia <= str(hasta))
+    ]
+    columnas = [*AgregadoDiario.claves, "Cantidad", "TalkingTime"]
+    if not dias:
+        return pd.DataFrame(columns=columnas)
+    return pd.concat(
+        [pd.read_csv(_ruta_dia(carpeta, dia), sep=';', encoding='utf-8-sig', dtype={"Fecha": str}) for dia in dias],
+        ignore_index=True
+    )[columnas]
+
+
+def calcular_estadisticas(df, tipificacion=None):
+    """Arma las estadísticas mensual y diaria de origenCorte.py/Agendado.py desde los agregados.
+
+    Con 'tipificacion' cuenta solo esa tipificación (Agendado.py); si no, excluye "No Disp.".
+    """
+    tipificaciones = df['Tipificación'].fillna('').str.strip().str.lower()
+    if tipificacion is None:
+        df = df[tipificaciones != 'no disp.']
+    else:
+        df = df[tipificaciones == tipificacion.strip().lower()]
+    df = df[df['Origen Corte'].fillna('').str.strip().str.lower() == 'agente']
+
+    fechas = pd.to_datetime(df['Fecha'])
+    horario = pd.Categorical(df['Turno'], categories=NOMBRES_TURNO)
+
+    def _contar(clave, nombre):
+        conteo = (
+            pd.DataFrame({nombre: clave, 'Horario': horario, 'Cantidad': df['Cantidad'].to_numpy()})
+            .pivot_table(index=nombre, columns='Horario', values='Cantidad', aggfunc='sum', fill_value=0, observed=False)
+            .reset_index()
+        )
+        conteo.columns.name = None
+        return columnas_horario(conteo, nombre)
+
+    mensual = _contar(fechas.dt.to_period('M').to_numpy(), 'Mes')
+    diaria = _contar(fechas.dt.date.to_numpy(), 'Fecha')
+    return mensual, diaria
+
+
+def main():
+    """Ingesta exportaciones nuevas y genera reportes desde el histórico."""
+    parser = argparse.ArgumentParser(description="Histórico incremental de agregados diarios.")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    parser_ingestar = subcomandos.add_parser("ingestar", help="Incorpora exportaciones al histórico.")
+    parser_ingestar.add_argument("archivos", nargs="+")
+    parser_ingestar.add_argument("--forzar", action="store_true", help="Reprocesa aunque ya se haya ingestado.")
+
+    parser_reporte = subcomandos.add_parser("reporte", help="Genera las estadísticas mensual y diaria.")
+    parser_reporte.add_argument("--desde", help="Fecha inicial AAAA-MM-DD.")
+    parser_reporte.add_argument("--hasta", help="Fecha final AAAA-MM-DD.")
+    parser_reporte.add_argument("--tipificacion", help="Contar solo esta tipificación (p. ej. 'Agendado por el Vdor').")
+
+    for subparser in (parser_ingestar, parser_reporte):
+        subparser.add_argument("--carpeta", default=CARPETA_HISTORICO)
+    args = parser.parse_args()
+
+    if args.comando == "ingestar":
+        for archivo in args.archivos:
+            dias = ingestar(archivo, args.carpeta, forzar=args.forzar)
+            if dias:
+                print(f"'{archivo}': {len(dias)} días incorporados ({dias[0]} a {dias[-1]}).")
+            else:
+                print(f"'{archivo}': sin cambios desde la última ingesta.")
+        return
+
+    df = consultar(args.desde, args.hasta, args.carpeta)
+    mensual, diaria = calcular_estadisticas(df, args.tipificacion)
+    mensual.to_csv(estadistica_mensual, index=False, sep=';', encoding='utf-8-sig')
+    diaria.to_csv(estadistica_diaria, index=False, sep=';', encoding='utf-8-sig')
+    print(f"Estadísticas guardadas en '{estadistica_mensual}' y '{estadistica_diaria}'.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+import io
+import json
+import os
+import sys
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from lectores import comprimido, leer_encabezados, leer_todo
+from parseo_fechas import EPOCH_INVALIDO, parsear_epoch
+
+# Configuración
+FILAS_POR_BLOQUE = 10000
+chunksize = 100000
+
+
+def ruta_indice(archivo):
+    """Archivo lateral con el índice, al lado del CSV."""
+    return Path(archivo).with_suffix(".indice.json")
+
+
+def _firma(archivo):
+    estado = os.stat(archivo)
+    return {"tamanio": estado.st_size, "mtime_ns": estado.st_mtime_ns}
+
+
+def construir_indice(archivo, filas_por_bloque=FILAS_POR_BLOQUE):
+    """Recorre el archivo una vez y guarda, cada N filas, el byte de inicio y el mínimo/máximo de 'Inicio'.
+
+    Supone que ningún campo tiene saltos de línea entre comillas (las exportaciones solo citan números).
+    """
+    if comprimido(archivo):
+        raise ValueError(f"'{archivo}' está comprimido: no se puede saltar a un byte; usar el caché columnar.")
+    bloques = []
+    with open(archivo, 'rb') as file:
+        encabezado = file.readline()
+        columnas = encabezado.decode('utf-8-sig').rstrip('\r\n').split(';')
+        if "Inicio" not in columnas:
+            raise ValueError(f"El archivo no tiene columna 'Inicio'. Encabezados detectados: {columnas}")
+        posicion_inicio = columnas.index("Inicio")
+        offset = len(encabezado)
+
+        while True:
+            lineas = list(islice(file, filas_por_bloque))
+            if not lineas:
+                break
+            datos = b''.join(lineas)
+            inicio = pd.read_csv(io.BytesIO(datos), sep=';', header=None, usecols=[posicion_inicio],
+                                 dtype=str).iloc[:, 0]
+            epoch = parsear_epoch(inicio)
+            validos = epoch[epoch != EPOCH_INVALIDO]
+            bloques.append({
+                "offset": offset,
+                "bytes": len(datos),
+                "filas": len(lineas),
+                # Zona del bloque: sin fechas válidas queda en None y no coincide con ningún rango
+                "min": int(validos.min()) if len(validos) else None,
+                "max": int(validos.max()) if len(validos) else None,
+            })
+            offset += len(datos)
+
+    return _guardar(archivo, columnas, filas_por_bloque, bloques)
+
+
+def _guardar(archivo, columnas, filas_por_bloque, bloques):
+    indice = {**_firma(archivo), "columnas": columnas, "filas_por_bloque": filas_por_bloque, "bloques": bloques}
+    with open(ruta_indice(archivo), 'w', encoding='utf-8') as file:
+        json.dump(indice, file, ensure_ascii=False)
+    return indice
+
+
+class IndiceEnConstruccion:
+    """Arma el índice durante una lectura completa del CSV, con las fechas que esa lectura ya convierte.
+
+    Se le pasan las fechas de "Inicio" de cada chunk (con el número de fila como
+    índice, como los entrega lectores.leer_csv); al terminar, guardar() saca los
+    bytes de cada bloque con una pasada por las líneas, sin volver a parsear.
+    """
+
+    def __init__(self, archivo, filas_por_bloque=FILAS_POR_BLOQUE):
+        self.archivo = archivo
+        self.filas_por_bloque = filas_por_bloque
+        self.minimos = {}
+        self.maximos = {}
+        self.filas = 0
+
+    def agregar(self, fechas):
+        """Mínimo y máximo de las fechas válidas de cada bloque (fechas: Serie datetime con el número de fila)."""
+        self.filas = max(self.filas, int(fechas.index.max()) + 1) if len(fechas) else self.filas
+        validas = fechas.dropna()
+        epoch = pd.Series(validas.to_numpy(dtype="datetime64[s]").astype(np.int64),
+                          index=validas.index // self.filas_por_bloque)
+        for bloque, (minimo, maximo) in epoch.groupby(level=0).agg(["min", "max"]).iterrows():
+            self.minimos[bloque] = min(self.minimos.get(bloque, minimo), int(minimo))
+            self.maximos[bloque] = max(self.maximos.get(bloque, maximo), int(maximo))
+
+    def guardar(self):
+        """Guarda el índice si las filas del archivo coinciden con las leídas; devuelve el índice o None."""
+        bloques = []
+        filas = 0
+        with open(self.archivo, 'rb') as file:
+            offset = len(file.readline())
+            inicio = offset
+            en_bloque = 0
+            for linea in file:
+                # Las líneas vacías no son filas para read_csv, pero sus bytes quedan en el bloque
+                if linea.strip(b'\r\n'):
+                    en_bloque += 1
+                offset += len(linea)
+                if en_bloque == self.filas_por_bloque:
+                    bloques.append(self._bloque(len(bloques), inicio, offset, en_bloque))
+                    filas += en_bloque
+                    inicio, en_bloque = offset, 0
+            if en_bloque:
+                bloques.append(self._bloque(len(bloques), inicio, offset, en_bloque))
+                filas += en_bloque
+        # Con saltos de línea entre comillas las filas no coinciden con las líneas: no se guarda
+        if filas != self.filas:
+            return None
+        return _guardar(self.archivo, leer_encabezados(self.archivo), self.filas_por_bloque, bloques)
+
+    def _bloque(self, numero, inicio, fin, filas):
+        return {"offset": inicio, "bytes": fin - inicio, "filas": filas,
+                "min": self.minimos.get(numero), "max": self.maximos.get(numero)}
+
+
+def leer_indice(archivo):
+    """Devuelve el índice si existe y corresponde al archivo actual; si no, None."""
+    ruta = ruta_indice(archivo)
+    if not ruta.exists():
+        return None
+    with open(ruta, 'r', encoding='utf-8') as file:
+        indice = json.load(file)
+    firma = _firma(archivo)
+    if indice["tamanio"] != firma["tamanio"] or indice["mtime_ns"] != firma["mtime_ns"]:
+        return None
+    return indice
+
+
+def bloques_en_rango(indice, desde=None, hasta=None):
+    """Bloques cuya zona [min, max] se cruza con [desde, hasta] (el orden de los bloques no importa)."""
+    desde_epoch = None if desde is None else int(pd.Timestamp(desde).timestamp())
+    hasta_epoch = None if hasta is None else int(pd.Timestamp(hasta).timestamp())
+    seleccion = []
+    for bloque in indice["bloques"]:
+        if bloque["min"] is None:
+            continue
+        if desde_epoch is not None and bloque["max"] < desde_epoch:
+            continue
+        if hasta_epoch is not None and bloque["min"] > hasta_epoch:
+            continue
+        seleccion.append(bloque)
+    return seleccion
+
+
+def _agrupar_contiguos(bloques, chunksize):
+    """Une bloques consecutivos en el archivo hasta 'chunksize' filas para leerlos de una vez."""
+    grupo = []
+    for bloque in bloques:
+        contiguo = grupo and grupo[-1]["offset"] + grupo[-1]["bytes"] == bloque["offset"]
+        if grupo and (not contiguo or sum(b["filas"] for b in grupo) + bloque["filas"] > chunksize):
+            yield grupo
+            grupo = []
+        grupo.append(bloque)
+    if grupo:
+        yield grupo
+
+
+def leer_rango(archivo, indice, columnas=None, desde=None, hasta=None, chunksize=chunksize):
+    """Lee solo los bloques que pueden tener filas entre 'desde' y 'hasta', en chunks de DataFrames.
+
+    Las filas fuera del rango que comparten bloque con filas dentro se devuelven igual;
+    el filtro exacto por fecha lo hace quien consume los chunks.
+    """
+    with open(archivo, 'rb') as file:
+        for grupo in _agrupar_contiguos(bloques_en_rango(indice, desde, hasta), chunksize):
+            file.seek(grupo[0]["offset"])
+            datos = file.read(sum(bloque["bytes"] for bloque in grupo))
+            yield leer_todo(io.BytesIO(datos), columnas, nombres=indice["columnas"])
+
+
+def main():
+    """Construye el índice de los archivos indicados por línea de comandos."""
+    for archivo in sys.argv[1:] or ["datos.csv"]:
+        indice = construir_indice(archivo)
+        bloques = indice["bloques"]
+        desordenados = int(np.sum(np.diff([b["min"] for b in bloques if b["min"] is not None]) < 0))
+        print(f"Índice de '{archivo}': {len(bloques)} bloques de {indice['filas_por_bloque']} filas "
+              f"({desordenados} fuera de orden) guardado en '{ruta_indice(archivo)}'.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+from acumuladores import columnas_disponibles, leer_acumuladores
+from config import ARCHIVO_CUARENTENA
+from cubo import consultar, construir_cubo
+from medicion import etapa, iterar, medida
+from parseo_fechas import informar_invalidos, parsear_inicio
+
+# Configuración
+archivo_interacciones = "datos.csv"
+archivo_acumuladores = "Acumuladores de Agentes (2).csv"
+archivo_salida = "estadisticas_intervalos.csv"
+MINUTOS_INTERVALO = 30  # Duración de cada "Intervalo" de Acumuladores de Agentes
+
+# Columnas de Acumuladores de Agentes que se suman por agente e intervalo (segundos)
+COLUMNAS_ACUMULADORES = ["Connect", "Avail", "ACW", "Not Ready", "Break", "Lunch", "Baño", "LogIn"]
+MEDIDAS_INTERACCIONES = ["Interacciones", "Cortes Agente", "TalkingTime", "Llamadas Largas"]
+
+CLAVES = ["Intervalo", "Agente"]
+ORIGENES = {"both": "Ambos", "left_only": "Solo interacciones", "right_only": "Solo acumuladores"}
+
+
+@medida
+def intervalos_interacciones(archivo):
+    """Interacciones por agente e intervalo de 30 minutos, leídas del cubo y ordenadas por intervalo."""
+    cubo = construir_cubo(archivo)
+    cubo = cubo[cubo["Nombre Agente"].notna() & cubo["Fecha"].notna()]
+    por_origen = consultar(cubo, ["Fecha", "MediaHora", "Nombre Agente", "Origen Corte"],
+                           medidas=["Cantidad", "TalkingTime", "Llamadas Largas"])
+
+    intervalo = por_origen["Fecha"] + pd.to_timedelta(por_origen["MediaHora"].astype(np.int64) * 30, unit="min")
+    datos = pd.DataFrame({
+        "Intervalo": intervalo,
+        "Agente": por_origen["Nombre Agente"].astype(str).str.strip(),
+        "Interacciones": por_origen["Cantidad"],
+        "Cortes Agente": por_origen["Cantidad"].where(por_origen["Origen Corte"] == "Agente", 0),
+        "TalkingTime": por_origen["TalkingTime"],
+        "Llamadas Largas": por_origen["Llamadas Largas"],
+    })
+    return datos.groupby(CLAVES).sum().reset_index()
+
+
+def intervalos_acumuladores(archivo, columnas):
+    """Genera los chunks de Acumuladores de Agentes sumados por agente e intervalo (ordenados)."""
+    invalidos = 0
+    for chunk in iterar("leer_acumuladores", leer_acumuladores(archivo, columnas)):
+        intervalo = parsear_inicio(chunk["Intervalo"])
+        validos = intervalo.notna()
+        invalidos += int((~validos).sum())
+        # El intervalo se lleva al inicio del bloque de 30 minutos, igual que las interacciones
+        claves = [intervalo[validos].dt.floor(f"{MINUTOS_INTERVALO}min").rename("Intervalo"),
+                  chunk["Agente"][validos].str.strip()]
+        yield chunk.loc[validos, columnas].fillna(0).groupby(claves).sum().reset_index()
+    informar_invalidos(invalidos, ARCHIVO_CUARENTENA)
+
+
+def _metricas(unido):
+    """Completa con ceros el lado faltante y agrega las métricas por intervalo (nulas si el denominador es cero)."""
+    unido["Origen"] = unido.pop("_merge").cat.rename_categories(ORIGENES)
+    unido[MEDIDAS_INTERACCIONES] = unido[MEDIDAS_INTERACCIONES].fillna(0).astype(np.int64)
+    medidas = unido.columns.difference([*CLAVES, *MEDIDAS_INTERACCIONES, "Origen"])
+    unido[medidas] = unido[medidas].fillna(0)
+
+    connect_min = unido["Connect"] / 60 if "Connect" in unido else pd.Series(np.nan, index=unido.index)
+    unido["Cortes por Minuto Connect"] = (unido["Cortes Agente"] / connect_min.where(connect_min > 0)).round(4)
+    pausa = sum((unido[col] for col in ("Break", "Not Ready") if col in unido), pd.Series(0.0, index=unido.index))
+    unido["Minutos Break + Not Ready"] = (pausa / 60).round(2)
+    unido["Tasa de Corte del Agente"] = (
+        unido["Cortes Agente"] / unido["Interacciones"].where(unido["Interacciones"] > 0)
+    ).round(4)
+    return unido
+
+
+def unir(interacciones, chunks_acumuladores, columnas):
+    """Une por agente e intervalo las interacciones agregadas con los chunks de acumuladores.
+
+    El export de acumuladores viene ordenado por Intervalo, así que se recorre una sola
+    vez: cada chunk cierra los intervalos anteriores al último que contiene (ese último
+    puede seguir en el chunk siguiente y queda pendiente). De las interacciones, ya
+    ordenadas, se toma por búsqueda binaria la ventana de intervalos que se cierra.
+    Memoria: un chunk más las interacciones agregadas (una fila por agente e intervalo).
+    Las claves de un solo lado se conservan con ceros en el otro.
+    """
+    interacciones = interacciones.sort_values(CLAVES, ignore_index=True)
+    inicios = interacciones["Intervalo"].to_numpy()
+    desde = 0  # Primera fila de interacciones todavía no unida
+    pendiente = pd.DataFrame({"Intervalo": pd.Series(dtype="datetime64[ns]"), "Agente": pd.Series(dtype=str),
+                              **{col: pd.Series(dtype=np.float64) for col in columnas}})
+
+    def ventana(acumuladores, hasta=None):
+        nonlocal desde
+        limite = len(inicios) if hasta is None else int(np.searchsorted(inicios, np.datetime64(hasta), "left"))
+        lado = interacciones.iloc[desde:limite]
+        desde = limite
+        unido = pd.merge(lado, acumuladores, on=CLAVES, how="outer", sort=True, validate="one_to_one",
+                         indicator=True)
+        return _metricas(unido)
+
+    cerrado_hasta = None
+    for chunk in chunks_acumuladores:
+        chunk = pd.concat([pendiente, chunk]).groupby(CLAVES).sum().reset_index()
+        if chunk.empty:
+            continue
+        if cerrado_hasta is not None and chunk["Intervalo"].min() < cerrado_hasta:
+            raise ValueError(f"El archivo de acumuladores no está ordenado por Intervalo "
+                             f"(aparece {chunk['Intervalo'].min()} después de {cerrado_hasta}).")
+        ultimo = chunk["Intervalo"].max()
+        abiertos = (chunk["Intervalo"] == ultimo).to_numpy()
+        pendiente = chunk[abiertos]
+        if not abiertos.all():
+            cerrado_hasta = ultimo
+            yield ventana(chunk[~abiertos], ultimo)
+    yield ventana(pendiente)
+
+
+def main():
+    """Genera las métricas por agente e intervalo de 30 minutos cruzando ambas exportaciones."""
+    interacciones = sys.argv[1] if len(sys.argv) > 1 else archivo_interacciones
+    acumuladores = sys.argv[2] if len(sys.argv) > 2 else archivo_acumuladores
+
+    disponibles = columnas_disponibles(acumuladores)
+    faltantes = {"Intervalo", "Agente"} - set(disponibles)
+    if faltantes:
+        raise ValueError(f"Faltan las columnas {sorted(faltantes)}. Columnas detectadas: {disponibles}")
+    columnas = [col for col in COLUMNAS_ACUMULADORES if col in disponibles]
+
+    print(f"Agregando '{interacciones}' por agente e intervalo...")
+    lado_interacciones = intervalos_interacciones(interacciones)
+
+    print(f"Uniendo con '{acumuladores}'...")
+    origenes = pd.Series(0, index=list(ORIGENES.values()))
+    filas = 0
+    with etapa("unir") as medicion:
+        chunks = intervalos_acumuladores(acumuladores, columnas)
+        for numero, unido in enumerate(unir(lado_interacciones, chunks, columnas)):
+            unido["Intervalo"] = unido["Intervalo"].dt.strftime("%d/%m/%Y %H:%M")
+            unido.to_csv(archivo_salida, sep=';', index=False, decimal=',', encoding='utf-8-sig',
+                         mode='w' if numero == 0 else 'a', header=numero == 0)
+            origenes = origenes.add(unido["Origen"].value_counts(), fill_value=0)
+            filas += len(unido)
+        medicion.salida(filas)
+
+    print(origenes.astype(int).to_string())
+    print(f"Estadísticas por intervalo guardadas en '{archivo_salida}' ({filas} filas).")
+
+
+if __name__ == '__main__':
+    main()
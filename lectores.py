@@ -0,0 +1,214 @@
+import gzip
+import io
+import os
+from contextlib import nullcontext
+from pathlib import Path
+
+import pandas as pd
+
+from config import LECTOR
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+except ImportError:  # Sin pyarrow solo queda el lector de pandas
+    pa = None
+    pv = None
+
+try:
+    import zstandard
+except ImportError:  # Los .zst se leen con pyarrow si está instalado
+    zstandard = None
+
+# Configuración
+chunksize = 100000
+BLOQUE = 8 * 1024 * 1024  # Bytes que pyarrow parsea por vez (cada hilo toma bloques de este tamaño)
+COMPRIMIDOS = (".gz", ".zst")
+
+# La variable de entorno LECTOR tiene prioridad sobre config.py
+lector_por_defecto = os.environ.get("LECTOR", LECTOR)
+
+# Valores que pandas lee como nulos por defecto; pyarrow usa los mismos para que los lotes coincidan
+NULOS = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"
+]
+
+
+def comprimido(fuente):
+    """Indica si la fuente es una exportación archivada comprimida (.csv.gz o .csv.zst)."""
+    return not hasattr(fuente, 'read') and Path(fuente).suffix.lower() in COMPRIMIDOS
+
+
+def ruta_derivada(archivo, sufijo):
+    """Archivo auxiliar al lado de la exportación ("x.csv" -> "x" + sufijo).
+
+    Los comprimidos conservan el nombre completo ("x.csv.gz" -> "x.csv.gz" + sufijo),
+    así las copias .gz y .zst del mismo mes no comparten ni se pisan el archivo.
+    """
+    ruta = Path(archivo)
+    if comprimido(ruta):
+        return ruta.with_name(ruta.name + sufijo)
+    return ruta.with_suffix(sufijo)
+
+
+def abrir(archivo):
+    """Abre el CSV en binario; los .gz y .zst se descomprimen al vuelo, sin archivos temporales."""
+    sufijo = Path(archivo).suffix.lower()
+    if sufijo == ".gz":
+        return gzip.open(archivo, 'rb')
+    if sufijo == ".zst":
+        if zstandard is not None:
+            return io.BufferedReader(zstandard.open(archivo, 'rb'))
+        if pa is not None:
+            return io.BufferedReader(pa.input_stream(archivo, compression='zstd'))
+        raise ValueError(f"Para leer '{archivo}' hace falta zstandard o pyarrow.")
+    return open(archivo, 'rb')
+
+
+def leer_encabezados(fuente):
+    """Encabezados del CSV (sin el BOM de utf-8-sig); de un archivo abierto se leen sin avanzar."""
+    if hasattr(fuente, 'read'):
+        posicion = fuente.tell()
+        linea = fuente.readline()
+        fuente.seek(posicion)
+    else:
+        with abrir(fuente) as file:
+            linea = file.readline()
+    return linea.decode('utf-8-sig').rstrip('\r\n').split(';')
+
+
+def _lector_pandas(fuente, columnas, chunksize, nombres):
+    """Parser de C de pandas, un chunk por vez en un solo hilo.
+
+    Los archivos sin comprimir se mapean en memoria (memory_map) en lugar de
+    leerse con copias a un búfer; los comprimidos y los archivos ya abiertos
+    (rangos del índice) se leen como flujo.
+    """
+    if comprimido(fuente):
+        with abrir(fuente) as file:
+            yield from _lector_pandas(file, columnas, chunksize, nombres)
+        return
+    yield from pd.read_csv(
+        fuente,
+        memory_map=not hasattr(fuente, 'read') and os.path.getsize(fuente) > 0,  # Un vacío no se puede mapear
+        sep=';',
+        header=None if nombres else 'infer',
+        names=nombres,
+        usecols=columnas,
+        dtype=str,
+        encoding='utf-8-sig',
+        chunksize=chunksize,
+        low_memory=False
+    )
+
+
+def _opciones_arrow(fuente, columnas, nombres):
+    if nombres is None:
+        nombres_archivo = leer_encabezados(fuente)
+    else:
+        nombres_archivo = list(nombres)
+    # Mismo orden que el archivo, como usecols de pandas
+    incluidas = nombres_archivo if columnas is None else [col for col in nombres_archivo if col in set(columnas)]
+    faltantes = set(columnas or ()) - set(nombres_archivo)
+    if faltantes:
+        raise ValueError(f"Las columnas {sorted(faltantes)} no están en el archivo. Encabezados: {nombres_archivo}")
+    return (
+        pv.ReadOptions(use_threads=True, block_size=BLOQUE, column_names=nombres, encoding='utf8'),
+        pv.ParseOptions(delimiter=';'),
+        pv.ConvertOptions(
+            include_columns=incluidas,
+            column_types={col: pa.string() for col in incluidas},
+            null_values=NULOS,
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=True
+        ),
+    )
+
+
+def _a_pandas(tabla, desde):
+    """Chunk de pandas con el índice que tendría leído por read_csv (numeración continua)."""
+    chunk = tabla.to_pandas()
+    chunk.index = pd.RangeIndex(desde, desde + len(chunk))
+    return chunk
+
+
+def _entrada_arrow(fuente):
+    """Fuente para pyarrow sin copias intermedias.
+
+    Los archivos sin comprimir se mapean en memoria: pyarrow corta líneas y campos
+    y saca las comillas de "0" directamente sobre el mapa, sin pasar por objetos
+    de Python. Los .gz y .zst se descomprimen al vuelo por bloques.
+    """
+    if hasattr(fuente, 'read'):
+        return nullcontext(fuente)  # El archivo abierto lo cierra quien lo abrió
+    if comprimido(fuente):
+        return pa.input_stream(fuente)
+    if os.path.getsize(fuente) == 0:  # Un archivo vacío no se puede mapear
+        return pa.BufferReader(b'')
+    return pa.memory_map(fuente)
+
+
+def _lector_arrow(fuente, columnas, chunksize, nombres):
+    """Lector de CSV de pyarrow: parsea el archivo entero en paralelo y lo entrega en chunks."""
+    lectura, parseo, conversion = _opciones_arrow(fuente, columnas, nombres)
+    with _entrada_arrow(fuente) as entrada:
+        tabla = pv.read_csv(entrada, read_options=lectura, parse_options=parseo, convert_options=conversion)
+    for desde in range(0, tabla.num_rows, chunksize):
+        yield _a_pandas(tabla.slice(desde, chunksize), desde)
+
+
+def _lector_streaming(fuente, columnas, chunksize, nombres):
+    """Lector por lotes de pyarrow: memoria acotada a unos bloques, reagrupados en chunks de 'chunksize' filas."""
+    lectura, parseo, conversion = _opciones_arrow(fuente, columnas, nombres)
+    lotes = []
+    filas = 0
+    desde = 0
+    with _entrada_arrow(fuente) as entrada, \
+            pv.open_csv(entrada, read_options=lectura, parse_options=parseo, convert_options=conversion) as lector:
+        for lote in lector:
+            lotes.append(lote)
+            filas += lote.num_rows
+            while filas >= chunksize:
+                tabla = pa.Table.from_batches(lotes)
+                yield _a_pandas(tabla.slice(0, chunksize), desde)
+                desde += chunksize
+                resto = tabla.slice(chunksize)
+                lotes = resto.to_batches()
+                filas = resto.num_rows
+    if filas:
+        yield _a_pandas(pa.Table.from_batches(lotes), desde)
+
+
+LECTORES = {
+    "pandas": _lector_pandas,
+    "arrow": _lector_arrow,
+    "streaming": _lector_streaming,
+}
+
+
+def leer_csv(fuente, columnas=None, chunksize=chunksize, lector=None, nombres=None):
+    """Lee un CSV ';' de las exportaciones en chunks de DataFrames con todas las columnas como texto.
+
+    'lector' elige el backend: "pandas" (parser de C, un hilo), "arrow" (pyarrow
+    multihilo, todo el archivo en memoria) o "streaming" (pyarrow por lotes).
+    Todos entregan los mismos chunks: mismas columnas en el orden del archivo,
+    texto con nulos donde pandas pondría NaN. 'nombres' se usa para datos sin
+    encabezado (rangos de bytes del índice). Sin pyarrow se usa pandas. Los
+    .csv.gz y .csv.zst se descomprimen al vuelo con cualquier lector.
+    """
+    lector = lector or lector_por_defecto
+    if lector not in LECTORES:
+        raise ValueError(f"Lector desconocido: '{lector}'. Opciones: {', '.join(LECTORES)}")
+    if lector != "pandas" and pv is None:
+        lector = "pandas"
+    columnas = list(columnas) if columnas is not None else None
+    return LECTORES[lector](fuente, columnas, chunksize, nombres)
+
+
+def leer_todo(fuente, columnas=None, lector=None, nombres=None):
+    """Lee el CSV completo en un solo DataFrame con el mismo backend que leer_csv."""
+    partes = list(leer_csv(fuente, columnas, lector=lector, nombres=nombres))
+    if not partes:
+        return pd.DataFrame(columns=columnas)
+    return pd.concat(partes, ignore_index=True)
@@ -0,0 +1,183 @@
+import argparse
+import re
+import struct
+from pathlib import Path
+
+import pandas as pd
+
+from medicion import etapa, medida
+
+try:
+    import xlsxwriter
+except ImportError:  # Sin xlsxwriter no se puede exportar el libro
+    xlsxwriter = None
+
+# Configuración
+archivo_libro = "estadisticas.xlsx"
+chunksize = 100000
+PATRONES = ["estadistica*", "Estadistica*", "clientes_repetidos*"]  # Reportes (.csv) y gráficos (.png) de una corrida
+FILAS_POR_HOJA = 1048575   # Límite de filas de Excel, sin contar el encabezado
+ALTO_FILA = 20             # Píxeles de una fila de Excel (para apilar gráficos)
+HOJA_GRAFICOS = "Gráficos"
+
+INVALIDOS_HOJA = re.compile(r"[\[\]:*?/\\]")
+PREFIJO_REPORTE = re.compile(r"^estad[ií]sticas?_", re.IGNORECASE)
+
+
+def tamanio_png(archivo):
+    """Ancho y alto en píxeles de un PNG (del encabezado IHDR)."""
+    with open(archivo, 'rb') as file:
+        encabezado = file.read(24)
+    return struct.unpack(">II", encabezado[16:24])
+
+
+def _filas(chunk):
+    """Filas del chunk como tuplas que xlsxwriter sabe escribir (NaN vacío, períodos como texto)."""
+    chunk = chunk.copy()
+    for columna in chunk.columns:
+        if isinstance(chunk[columna].dtype, (pd.PeriodDtype, pd.CategoricalDtype)):
+            chunk[columna] = chunk[columna].astype(str).where(chunk[columna].notna())
+    chunk = chunk.astype(object)
+    return chunk.where(chunk.notna(), None).itertuples(index=False, name=None)
+
+
+class Libro:
+    """Libro de Excel con un reporte por hoja, escrito en modo de memoria constante.
+
+    xlsxwriter pasa cada fila al disco en cuanto se escribe, así que cada hoja se
+    escribe completa, chunk por chunk, antes de empezar la siguiente y nunca está
+    todo el libro en memoria. Los gráficos van al lado de la tabla de su reporte;
+    los que no tienen reporte se juntan en la hoja "Gráficos" al cerrar.
+    """
+
+    def __init__(self, archivo=archivo_libro):
+        if xlsxwriter is None:
+            raise ValueError("Se necesita xlsxwriter para exportar el libro de Excel.")
+        self.archivo = archivo
+        self.libro = xlsxwriter.Workbook(archivo, {
+            "constant_memory": True,
+            "default_date_format": "dd/mm/yyyy",
+            "strings_to_numbers": False,
+            "strings_to_formulas": False,
+            "strings_to_urls": False,
+        })
+        self.negrita = self.libro.add_format({"bold": True})
+        self.nombres = set()
+        self.graficos = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *error):
+        self.cerrar()
+
+    def _nombre_hoja(self, nombre):
+        """Nombre válido para Excel (31 caracteres, sin []:*?/\\) y que no se repita en el libro."""
+        base = INVALIDOS_HOJA.sub("_", PREFIJO_REPORTE.sub("", nombre))[:31] or "Hoja"
+        candidato = base
+        numero = 2
+        while candidato.lower() in self.nombres:
+            sufijo = f" ({numero})"
+            candidato = base[:31 - len(sufijo)] + sufijo
+            numero += 1
+        self.nombres.add(candidato.lower())
+        return candidato
+
+    def _nueva_hoja(self, nombre, columnas):
+        hoja = self.libro.add_worksheet(self._nombre_hoja(nombre))
+        for i, columna in enumerate(columnas):
+            hoja.set_column(i, i, max(10, len(str(columna)) + 2))
+        hoja.write_row(0, 0, [str(columna) for columna in columnas], self.negrita)
+        hoja.freeze_panes(1, 0)
+        return hoja
+
+    def agregar(self, nombre, chunks, grafico=None):
+        """Escribe un reporte (DataFrame o chunks de DataFrames) en una hoja nueva y devuelve las filas.
+
+        Si pasa el límite de filas de Excel sigue en hojas "nombre (2)", "nombre (3)"...
+        """
+        if isinstance(chunks, pd.DataFrame):
+            chunks = [chunks]
+        hoja = None
+        fila = 0
+        filas = 0
+        for chunk in chunks:
+            if hoja is None:
+                columnas = list(chunk.columns)
+                hoja = self._nueva_hoja(nombre, columnas)
+                if grafico is not None:
+                    hoja.insert_image(0, len(columnas) + 1, str(grafico))
+            for valores in _filas(chunk):
+                if fila == FILAS_POR_HOJA:
+                    hoja = self._nueva_hoja(nombre, columnas)
+                    fila = 0
+                fila += 1
+                hoja.write_row(fila, 0, valores)
+            filas += len(chunk)
+        return filas
+
+    def agregar_csv(self, archivo, grafico=None):
+        """Copia un reporte CSV ';' a una hoja leyéndolo por chunks."""
+        chunks = pd.read_csv(archivo, sep=';', encoding='utf-8-sig', chunksize=chunksize)
+        return self.agregar(Path(archivo).stem, chunks, grafico)
+
+    def agregar_grafico(self, archivo):
+        """Deja un gráfico sin reporte para la hoja de gráficos."""
+        self.graficos.append(str(archivo))
+
+    def cerrar(self):
+        """Escribe la hoja de gráficos (uno debajo del otro) y cierra el archivo."""
+        if self.graficos:
+            hoja = self.libro.add_worksheet(self._nombre_hoja(HOJA_GRAFICOS))
+            fila = 0
+            for grafico in self.graficos:
+                hoja.write(fila, 0, Path(grafico).name, self.negrita)
+                hoja.insert_image(fila + 1, 0, grafico)
+                fila += 3 + -(-tamanio_png(grafico)[1] // ALTO_FILA)
+            self.graficos = []
+        self.libro.close()
+
+
+def listar_reportes(carpeta="."):
+    """Reportes CSV y gráficos PNG de la carpeta (PATRONES), sin repetir."""
+    return sorted({
+        str(ruta) for patron in PATRONES for extension in (".csv", ".png")
+        for ruta in Path(carpeta).glob(patron + extension)
+    })
+
+
+@medida
+def exportar(archivos, salida=archivo_libro):
+    """Junta los reportes CSV en un libro, una hoja por reporte con su gráfico (mismo nombre, .png)."""
+    csvs = [Path(archivo) for archivo in archivos if Path(archivo).suffix.lower() == ".csv"]
+    pngs = {Path(archivo).stem: Path(archivo) for archivo in archivos if Path(archivo).suffix.lower() == ".png"}
+    with Libro(salida) as libro:
+        for archivo in csvs:
+            grafico = pngs.pop(archivo.stem, archivo.with_suffix(".png"))
+            with etapa(f"hoja {archivo.name}") as medicion:
+                filas = libro.agregar_csv(archivo, grafico if grafico.exists() else None)
+                medicion.salida(filas)
+        for grafico in pngs.values():
+            libro.agregar_grafico(grafico)
+    return len(csvs)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Exporta los reportes CSV (y sus gráficos .png) a un solo libro de Excel, una hoja por reporte."
+    )
+    parser.add_argument("archivos", nargs="*",
+                        help=f"CSV y PNG a incluir (por defecto: {', '.join(PATRONES)} de la carpeta actual).")
+    parser.add_argument("--salida", default=archivo_libro, help="Libro de Excel a generar.")
+    args = parser.parse_args()
+
+    archivos = args.archivos or listar_reportes()
+    if not archivos:
+        print("No se encontraron reportes para exportar.")
+        return
+    hojas = exportar(archivos, args.salida)
+    print(f"Libro guardado en '{args.salida}' ({hojas} reportes).")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+import atexit
+import cProfile
+import functools
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from config import ARCHIVO_MEDICION, ARCHIVO_PERFIL
+
+try:
+    import resource
+except ImportError:  # En Windows no hay getrusage: la memoria queda en None
+    resource = None
+
+# Las variables de entorno MEDICION y PERFIL tienen prioridad sobre config.py
+archivo_medicion = os.environ.get("MEDICION", ARCHIVO_MEDICION)
+archivo_perfil = os.environ.get("PERFIL", ARCHIVO_PERFIL)
+ACTIVA = bool(archivo_medicion)
+
+# Totales por etapa, en el orden en que aparecen
+etapas = {}
+_inicio = time.perf_counter()
+
+
+def memoria_pico_mb():
+    """Pico de memoria residente del proceso hasta ahora (MB)."""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss viene en KB en Linux y en bytes en macOS
+    return round(pico / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class Etapa:
+    """Acumula tiempo, filas, chunks y memoria de todas las ejecuciones de una etapa.
+
+    ru_maxrss es el pico de todo el proceso: después de una etapa pesada todas
+    las siguientes verían el mismo valor. Por eso cada etapa guarda cuánto subió
+    ese pico mientras corría (0 si no pasó el pico anterior) y, aparte, el pico
+    del proceso al terminar.
+    """
+
+    def __init__(self, nombre):
+        self.nombre = nombre
+        self.llamadas = 0
+        self.segundos = 0.0
+        self.filas_entrada = 0
+        self.filas_salida = 0
+        self.chunks = 0
+        self.memoria_aumento_pico_mb = None
+        self.memoria_pico_proceso_mb = None
+        self._desde = None
+        self._pico_desde = None
+
+    def __enter__(self):
+        self._desde = time.perf_counter()
+        self._pico_desde = memoria_pico_mb()
+        return self
+
+    def __exit__(self, *excepcion):
+        self.segundos += time.perf_counter() - self._desde
+        self.llamadas += 1
+        self.memoria_pico_proceso_mb = memoria_pico_mb()
+        if self.memoria_pico_proceso_mb is not None:
+            aumento = self.memoria_pico_proceso_mb - self._pico_desde
+            self.memoria_aumento_pico_mb = round((self.memoria_aumento_pico_mb or 0) + aumento, 1)
+        return False
+
+    def entrada(self, filas):
+        self.filas_entrada += filas
+
+    def salida(self, filas):
+        self.filas_salida += filas
+
+    def a_dict(self):
+        return {
+            "etapa": self.nombre,
+            "llamadas": self.llamadas,
+            "segundos": round(self.segundos, 4),
+            "filas_entrada": self.filas_entrada,
+            "filas_salida": self.filas_salida,
+            "chunks": self.chunks,
+            "memoria_aumento_pico_mb": self.memoria_aumento_pico_mb,
+            "memoria_pico_proceso_mb": self.memoria_pico_proceso_mb,
+        }
+
+
+class _EtapaInactiva:
+    """Reemplazo sin costo de Etapa cuando la medición está apagada."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        return False
+
+    def entrada(self, filas):
+        pass
+
+    def salida(self, filas):
+        pass
+
+
+_INACTIVA = _EtapaInactiva()
+
+
+def etapa(nombre):
+    """Context manager que mide un bloque: 'with etapa("parsear_fechas") as e: ... e.salida(len(df))'."""
+    if not ACTIVA:
+        return _INACTIVA
+    if nombre not in etapas:
+        etapas[nombre] = Etapa(nombre)
+    return etapas[nombre]
+
+
+def _filas(valor):
+    """Filas de un DataFrame/Series, o de todos los de una tupla (p. ej. mensual y diaria)."""
+    if isinstance(valor, tuple):
+        return sum(_filas(v) for v in valor)
+    return len(valor) if hasattr(valor, "shape") else 0
+
+
+def medida(funcion):
+    """Decorador que mide cada llamada a la función como una etapa con su nombre.
+
+    Con la medición apagada devuelve la función sin envolver.
+    """
+    if not ACTIVA:
+        return funcion
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        with etapa(funcion.__name__) as medicion:
+            medicion.entrada(sum(_filas(arg) for arg in args))
+            resultado = funcion(*args, **kwargs)
+            medicion.salida(_filas(resultado))
+        return resultado
+    return envoltura
+
+
+def iterar(nombre, chunks):
+    """Envuelve un iterador de chunks midiendo el tiempo de producir cada uno (lectura, descompresión)."""
+    if not ACTIVA:
+        return chunks
+
+    def medidos():
+        iterador = iter(chunks)
+        medicion = etapa(nombre)
+        while True:
+            with medicion:
+                chunk = next(iterador, None)
+            if chunk is None:
+                return
+            medicion.chunks += 1
+            medicion.salida(len(chunk))
+            yield chunk
+    return medidos()
+
+
+def resumen():
+    return {
+        "script": os.path.basename(sys.argv[0]),
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "segundos_totales": round(time.perf_counter() - _inicio, 4),
+        "memoria_pico_mb": memoria_pico_mb(),
+        "etapas": [medicion.a_dict() for medicion in etapas.values()],
+    }
+
+
+def _guardar():
+    datos = resumen()
+    with open(archivo_medicion, 'w', encoding='utf-8') as file:
+        json.dump(datos, file, ensure_ascii=False, indent=2)
+
+    print(f"\nMedición por etapa ({datos['segundos_totales']:.2f} s en total, guardada en '{archivo_medicion}'):")
+    for medicion in datos["etapas"]:
+        print(f"  {medicion['etapa']:<40} {medicion['segundos']:>9.3f} s  {medicion['chunks']:>5} chunks  "
+              f"{medicion['filas_entrada']:>10} -> {medicion['filas_salida']:<10} "
+              f"+{medicion['memoria_aumento_pico_mb']} MB (pico del proceso {medicion['memoria_pico_proceso_mb']} MB)")
+
+
+if ACTIVA:
+    atexit.register(_guardar)
+
+if archivo_perfil:
+    _perfil = cProfile.Profile()
+    _perfil.enable()
+
+    def _guardar_perfil():
+        _perfil.disable()
+        _perfil.dump_stats(archivo_perfil)
+        print(f"Perfil guardado en '{archivo_perfil}' (ver con: python -m pstats {archivo_perfil})")
+
+    atexit.register(_guardar_perfil)
@@ -0,0 +1,502 @@
+import numpy as np
+import pandas as pd
+
+from aproximados import DigestoCuantiles, HyperLogLog
+from cache import cache_valido, iterar_cache
+from config import ARCHIVO_CUARENTENA, DEDUPLICAR, EQUIPOS, FUERA_DE_HORARIO
+from deduplicacion import ConjuntoIds, informar_duplicados
+from indice import IndiceEnConstruccion, leer_indice, leer_rango
+from lectores import comprimido, leer_csv
+from medicion import etapa, iterar, medida
+from parseo_fechas import guardar_cuarentena, informar_invalidos, parsear_inicio
+from turnos import NOMBRES_TURNO, clasificar_turno
+
+# Configuración
+archivo_entrada = "datos.csv"
+chunksize = 100000
+modo_exacto = False  # True: percentiles y clientes distintos exactos (solo para archivos chicos)
+COMPACTAR_CADA = 50  # Parciales por turno que se juntan antes de sumarlos en uno
+
+# Agentes del reporte por turno (origenXagenteDiana.py)
+agentes_turnos = EQUIPOS["Diana"]
+
+# Los CSV por turno originales (pd.cut con bins [0, 9, 15, 21, 24]) traían también
+# Madrugada y Noche, siempre en 0; se mantienen para no correr las columnas de las planillas
+TURNOS_VACIOS = ("Madrugada", "Noche")
+
+
+def columnas_por_turno(renombrar):
+    """Columnas de los CSV por agente y turno, en el orden original."""
+    return ["Nombre Agente", TURNOS_VACIOS[0], *renombrar.values(), TURNOS_VACIOS[1]]
+
+
+class Acumulador:
+    """Reporte que se alimenta chunk a chunk desde el motor."""
+
+    # Columnas del CSV que necesita el reporte
+    columnas = ()
+    # Indica si el reporte usa la columna "FechaHora" (Inicio ya convertido)
+    usa_fecha = False
+
+    def procesar(self, chunk):
+        raise NotImplementedError
+
+    def combinar(self, otro):
+        """Suma el estado de otro acumulador del mismo tipo (p. ej. de otro archivo)."""
+        raise NotImplementedError
+
+    def resultado(self):
+        raise NotImplementedError
+
+
+class CortesPorAgente(Acumulador):
+    """Cantidad de cortes hechos por el agente (origenXagente.py)."""
+
+    columnas = ("Nombre Agente", "Origen Corte")
+
+    def __init__(self):
+        self.conteo = {}
+
+    def procesar(self, chunk):
+        chunk_filtrado = chunk[
+            (chunk["Nombre Agente"].notna()) &
+            (chunk["Origen Corte"] == "Agente")
+        ]
+        conteo = chunk_filtrado["Nombre Agente"].value_counts().to_dict()
+        for agente, cantidad in conteo.items():
+            self.conteo[agente] = self.conteo.get(agente, 0) + cantidad
+
+    def combinar(self, otro):
+        for agente, cantidad in otro.conteo.items():
+            self.conteo[agente] = self.conteo.get(agente, 0) + cantidad
+
+    def resultado(self):
+        df_resultado = pd.DataFrame(
+            {"Nombre Agente": self.conteo.keys(), "Cantidad de Cortes": self.conteo.values()}
+        )
+        # Añadir fila con el total de cortes
+        total_cortes = df_resultado["Cantidad de Cortes"].sum()
+        return pd.concat(
+            [df_resultado, pd.DataFrame({"Nombre Agente": ["Total"], "Cantidad de Cortes": [total_cortes]})],
+            ignore_index=True
+        )
+
+
+class CortesPorAgenteDiarios(Acumulador):
+    """Cortes del agente por día en formato dd/mm (origenXagenteDiaria.py)."""
+
+    columnas = ("Nombre Agente", "Origen Corte", "Inicio")
+    usa_fecha = True
+
+    def __init__(self):
+        self.parciales = []
+
+    def procesar(self, chunk):
+        chunk = chunk[
+            (chunk["Nombre Agente"].notna()) &
+            (chunk["Origen Corte"] == "Agente") &
+            (chunk["FechaHora"].notna())
+        ]
+        fecha = chunk["FechaHora"].dt.strftime("%d/%m").rename("Fecha")
+        self.parciales.append(chunk.groupby([chunk["Nombre Agente"], fecha]).size())
+
+    def combinar(self, otro):
+        self.parciales.extend(otro.parciales)
+
+    def resultado(self):
+        if not self.parciales:
+            return pd.DataFrame(columns=["Nombre Agente", "Fecha", "Cantidad de Cortes"])
+        conteo = pd.concat(self.parciales).groupby(level=["Nombre Agente", "Fecha"]).sum()
+        return conteo.reset_index(name="Cantidad de Cortes")
+
+
+class _ConteoPorTurno(Acumulador):
+    """Base de los conteos por agente y turno (Mañana/Tarde, más Madrugada y Noche en 0)."""
+
+    columnas = ("Nombre Agente", "Inicio")
+    usa_fecha = True
+    nombre_valor = "Cantidad"
+    renombrar = {}
+
+    def __init__(self):
+        self.parciales = []
+
+    def filtrar(self, chunk):
+        return chunk[chunk["Nombre Agente"].notna() & chunk["FechaHora"].notna()]
+
+    def procesar(self, chunk):
+        chunk = self.filtrar(chunk)
+        turno = clasificar_turno(chunk["FechaHora"])
+        # Filtrar solo turnos válidos (mañana y tarde)
+        validos = turno.notna() & (turno != FUERA_DE_HORARIO)
+        chunk, turno = chunk[validos], turno[validos]
+        conteo = chunk.groupby([chunk["Nombre Agente"], turno], observed=False).size()
+        self.parciales.append(conteo.reset_index(name=self.nombre_valor))
+        # Con muchos chunks chicos (modo en vivo) se suman de a tandas para que resultado() no crezca
+        if len(self.parciales) >= COMPACTAR_CADA:
+            self.parciales = [
+                pd.concat(self.parciales)
+                .groupby(["Nombre Agente", "Turno"], observed=False)[self.nombre_valor].sum()
+                .reset_index()
+            ]
+
+    def combinar(self, otro):
+        self.parciales.extend(otro.parciales)
+
+    def resultado(self):
+        if not self.parciales:
+            return pd.DataFrame(columns=columnas_por_turno(self.renombrar))
+        df_resultado = pd.concat(self.parciales)
+        df_resumen = df_resultado.pivot_table(
+            index="Nombre Agente",
+            columns="Turno",
+            values=self.nombre_valor,
+            aggfunc="sum",
+            fill_value=0,
+            observed=False
+        ).reset_index()
+        df_resumen.rename(columns=self.renombrar, inplace=True)
+        # Un turno sin filas todavía (p. ej. en vivo, antes de la tarde) queda en cero
+        return df_resumen.reindex(columns=columnas_por_turno(self.renombrar), fill_value=0)
+
+
+class CortesPorAgenteTurno(_ConteoPorTurno):
+    """Cortes del agente por turno, opcionalmente para una lista de agentes (origenXagenteDiana.py)."""
+
+    columnas = ("Nombre Agente", "Origen Corte", "Inicio")
+    nombre_valor = "Cantidad de Cortes"
+    renombrar = {"Mañana": "Cortes Turno Mañana", "Tarde": "Cortes Turno Tarde"}
+
+    def __init__(self, agentes=None):
+        super().__init__()
+        self.agentes = agentes
+
+    def filtrar(self, chunk):
+        if self.agentes is not None:
+            chunk = chunk[chunk["Nombre Agente"].isin(self.agentes)]
+        chunk = super().filtrar(chunk)
+        return chunk[chunk["Origen Corte"] == "Agente"]
+
+
+class LlamadasLargasPorTurno(_ConteoPorTurno):
+    """Llamadas con TalkingTime mayor al umbral por agente y turno (mayora_1Min.py)."""
+
+    columnas = ("Nombre Agente", "TalkingTime", "Inicio")
+    nombre_valor = "Llamadas Largas"
+    renombrar = {"Mañana": "Llamadas Largas Mañana", "Tarde": "Llamadas Largas Tarde"}
+
+    def __init__(self, umbral=60):
+        super().__init__()
+        self.umbral = umbral
+
+    def filtrar(self, chunk):
+        chunk = super().filtrar(chunk)
+        return chunk[pd.to_numeric(chunk["TalkingTime"], errors="coerce") > self.umbral]
+
+
+class RangoFechas(Acumulador):
+    """Fecha mínima y máxima de 'Inicio' (fecha.py)."""
+
+    columnas = ("Inicio",)
+    usa_fecha = True
+
+    def __init__(self):
+        self.fecha_min = None
+        self.fecha_max = None
+
+    def procesar(self, chunk):
+        min_chunk = chunk["FechaHora"].min()
+        max_chunk = chunk["FechaHora"].max()
+        if pd.notna(min_chunk) and (self.fecha_min is None or min_chunk < self.fecha_min):
+            self.fecha_min = min_chunk
+        if pd.notna(max_chunk) and (self.fecha_max is None or max_chunk > self.fecha_max):
+            self.fecha_max = max_chunk
+
+    def combinar(self, otro):
+        for fecha in (otro.fecha_min, otro.fecha_max):
+            if fecha is not None:
+                self.procesar(pd.DataFrame({"FechaHora": [fecha]}))
+
+    def resultado(self):
+        return self.fecha_min, self.fecha_max
+
+
+class AgregadoDiario(Acumulador):
+    """Cantidad de interacciones y TalkingTime por día, agente, turno, Origen Corte y Tipificación."""
+
+    columnas = ("Nombre Agente", "Origen Corte", "Tipificación", "TalkingTime", "Inicio")
+    usa_fecha = True
+    claves = ["Fecha", "Nombre Agente", "Turno", "Origen Corte", "Tipificación"]
+
+    def __init__(self):
+        self.parciales = []
+
+    def procesar(self, chunk):
+        chunk = chunk[chunk["FechaHora"].notna()]
+        agrupado = pd.DataFrame({
+            "Fecha": chunk["FechaHora"].dt.strftime("%Y-%m-%d"),
+            "Nombre Agente": chunk["Nombre Agente"],
+            "Turno": clasificar_turno(chunk["FechaHora"]).astype(str),
+            "Origen Corte": chunk["Origen Corte"],
+            "Tipificación": chunk["Tipificación"],
+            "TalkingTime": pd.to_numeric(chunk["TalkingTime"], errors="coerce").fillna(0),
+        }).groupby(self.claves, dropna=False)["TalkingTime"].agg(Cantidad="size", TalkingTime="sum")
+        self.parciales.append(agrupado)
+
+    def combinar(self, otro):
+        self.parciales.extend(otro.parciales)
+
+    def resultado(self):
+        if not self.parciales:
+            return pd.DataFrame(columns=[*self.claves, "Cantidad", "TalkingTime"])
+        agregado = pd.concat(self.parciales).groupby(level=self.claves, dropna=False).sum()
+        return agregado.reset_index()
+
+
+class PercentilesPorAgenteTurno(Acumulador):
+    """Percentiles de TalkingTime y Duración por agente y turno, con memoria fija salvo en modo exacto."""
+
+    columnas = ("Nombre Agente", "TalkingTime", "Duración", "Inicio")
+    usa_fecha = True
+    metricas = ("TalkingTime", "Duración")
+    cuantiles = (0.5, 0.9, 0.99)
+
+    def __init__(self, exacto=False, error_relativo=0.01):
+        self.exacto = exacto
+        self.error_relativo = error_relativo
+        # (agente, turno, métrica) -> DigestoCuantiles, o lista de valores en modo exacto
+        self.grupos = {}
+
+    def procesar(self, chunk):
+        chunk = chunk[chunk["Nombre Agente"].notna() & chunk["FechaHora"].notna()]
+        turno = clasificar_turno(chunk["FechaHora"]).astype(str).to_numpy()
+        agente = chunk["Nombre Agente"].to_numpy()
+        modelo = DigestoCuantiles(self.error_relativo)
+
+        for metrica in self.metricas:
+            valores = pd.to_numeric(chunk[metrica], errors="coerce").to_numpy(dtype=float)
+            validos = ~np.isnan(valores)
+            if not validos.any():
+                continue
+            valores = valores[validos]
+            # Los baldes se calculan una sola vez para todo el chunk
+            indices = None if self.exacto else modelo.indices(valores)
+            posiciones = pd.Series(valores).groupby([agente[validos], turno[validos]]).indices
+            for (nombre, nombre_turno), pos in posiciones.items():
+                clave = (nombre, nombre_turno, metrica)
+                if self.exacto:
+                    self.grupos.setdefault(clave, []).append(valores[pos])
+                else:
+                    digesto = self.grupos.setdefault(clave, DigestoCuantiles(self.error_relativo))
+                    digesto.agregar_indices(indices[pos], valores[pos].max())
+
+    def combinar(self, otro):
+        for clave, grupo in otro.grupos.items():
+            if clave not in self.grupos:
+                self.grupos[clave] = grupo
+            elif self.exacto:
+                self.grupos[clave].extend(grupo)
+            else:
+                self.grupos[clave].combinar(grupo)
+
+    def _resumen(self, grupo):
+        if self.exacto:
+            valores = np.concatenate(grupo)
+            return len(valores), [np.quantile(valores, q) for q in self.cuantiles], valores.max()
+        return grupo.cantidad, [grupo.cuantil(q) for q in self.cuantiles], grupo.maximo
+
+    def resultado(self):
+        filas = {}
+        for (agente, turno, metrica), grupo in self.grupos.items():
+            cantidad, percentiles, maximo = self._resumen(grupo)
+            fila = filas.setdefault((agente, turno), {"Nombre Agente": agente, "Turno": turno})
+            fila[f"Cantidad {metrica}"] = cantidad
+            for q, valor in zip(self.cuantiles, percentiles):
+                fila[f"{metrica} p{round(q * 100)}"] = round(valor, 1)
+            fila[f"{metrica} Máximo"] = maximo
+        if not filas:
+            return pd.DataFrame(columns=["Nombre Agente", "Turno"])
+        df = pd.DataFrame(list(filas.values()))
+        df["Turno"] = pd.Categorical(df["Turno"], categories=NOMBRES_TURNO)
+        return df.sort_values(["Nombre Agente", "Turno"]).reset_index(drop=True)
+
+
+class ClientesDistintosPorAgente(Acumulador):
+    """Cantidad de números de 'Cliente' distintos por agente (HyperLogLog, o exacto para archivos chicos)."""
+
+    columnas = ("Nombre Agente", "Cliente")
+
+    def __init__(self, exacto=False, precision=14):
+        self.exacto = exacto
+        self.precision = precision
+        # agente -> HyperLogLog, o set de clientes en modo exacto
+        self.clientes = {}
+
+    def procesar(self, chunk):
+        chunk = chunk[chunk["Nombre Agente"].notna() & chunk["Cliente"].notna()]
+        if chunk.empty:
+            return
+        clientes = chunk["Cliente"].astype(str).to_numpy(dtype=object)
+        hashes = None if self.exacto else pd.util.hash_array(clientes, categorize=False)
+        for agente, pos in chunk.groupby("Nombre Agente").indices.items():
+            if self.exacto:
+                self.clientes.setdefault(agente, set()).update(clientes[pos])
+            else:
+                self.clientes.setdefault(agente, HyperLogLog(self.precision)).agregar_hashes(hashes[pos])
+
+    def combinar(self, otro):
+        for agente, clientes in otro.clientes.items():
+            if agente not in self.clientes:
+                self.clientes[agente] = clientes
+            elif self.exacto:
+                self.clientes[agente] |= clientes
+            else:
+                self.clientes[agente].combinar(clientes)
+
+    def resultado(self):
+        cantidades = {
+            agente: len(clientes) if self.exacto else clientes.estimar()
+            for agente, clientes in self.clientes.items()
+        }
+        return pd.DataFrame(
+            {"Nombre Agente": list(cantidades.keys()), "Clientes Distintos": list(cantidades.values())}
+        ).sort_values("Nombre Agente").reset_index(drop=True)
+
+
+def _leer_chunks(archivo, columnas, chunksize, invalidos, filtro=None):
+    """Lee los chunks desde el caché columnar si está al día, o desde el CSV."""
+    if cache_valido(archivo):
+        expresion = filtro.expresion_arrow() if filtro is not None else None
+        for chunk in iterar("leer_cache", iterar_cache(archivo, columnas, chunksize, filtro=expresion)):
+            # En el caché "Inicio" ya viene convertido
+            if "Inicio" in chunk.columns:
+                chunk["FechaHora"] = chunk["Inicio"]
+            if filtro is not None:
+                chunk = filtro.aplicar_fechas(chunk)
+            yield chunk
+        return
+
+    # Con un rango de fechas y un índice al día se leen solo los bloques que pueden coincidir
+    rango = filtro.rango() if filtro is not None else None
+    indice = leer_indice(archivo) if "Inicio" in columnas and not comprimido(archivo) else None
+    if indice is not None and rango is not None:
+        chunks = leer_rango(archivo, indice, columnas, *rango, chunksize=chunksize)
+    else:
+        chunks = leer_csv(archivo, columnas, chunksize)
+    # Sin índice, la lectura completa lo arma de paso para las consultas por rango que vengan
+    construccion = IndiceEnConstruccion(archivo) if indice is None and "Inicio" in columnas \
+        and not comprimido(archivo) else None
+
+    for chunk in iterar("leer_csv", chunks):
+        fechas = None
+        if construccion is not None:
+            with etapa("parsear_fechas") as medicion:
+                medicion.entrada(len(chunk))
+                fechas = parsear_inicio(chunk["Inicio"])
+                construccion.agregar(fechas)
+
+        # Filtrar primero por texto: solo se convierten las fechas de las filas que quedan
+        if filtro is not None:
+            with etapa("filtrar_texto") as medicion:
+                medicion.entrada(len(chunk))
+                chunk = filtro.aplicar_texto(chunk)
+                medicion.salida(len(chunk))
+
+        # Convertir "Inicio" una sola vez por chunk para todos los reportes
+        if "Inicio" in chunk.columns:
+            with etapa("parsear_fechas") as medicion:
+                medicion.entrada(len(chunk))
+                # Si ya se convirtieron para el índice, se alinean por número de fila
+                chunk["FechaHora"] = parsear_inicio(chunk["Inicio"]) if fechas is None else fechas
+                filas_invalidas = chunk[chunk["FechaHora"].isna()]
+                invalidos.append(len(filas_invalidas))
+                guardar_cuarentena(filas_invalidas.drop(columns="FechaHora"), ARCHIVO_CUARENTENA)
+            if filtro is not None:
+                with etapa("filtrar_fechas") as medicion:
+                    medicion.entrada(len(chunk))
+                    chunk = filtro.aplicar_fechas(chunk)
+                    medicion.salida(len(chunk))
+        yield chunk
+
+    if construccion is not None:
+        with etapa("indice"):
+            try:
+                construccion.guardar()
+            except OSError as e:  # Carpeta de solo lectura: se sigue sin índice
+                print(f"No se pudo guardar el índice de '{archivo}': {e}")
+
+
+@medida
+def procesar(archivo, acumuladores, chunksize=chunksize, filtro=None, ids=None):
+    """Lee el archivo una sola vez y entrega cada chunk a todos los acumuladores.
+
+    'filtro' (filtros.Filtro) se aplica durante la lectura, antes que los acumuladores.
+    'ids' (deduplicacion.ConjuntoIds) descarta las interacciones ya vistas; pasando
+    el mismo a varias llamadas se deduplica entre archivos. Con config.DEDUPLICAR y
+    sin 'ids' se usa uno solo para este archivo.
+    """
+    propio = ids is None and DEDUPLICAR
+    if propio:
+        ids = ConjuntoIds()
+
+    columnas = {col for acumulador in acumuladores for col in acumulador.columnas}
+    if any(acumulador.usa_fecha for acumulador in acumuladores):
+        columnas.add("Inicio")
+    if filtro is not None:
+        columnas |= filtro.columnas()
+    if ids is not None:
+        columnas.add("idInteraccion")
+
+    invalidos = []
+    for chunk in _leer_chunks(archivo, sorted(columnas), chunksize, invalidos, filtro):
+        if ids is not None:
+            with etapa("deduplicar") as medicion:
+                medicion.entrada(len(chunk))
+                chunk = chunk[ids.nuevos(chunk["idInteraccion"])]
+                medicion.salida(len(chunk))
+        for acumulador in acumuladores:
+            with etapa(f"acumular {type(acumulador).__name__}") as medicion:
+                medicion.entrada(len(chunk))
+                acumulador.procesar(chunk)
+
+    informar_invalidos(sum(invalidos), ARCHIVO_CUARENTENA)
+    if propio:
+        ids.cerrar()
+        informar_duplicados(ids)
+    return acumuladores
+
+
+def main():
+    """Genera en una sola pasada los CSV de origenXagente*, mayora_1Min y fecha."""
+    reportes = {
+        "estadisticas_agentes.csv": CortesPorAgente(),
+        "estadisticas_agentes_por_dia.csv": CortesPorAgenteDiarios(),
+        "estadisticas_agentes_turnos.csv": CortesPorAgenteTurno(agentes_turnos),
+        "estadisticas_llamadas_largas_turnos.csv": LlamadasLargasPorTurno(),
+        "estadisticas_percentiles_turnos.csv": PercentilesPorAgenteTurno(exacto=modo_exacto),
+        "estadisticas_clientes_distintos.csv": ClientesDistintosPorAgente(exacto=modo_exacto),
+    }
+    rango = RangoFechas()
+
+    print(f"Procesando '{archivo_entrada}'...")
+    procesar(archivo_entrada, [*reportes.values(), rango])
+
+    for archivo_salida, acumulador in reportes.items():
+        with etapa(f"resultado {type(acumulador).__name__}") as medicion:
+            resultado = acumulador.resultado()
+            medicion.salida(len(resultado))
+        with etapa("guardar_estadisticas") as medicion:
+            medicion.entrada(len(resultado))
+            resultado.to_csv(archivo_salida, sep=";", index=False)
+        print(f"Estadísticas guardadas en '{archivo_salida}'.")
+
+    fecha_min, fecha_max = rango.resultado()
+    if fecha_min is not None and fecha_max is not None:
+        print(f"La fecha más antigua en los datos es: {fecha_min.strftime('%d/%m/%Y')}")
+        print(f"La fecha más reciente en los datos es: {fecha_max.strftime('%d/%m/%Y')}")
+    else:
+        print("No se encontraron fechas válidas en los datos.")
+
+
+if __name__ == '__main__':
+    main()
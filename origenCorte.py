@@ -1,5 +1,15 @@
 import pandas as pd
-import matplotlib.pyplot as plt
+
+from cache import cache_valido, dias_en_cache, leer_cache
+from catalogo import resolver_columnas
+from config import ARCHIVO_CUARENTENA, DEDUPLICAR
+from deduplicacion import descartar_duplicados
+from esquema import tipar_con_diccionario
+from graficos import Grafico, barras_apiladas, renderizar
+from lectores import leer_todo
+from medicion import etapa, medida
+from parseo_fechas import guardar_cuarentena, informar_invalidos, parsear_inicio
+from turnos import clasificar_turno, columnas_horario
 
 # Rutas de entrada y salida
 archivo_csv = 'archivo.csv'
@@ -8,50 +18,63 @@ estadistica_diaria = 'estadistica_diaria.csv'
 grafico_mensual = 'estadistica_mensual.png'
 grafico_diario = 'estadistica_diaria.png'
 
-# Rango horario
-MANIANA = (9, 14.5)  # 14.5 representa 14:30
-TARDE = (15, 20)
-
-def detectar_columnas(archivo):
-    """Detecta los encabezados reales del archivo."""
+@medida
+def cargar_datos(archivo):
+    """Carga el CSV seleccionando dinámicamente las columnas necesarias."""
+    # Encabezados y columnas resueltas del catálogo: solo se relee el archivo si cambió
     try:
-        with open(archivo, 'r', encoding='utf-8-sig') as file:
-            encabezados = file.readline().strip().split(';')
-        return encabezados
+        encabezados, mapeo = resolver_columnas(archivo)
     except Exception as e:
         raise ValueError(f"No se pudieron detectar los encabezados: {e}")
-
-def cargar_datos(archivo):
-    """Carga el CSV seleccionando dinámicamente las columnas necesarias."""
-    encabezados = detectar_columnas(archivo)
-    columna_inicio = next((col for col in encabezados if 'Inicio' in col), None)
-    columna_origen = next((col for col in encabezados if 'Origen Corte' in col), None)
-    columna_tipificacion = next((col for col in encabezados if 'Tipificación' in col), None)
+    columna_inicio = mapeo['Inicio']
+    columna_origen = mapeo['Origen Corte']
+    columna_tipificacion = mapeo['Tipificación']
 
     if not columna_inicio or not columna_origen or not columna_tipificacion:
         raise ValueError(f"Las columnas necesarias no fueron encontradas. Encabezados detectados: {encabezados}")
 
+    columnas = [columna_inicio, columna_origen, columna_tipificacion]
+    if DEDUPLICAR:
+        columnas.append("idInteraccion")
+
     try:
-        df = pd.read_csv(
-            archivo, 
-            delimiter=';', 
-            usecols=[columna_inicio, columna_origen, columna_tipificacion], 
-            encoding='utf-8-sig'
-        )
+        if cache_valido(archivo):
+            # Leer del caché columnar solo estas columnas y los días de diciembre
+            dias = [dia for dia in dias_en_cache(archivo) if dia.month == 12]
+            with etapa("leer_cache") as medicion:
+                df = leer_cache(archivo, columnas=columnas, dias=dias)
+                medicion.salida(len(df))
+        else:
+            with etapa("read_csv") as medicion:
+                df = leer_todo(archivo, columnas)
+                medicion.salida(len(df))
         df.rename(columns={
             columna_inicio: 'Inicio',
             columna_origen: 'Origen Corte',
             columna_tipificacion: 'Tipificación'
         }, inplace=True)
 
-        # Convertir la columna 'Inicio' al formato correcto
-        df['Inicio'] = pd.to_datetime(df['Inicio'], format='%d/%m/%Y %H:%M:%S', errors='coerce')
-
-        # Filtrar registros inválidos
-        registros_invalidos = df[df['Inicio'].isna()]
-        if not registros_invalidos.empty:
-            print(f"Registros con fechas inválidas: {len(registros_invalidos)}")
-            print(registros_invalidos)
+        if DEDUPLICAR:
+            with etapa("deduplicar") as medicion:
+                medicion.entrada(len(df))
+                df = descartar_duplicados(df)
+                medicion.salida(len(df))
+
+        # Origen Corte y Tipificación como categóricas con los códigos del diccionario compartido
+        with etapa("tipar") as medicion:
+            medicion.entrada(len(df))
+            df = tipar_con_diccionario(df)
+
+        # Convertir la columna 'Inicio' al formato correcto (el caché ya la trae convertida)
+        if not pd.api.types.is_datetime64_any_dtype(df['Inicio']):
+            with etapa("parsear_fechas") as medicion:
+                medicion.entrada(len(df))
+                inicio = parsear_inicio(df['Inicio'])
+                invalidos = inicio.isna()
+                # Informar solo la cantidad; las filas van al archivo de cuarentena si está configurado
+                informar_invalidos(int(invalidos.sum()), ARCHIVO_CUARENTENA)
+                guardar_cuarentena(df[invalidos], ARCHIVO_CUARENTENA)
+                df['Inicio'] = inicio
 
         # Filtrar solo datos de diciembre
         df = df.dropna(subset=['Inicio'])
@@ -64,73 +87,43 @@ def cargar_datos(archivo):
     except Exception as e:
         raise ValueError(f"Error al cargar el archivo: {e}")
 
-def categorizar_horario(hora):
-    """Categoriza la hora en mañana o tarde."""
-    hora_decimal = hora.hour + hora.minute / 60
-    if MANIANA[0] <= hora_decimal <= MANIANA[1]:
-        return 'Mañana'
-    elif TARDE[0] <= hora_decimal <= TARDE[1]:
-        return 'Tarde'
-    else:
-        return 'Fuera de horario'
-
+@medida
 def calcular_estadisticas(df):
     """Calcula las estadísticas requeridas."""
     # Filtrar solo los cortes realizados por "Agente"
     df = df[df['Origen Corte'].str.strip().str.lower() == 'agente']
 
-    # Crear columna de horario (Mañana o Tarde)
-    df['Horario'] = df['Inicio'].apply(lambda x: categorizar_horario(x))
+    # Crear columna de horario (Mañana, Tarde o Fuera de horario, según config.TURNOS)
+    df['Horario'] = clasificar_turno(df['Inicio'])
 
     # Estadística mensual
     df['Mes'] = df['Inicio'].dt.to_period('M')
     mensual = df.groupby(['Mes']).Horario.value_counts().unstack(fill_value=0).reset_index()
-    mensual.rename(columns={'Mañana': 'Cantidad Mañana', 'Tarde': 'Cantidad Tarde'}, inplace=True)
+    mensual = columnas_horario(mensual, 'Mes')
 
     # Estadística diaria
     df['Fecha'] = df['Inicio'].dt.date
     diaria = df.groupby(['Fecha']).Horario.value_counts().unstack(fill_value=0).reset_index()
-    diaria.rename(columns={'Mañana': 'Cantidad Mañana', 'Tarde': 'Cantidad Tarde'}, inplace=True)
+    diaria = columnas_horario(diaria, 'Fecha')
 
     return mensual, diaria
 
-def agregar_valores_inicio_por_color(ax):
-    """Agrega valores al inicio de cada color (segmento) en las barras."""
-    for p in ax.patches:
-        x = p.get_x() + p.get_width() / 2.
-        y = p.get_y()  # Posición inicial del segmento
-        height = p.get_height()  # Altura del segmento
-
-        if height > 0:  # Mostrar solo para valores positivos
-            ax.annotate(f'{int(height)}', 
-                        (x, y), 
-                        ha='center', va='bottom', fontsize=10, color='black', xytext=(0, -5), 
-                        textcoords='offset points')
-
+@medida
 def generar_graficos(df_mensual, df_diario):
     """Genera gráficos de estadísticas mensuales y diarias con valores anotados."""
-    # Gráfico mensual
-    plt.figure(figsize=(10, 6))
-    ax = df_mensual.plot(x='Mes', y=['Cantidad Mañana', 'Cantidad Tarde'], kind='bar', stacked=True, legend=True)
-    agregar_valores_inicio_por_color(ax)
-    plt.title('Estadísticas Mensuales por Horario')
-    plt.ylabel('Cantidad')
-    plt.xlabel('Mes')
-    plt.tight_layout()
-    plt.savefig(grafico_mensual)
+    columnas = ['Cantidad Mañana', 'Cantidad Tarde']
+    renderizar([
+        Grafico(barras_apiladas, df_mensual[['Mes', *columnas]], grafico_mensual, x='Mes', y=columnas,
+                titulo='Estadísticas Mensuales por Horario', xlabel='Mes', ylabel='Cantidad',
+                figsize=(10, 6), anotar=True),
+        Grafico(barras_apiladas, df_diario[['Fecha', *columnas]], grafico_diario, x='Fecha', y=columnas,
+                titulo='Estadísticas Diarias por Horario', xlabel='Fecha', ylabel='Cantidad',
+                figsize=(12, 8), anotar=True),
+    ])
     print(f"Gráfico mensual guardado en: {grafico_mensual}")
-
-    # Gráfico diario
-    plt.figure(figsize=(12, 8))
-    ax = df_diario.plot(x='Fecha', y=['Cantidad Mañana', 'Cantidad Tarde'], kind='bar', stacked=True, legend=True)
-    agregar_valores_inicio_por_color(ax)
-    plt.title('Estadísticas Diarias por Horario')
-    plt.ylabel('Cantidad')
-    plt.xlabel('Fecha')
-    plt.tight_layout()
-    plt.savefig(grafico_diario)
     print(f"Gráfico diario guardado en: {grafico_diario}")
 
+@medida
 def guardar_estadisticas(df_mensual, df_diario):
     """Guarda las estadísticas en archivos CSV delimitados por ';'."""
     df_mensual.to_csv(estadistica_mensual, index=False, sep=';', encoding='utf-8-sig')
@@ -1,5 +1,6 @@
-import pandas as pd
-import matplotlib.pyplot as plt
+from graficos import Grafico, barras, mostrar, renderizar
+from medicion import etapa
+from motor import CortesPorAgente, procesar
 
 # Configuración
 archivo_entrada = "datos.csv"  # Cambia al nombre del archivo CSV
@@ -8,65 +9,24 @@ imagen_salida = "estadisticas_agentes.png"
 
 # Procesar el archivo en chunks
 chunksize = 100000  # Tamaño del chunk
-resultado = {}
+cortes = CortesPorAgente()
+procesar(archivo_entrada, [cortes], chunksize)
 
-for chunk in pd.read_csv(
-    archivo_entrada,
-    chunksize=chunksize,
-    sep=";",  # Usa el separador adecuado
-    usecols=["Nombre Agente", "Origen Corte"],  # Carga solo columnas relevantes
-    dtype={"Nombre Agente": str, "Origen Corte": str},  # Fuerza las columnas a ser tipo string
-    low_memory=False  # Previene advertencias de bajo uso de memoria
-):
-    # Filtrar datos según las condiciones
-    chunk_filtrado = chunk[
-        (chunk["Nombre Agente"].notna()) & 
-        (chunk["Origen Corte"] == "Agente")
-        #HORARIO MAÑANA O TARDE ("Inicio") = "turno elegido por el usuario"
-        #RANGO FECHA ("Inicio") MAYOR "RANGO INGRESADO MAYOT " ("INICIO") MENOR  "rango ingresado MENOR"
-    ]
-    # 10/11/2024
-    # 10/12/2024
-
-
-    # 1= MAÑANA
-    # 2= TARDE
-    # 3 = LO DO
-    # 4 - GENERAL
-
-
-    # Contar las veces que cada agente aparece
-    conteo = chunk_filtrado["Nombre Agente"].value_counts().to_dict()
-    
-    # Sumar los resultados al acumulador
-    for agente, cantidad in conteo.items():
-        resultado[agente] = resultado.get(agente, 0) + cantidad
-
-
-# Crear DataFrame con los resultados
-df_resultado = pd.DataFrame(
-    {"Nombre Agente": resultado.keys(), "Cantidad de Cortes": resultado.values()}
-)
-
-# Añadir fila con el total de cortes
-total_cortes = df_resultado["Cantidad de Cortes"].sum()
-df_resultado = pd.concat(
-    [df_resultado, pd.DataFrame({"Nombre Agente": ["Total"], "Cantidad de Cortes": [total_cortes]})],
-    ignore_index=True
-)
+# Crear DataFrame con los resultados (incluye la fila con el total de cortes)
+with etapa("calcular_estadisticas"):
+    df_resultado = cortes.resultado()
 
 # Guardar resultados en un CSV
-df_resultado.to_csv(archivo_salida, sep=";", index=False)
-
-# Generar gráfico
-plt.figure(figsize=(10, 6))
-plt.bar(df_resultado["Nombre Agente"][:-1], df_resultado["Cantidad de Cortes"][:-1])
-plt.title("Cortes por Agente")
-plt.xlabel("Nombre Agente")
-plt.ylabel("Cantidad de Cortes")
-plt.xticks(rotation=45, ha="right")
-plt.tight_layout()
-plt.savefig(imagen_salida)
-plt.show()
+with etapa("guardar_estadisticas"):
+    df_resultado.to_csv(archivo_salida, sep=";", index=False)
+
+# Generar gráfico (sin la fila del total)
+with etapa("generar_graficos"):
+    renderizar([
+        Grafico(barras, df_resultado[:-1], imagen_salida, x="Nombre Agente", y="Cantidad de Cortes",
+                titulo="Cortes por Agente", xlabel="Nombre Agente", ylabel="Cantidad de Cortes",
+                figsize=(10, 6)),
+    ])
+mostrar()
 
 print(f"Estadísticas guardadas en '{archivo_salida}' y gráfico en '{imagen_salida}'.")
@@ -0,0 +1,88 @@
+import copy
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from config import DEDUPLICAR
+from deduplicacion import ConjuntoIds, informar_duplicados
+from motor import CortesPorAgente, CortesPorAgenteDiarios, RangoFechas, procesar
+
+# Configuración
+carpeta_reportes = "Estadisticas Mejoradas/Reportes"
+procesos = os.cpu_count()
+
+
+def listar_archivos(carpeta):
+    """Lista los CSV de la carpeta, también los archivados .csv.gz y .csv.zst (sin el antiguo todos_los_archivos.csv)."""
+    return sorted(
+        str(ruta) for patron in ("*.csv", "*.csv.gz", "*.csv.zst") for ruta in Path(carpeta).glob(patron)
+        if ruta.name != "todos_los_archivos.csv"
+    )
+
+
+def _procesar_archivo(archivo, acumuladores):
+    """Tarea de cada proceso: agrega un archivo completo y devuelve los parciales."""
+    return procesar(archivo, acumuladores)
+
+
+def procesar_deduplicando(archivos, acumuladores):
+    """Agrega los archivos uno tras otro compartiendo el conjunto de idInteraccion vistos.
+
+    Las exportaciones que se superponen (diaria y semanal, reexportaciones) cuentan
+    cada interacción una sola vez. No se reparte en procesos: todos tienen que ver
+    el mismo conjunto.
+    """
+    ids = ConjuntoIds()
+    try:
+        for i, archivo in enumerate(archivos):
+            procesar(archivo, acumuladores, ids=ids)
+            print(f"Procesado: {archivo} ({i + 1}/{len(archivos)})")
+    finally:
+        ids.cerrar()
+    informar_duplicados(ids)
+    return acumuladores
+
+
+def procesar_en_paralelo(archivos, acumuladores, procesos=procesos):
+    """Agrega cada archivo por separado en un pool de procesos y combina los parciales.
+
+    Con config.DEDUPLICAR los archivos se procesan en secuencia (procesar_deduplicando).
+    """
+    if DEDUPLICAR:
+        return procesar_deduplicando(archivos, acumuladores)
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        tareas = [pool.submit(_procesar_archivo, archivo, copy.deepcopy(acumuladores)) for archivo in archivos]
+        for i, tarea in enumerate(tareas):
+            for total, parcial in zip(acumuladores, tarea.result()):
+                total.combinar(parcial)
+            print(f"Procesado: {archivos[i]} ({i + 1}/{len(archivos)})")
+    return acumuladores
+
+
+def main():
+    """Cortes por agente y por agente y día de todos los archivos, sin unirlos en un solo CSV."""
+    carpeta = sys.argv[1] if len(sys.argv) > 1 else carpeta_reportes
+    archivos = listar_archivos(carpeta)
+    if not archivos:
+        print(f"No se encontraron archivos CSV en '{carpeta}'.")
+        return
+
+    reportes = {
+        "estadisticas_agentes.csv": CortesPorAgente(),
+        "estadisticas_agentes_por_dia.csv": CortesPorAgenteDiarios(),
+    }
+    rango = RangoFechas()
+    procesar_en_paralelo(archivos, [*reportes.values(), rango])
+
+    for archivo_salida, acumulador in reportes.items():
+        acumulador.resultado().to_csv(archivo_salida, sep=";", index=False)
+        print(f"Estadísticas guardadas en '{archivo_salida}'.")
+
+    fecha_min, fecha_max = rango.resultado()
+    if fecha_min is not None and fecha_max is not None:
+        print(f"Datos desde {fecha_min.strftime('%d/%m/%Y')} hasta {fecha_max.strftime('%d/%m/%Y')}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Formato fijo de "Inicio": d/m/aaaa h:mm:ss (día, mes y hora pueden venir con 1 o 2 dígitos)
+PATRON_INICIO = r'^(\d{1,2})/(\d{1,2})/(\d{4}) (\d{1,2}):(\d{1,2}):(\d{1,2})$'
+
+# Valor int64 que numpy interpreta como NaT
+EPOCH_INVALIDO = np.iinfo(np.int64).min
+
+# Segundos desde epoch representables en datetime64[ns] (años 1678 a 2261, aprox.)
+MAX_NS_S = np.iinfo(np.int64).max // 10**9
+MIN_NS_S = -MAX_NS_S
+
+DIAS_POR_MES = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+
+
+def _dias_desde_epoch(anio, mes, dia):
+    """Días desde 1970-01-01 para arreglos de año, mes y día (calendario gregoriano)."""
+    anio = anio - (mes <= 2)
+    era = np.floor_divide(anio, 400)
+    anio_era = anio - era * 400
+    dia_anio = (153 * ((mes + 9) % 12) + 2) // 5 + dia - 1
+    dia_era = anio_era * 365 + anio_era // 4 - anio_era // 100 + dia_anio
+    return era * 146097 + dia_era - 719468
+
+
+def _parsear_unicos(valores):
+    """Convierte valores únicos de texto a segundos desde epoch (EPOCH_INVALIDO si no son válidos)."""
+    partes = pd.Series(valores, dtype=object).str.extract(PATRON_INICIO)
+    validos = partes.notna().all(axis=1).to_numpy().copy()
+    campos = partes.fillna(0).astype(np.int64).to_numpy()
+    dia, mes, anio, hora, minuto, segundo = campos.T
+
+    bisiesto = (anio % 4 == 0) & ((anio % 100 != 0) | (anio % 400 == 0))
+    mes_valido = (mes >= 1) & (mes <= 12)
+    dias_mes = DIAS_POR_MES[np.where(mes_valido, mes, 0)] + ((mes == 2) & bisiesto)
+    validos &= mes_valido & (dia >= 1) & (dia <= dias_mes)
+    validos &= (hora < 24) & (minuto < 60) & (segundo < 60)
+
+    epoch = _dias_desde_epoch(anio, mes, dia) * 86400 + hora * 3600 + minuto * 60 + segundo
+    # Fuera de ese rango la conversión a nanosegundos desborda y daría otra fecha
+    validos &= (epoch >= MIN_NS_S) & (epoch <= MAX_NS_S)
+    return np.where(validos, epoch, EPOCH_INVALIDO)
+
+
+def parsear_epoch(valores):
+    """Convierte valores de "Inicio" a segundos desde epoch, parseando cada valor distinto una sola vez."""
+    codigos, unicos = pd.factorize(np.asarray(valores, dtype=object))
+    epoch_unicos = _parsear_unicos(unicos)
+    # Se agrega un valor inválido al final para los nulos (código -1)
+    epoch_unicos = np.append(epoch_unicos, EPOCH_INVALIDO)
+    return epoch_unicos[codigos]
+
+
+def parsear_inicio(serie):
+    """Convierte la columna "Inicio" a datetime64 (NaT para los valores inválidos)."""
+    epoch = parsear_epoch(serie)
+    fechas = epoch.view("datetime64[s]").astype("datetime64[ns]")
+    return pd.Series(fechas, index=getattr(serie, "index", None), name=getattr(serie, "name", None))
+
+
+def guardar_cuarentena(filas, archivo_cuarentena):
+    """Agrega al archivo de cuarentena las filas con 'Inicio' inválido."""
+    if archivo_cuarentena is None or filas.empty:
+        return
+    nuevo = not os.path.exists(archivo_cuarentena)
+    filas.to_csv(archivo_cuarentena, mode='a', header=nuevo, index=False, sep=';',
+                 encoding='utf-8-sig' if nuevo else 'utf-8')
+
+
+def informar_invalidos(cantidad, archivo_cuarentena=None):
+    """Muestra un resumen de los registros con fechas inválidas (sin volcar las filas)."""
+    if not cantidad:
+        return
+    mensaje = f"Registros con fechas inválidas: {cantidad}"
+    if archivo_cuarentena is not None:
+        mensaje += f" (guardados en '{archivo_cuarentena}')"
+    print(mensaje)
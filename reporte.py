@@ -0,0 +1,110 @@
+import argparse
+from contextlib import nullcontext
+from pathlib import Path
+
+from catalogo import podar
+from config import DEDUPLICAR, EQUIPOS
+from deduplicacion import ConjuntoIds, informar_duplicados
+from filtros import Filtro
+from libro import Libro
+from motor import (
+    ClientesDistintosPorAgente, CortesPorAgente, CortesPorAgenteDiarios, CortesPorAgenteTurno,
+    LlamadasLargasPorTurno, PercentilesPorAgenteTurno, RangoFechas, procesar
+)
+from turnos import NOMBRES_TURNO
+
+# Reportes disponibles: nombre -> (archivo de salida, fábrica del acumulador)
+REPORTES = {
+    "cortes": ("estadisticas_agentes.csv", CortesPorAgente),
+    "diarios": ("estadisticas_agentes_por_dia.csv", CortesPorAgenteDiarios),
+    "turnos": ("estadisticas_agentes_turnos.csv", CortesPorAgenteTurno),
+    "llamadas_largas": ("estadisticas_llamadas_largas_turnos.csv", LlamadasLargasPorTurno),
+    "percentiles": ("estadisticas_percentiles_turnos.csv", PercentilesPorAgenteTurno),
+    "clientes": ("estadisticas_clientes_distintos.csv", ClientesDistintosPorAgente),
+}
+
+
+def _lista(texto):
+    """Convierte 'MZA 1, MZA 2' en ['MZA 1', 'MZA 2']."""
+    return [valor.strip() for valor in texto.split(',') if valor.strip()]
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        description="Genera reportes de interacciones filtrando durante la lectura."
+    )
+    parser.add_argument("--archivo", nargs="+", default=["datos.csv"],
+                        help="Exportaciones de interacciones (CSV ';'); con varias se saltean las que el "
+                             "catálogo dice que no pueden tener filas del filtro.")
+    parser.add_argument("--desde", help="Fecha inicial, dd/mm/aaaa o aaaa-mm-dd (incluida).")
+    parser.add_argument("--hasta", help="Fecha final, dd/mm/aaaa o aaaa-mm-dd (incluida).")
+    parser.add_argument("--turno", action="append", choices=NOMBRES_TURNO,
+                        help="Turno a incluir; se puede repetir.")
+    parser.add_argument("--agentes", type=_lista, help="Lista de agentes separados por coma.")
+    parser.add_argument("--equipo", choices=sorted(EQUIPOS), help="Equipo definido en config.EQUIPOS.")
+    parser.add_argument("--origen", type=_lista, help="Valores de 'Origen Corte' separados por coma.")
+    parser.add_argument("--tipificacion", type=_lista, help="Valores de 'Tipificación' separados por coma.")
+    parser.add_argument("--reportes", nargs="+", choices=sorted(REPORTES), default=["cortes"],
+                        help="Reportes a generar (por defecto: cortes).")
+    parser.add_argument("--deduplicar", action="store_true", default=DEDUPLICAR,
+                        help="Descartar interacciones con idInteraccion repetido.")
+    parser.add_argument("--libro", help="Además de los CSV, un libro de Excel con una hoja por reporte.")
+    return parser
+
+
+def main():
+    """Ejecuta los reportes pedidos con los filtros de la línea de comandos."""
+    args = crear_parser().parse_args()
+
+    agentes = list(args.agentes or [])
+    if args.equipo:
+        agentes += EQUIPOS[args.equipo]
+
+    filtro = Filtro(
+        desde=args.desde,
+        hasta=args.hasta,
+        turnos=args.turno,
+        agentes=agentes,
+        origenes=args.origen,
+        tipificaciones=args.tipificacion,
+    )
+    reportes = {REPORTES[nombre][0]: REPORTES[nombre][1]() for nombre in args.reportes}
+    rango = RangoFechas()
+
+    archivos = args.archivo
+    if len(archivos) > 1:
+        archivos = podar(archivos, filtro)
+        if len(archivos) < len(args.archivo):
+            print(f"Se saltean {len(args.archivo) - len(archivos)} de {len(args.archivo)} archivos "
+                  f"que no pueden tener interacciones del filtro (catálogo).")
+
+    ids = ConjuntoIds() if args.deduplicar else None
+    try:
+        for archivo in archivos:
+            print(f"Procesando '{archivo}'...")
+            procesar(archivo, [*reportes.values(), rango], filtro=filtro, ids=ids)
+    finally:
+        if ids is not None:
+            ids.cerrar()
+    if ids is not None:
+        informar_duplicados(ids)
+
+    with Libro(args.libro) if args.libro else nullcontext() as libro:
+        for archivo_salida, acumulador in reportes.items():
+            resultado = acumulador.resultado()
+            resultado.to_csv(archivo_salida, sep=";", index=False)
+            print(f"Estadísticas guardadas en '{archivo_salida}'.")
+            if libro is not None:
+                libro.agregar(Path(archivo_salida).stem, resultado)
+    if args.libro:
+        print(f"Libro guardado en '{args.libro}'.")
+
+    fecha_min, fecha_max = rango.resultado()
+    if fecha_min is None:
+        print("Ninguna interacción cumple los filtros.")
+    else:
+        print(f"Interacciones entre {fecha_min.strftime('%d/%m/%Y')} y {fecha_max.strftime('%d/%m/%Y')}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+COLUMNAS = ["Inicio", "idInteraccion", "Sentido", "Nombre Agente", "Cliente", "Duración", "TalkingTime", "ACW",
+            "Tipificación", "Origen Corte"]
+
+
+def escribir_interacciones(archivo, datos):
+    """Escribe un export "Detalle Interacciones" reducido con las columnas que usan los reportes."""
+    datos.reindex(columns=COLUMNAS).to_csv(archivo, sep=';', index=False, encoding='utf-8-sig')
+    return archivo
+
+
+@pytest.fixture
+def interacciones(tmp_path):
+    """Export chico: 3 días, 6 agentes (MZA 6 sin llamadas largas) y llamadas sin agente, fuera de horario."""
+    rng = np.random.default_rng(0)
+    n = 600
+    inicio = (pd.Timestamp("2025-02-17") + pd.to_timedelta(np.sort(rng.integers(0, 3 * 86400, n)), unit="s"))
+    atendida = rng.random(n) < 0.7
+    agente = rng.integers(1, 7, n)
+    talking = np.where(atendida, rng.integers(0, 200, n), 0)
+    talking = np.where(agente == 6, np.minimum(talking, 60), talking)
+    datos = pd.DataFrame({
+        "Inicio": [f"{f.day}/{f.month}/{f.year} {f:%H:%M:%S}" for f in inicio],
+        "idInteraccion": [f"{i:06d}_ACD" for i in range(n)],
+        "Sentido": np.where(rng.random(n) < 0.8, "Discador Predictivo", "Entrante"),
+        "Nombre Agente": np.where(atendida, [f"MZA {a}" for a in agente], None),
+        "Cliente": rng.integers(100, 160, n),
+        "Duración": talking + rng.integers(10, 40, n),
+        "TalkingTime": talking,
+        "ACW": np.where(atendida, rng.integers(0, 30, n), 0),
+        "Tipificación": np.where(atendida, np.where(rng.random(n) < 0.3, "Agendado por el Vdor", "Venta"),
+                                 "No Disp."),
+        "Origen Corte": np.where(rng.random(n) < 0.4, "Agente", "Cliente"),
+    })
+    return escribir_interacciones(tmp_path / "interacciones.csv", datos)
@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+from acumuladores import COLUMNAS_ACUMULADORES, MUESTRA, leer_acumuladores
+
+FILAS = MUESTRA + 200
+ANCHA = MUESTRA + 100   # Fila con más campos que la muestra y la holgura, después de la muestra
+
+
+def _fila(numero, corta):
+    valores = {"Intervalo": f"19/2/2025 {9 + numero % 12:02d}:00:00", "Agente": f"MZA {numero % 7}",
+               "Break": str(numero), "LogIn": str(2 * numero), "Auxiliar %": "0,5"}
+    campos = [valores.get(columna, "0") for columna in COLUMNAS_ACUMULADORES]
+    if numero == corta:
+        campos = campos[:COLUMNAS_ACUMULADORES.index("Auxiliar %")]
+    if numero == ANCHA:
+        campos += ["9"] * 30
+    # Encabezado cortado y ';' final, como en las exportaciones desparejas
+    return ";".join(campos) + ";"
+
+
+def _escribir(tmp_path, corta):
+    archivo = tmp_path / "acumuladores.csv"
+    lineas = [";".join(COLUMNAS_ACUMULADORES[:40]), *(_fila(numero, corta) for numero in range(FILAS))]
+    archivo.write_text("\n".join(lineas) + "\n", encoding="utf-8-sig")
+    return archivo
+
+
+# Sin fila corta la muestra es pareja y se lee con usecols; con una fila corta, con todos los campos
+@pytest.mark.parametrize("corta", [None, 5])
+def test_filas_desparejas_se_leen_completas(tmp_path, corta):
+    archivo = _escribir(tmp_path, corta)
+    chunks = list(leer_acumuladores(archivo, ["Break", "LogIn", "Auxiliar %"], chunksize=150))
+    datos = pd.concat(chunks, ignore_index=True)
+
+    assert list(datos.columns) == ["Intervalo", "Agente", "Break", "LogIn", "Auxiliar %"]
+    assert datos["Break"].tolist() == list(range(FILAS))
+    assert datos["LogIn"].tolist() == [2 * numero for numero in range(FILAS)]
+    assert datos["Agente"].iloc[ANCHA] == f"MZA {ANCHA % 7}"
+    completas = datos["Auxiliar %"].drop(corta) if corta is not None else datos["Auxiliar %"]
+    assert (completas == 0.5).all()
+    if corta is not None:
+        assert pd.isna(datos.loc[corta, "Auxiliar %"])
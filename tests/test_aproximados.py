@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from aproximados import DigestoCuantiles, HyperLogLog
+
+CUANTILES = [0.01, 0.25, 0.5, 0.9, 0.95, 0.99]
+
+
+@pytest.mark.parametrize("error", [0.01, 0.05])
+def test_cuantiles_dentro_del_error_relativo(error):
+    rng = np.random.default_rng(0)
+    # Como TalkingTime: muchos ceros y cola larga
+    valores = np.where(rng.random(50000) < 0.3, 0, rng.lognormal(3.5, 1.1, 50000).round())
+    digesto = DigestoCuantiles(error)
+    for parte in np.array_split(valores, 7):
+        digesto.agregar(parte)
+    for q in CUANTILES:
+        # El digesto devuelve el valor de la posición q * (n - 1), sin interpolar
+        real = np.quantile(valores, q, method="lower")
+        assert abs(digesto.cuantil(q) - real) <= error * real
+    assert digesto.cuantil(1) == valores.max()
+
+
+def test_combinar_es_como_agregar_todo():
+    rng = np.random.default_rng(1)
+    valores = rng.exponential(100, 10000)
+    todo, mitad, otra = DigestoCuantiles(), DigestoCuantiles(), DigestoCuantiles()
+    todo.agregar(valores)
+    mitad.agregar(valores[:3000])
+    otra.agregar(valores[3000:])
+    mitad.combinar(otra)
+    assert [mitad.cuantil(q) for q in CUANTILES] == [todo.cuantil(q) for q in CUANTILES]
+
+
+@pytest.mark.parametrize("distintos", [100, 5000, 200000])
+def test_hyperloglog_cerca_del_conteo_exacto(distintos):
+    rng = np.random.default_rng(distintos)
+    clientes = rng.choice(np.arange(10**9, 10**9 + distintos), 3 * distintos).astype(str)
+    hll, otro = HyperLogLog(), HyperLogLog()
+    hll.agregar(clientes[:distintos])
+    otro.agregar(clientes[distintos:])
+    hll.combinar(otro)
+    # Error típico 1,04 / sqrt(2**14) = 0,8 %; se admiten 4 desvíos
+    exacto = len(np.unique(clientes))
+    assert abs(hll.estimar() - exacto) <= 0.033 * exacto
@@ -0,0 +1,63 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from clientes import ClientesRepetidos
+
+
+@pytest.fixture
+def chunks():
+    rng = np.random.default_rng(0)
+    n = 4000
+    datos = pd.DataFrame({
+        "Cliente": [f"0{numero}" for numero in rng.integers(2610000000, 2610000400, n)],
+        "Nombre Agente": [f"MZA {a}" for a in rng.integers(1, 12, n)],
+        "Campaña": rng.choice(["MVS_MZA", "MVS_SJ"], n),
+        "Lote": rng.choice(["20250219_Mza", "20250220_Mza", None], n),
+        "TalkingTime": rng.integers(0, 300, n).astype(str),
+    })
+    return [datos.iloc[desde:desde + 500] for desde in range(0, n, 500)]
+
+
+def _acumular(chunks, **opciones):
+    acumulador = ClientesRepetidos(**opciones)
+    for chunk in chunks:
+        acumulador.procesar(chunk)
+    return acumulador
+
+
+def test_derrame_igual_que_en_memoria(chunks):
+    en_memoria = _acumular(chunks, particiones=4)
+    derramado = _acumular(chunks, presupuesto_mb=0.01, particiones=4)
+    try:
+        assert derramado.derrames and not en_memoria.derrames
+        carpeta = derramado.carpeta
+        esperado = en_memoria.resultado()
+        for _ in range(2):  # Las particiones siguen en disco hasta cerrar()
+            for obtenido, referencia in zip(derramado.resultado(), esperado):
+                pd.testing.assert_frame_equal(obtenido, referencia)
+    finally:
+        derramado.cerrar()
+    assert not os.path.exists(carpeta)
+
+    datos = pd.concat(chunks)
+    datos = datos[datos["TalkingTime"].astype(int) > 90]
+    contactos = datos.groupby(datos["Cliente"].astype(np.int64)).size()
+    resumen = esperado[0].set_index("Cliente")["Contactos"]
+    pd.testing.assert_series_equal(resumen.sort_index(), contactos[contactos >= 2].sort_index(),
+                                   check_names=False, check_index_type=False)
+
+
+def test_combinar_acumuladores_derramados(chunks):
+    esperado = _acumular(chunks, particiones=4).resultado()
+    primero = _acumular(chunks[:5], presupuesto_mb=0.01, particiones=4)
+    segundo = _acumular(chunks[5:], presupuesto_mb=0.01, particiones=4)
+    try:
+        primero.combinar(segundo)
+        for obtenido, referencia in zip(primero.resultado(), esperado):
+            pd.testing.assert_frame_equal(obtenido, referencia)
+    finally:
+        primero.cerrar()
+        segundo.cerrar()
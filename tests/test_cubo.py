@@ -0,0 +1,40 @@
+import pandas as pd
+
+from cubo import (CuboMediaHora, cortes_por_agente, cortes_por_agente_diarios, cortes_por_agente_turno,
+                  llamadas_largas_por_turno)
+from motor import (CortesPorAgente, CortesPorAgenteDiarios, CortesPorAgenteTurno, LlamadasLargasPorTurno,
+                   procesar)
+
+
+def _ordenar(df):
+    # Los agentes del cubo son categóricos; en el CSV quedan igual que el texto
+    df = df.astype({col: str for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)})
+    return df.sort_values(list(df.columns[:2])).reset_index(drop=True)
+
+
+def test_cubo_igual_a_los_acumuladores(interacciones):
+    cubo = CuboMediaHora(umbral=60)
+    cortes, diarios, turnos, largas = CortesPorAgente(), CortesPorAgenteDiarios(), CortesPorAgenteTurno(), \
+        LlamadasLargasPorTurno(umbral=60)
+    procesar(interacciones, [cubo, cortes, diarios, turnos, largas])
+    cubo = cubo.resultado()
+
+    # El cubo ordena por agente; CortesPorAgente deja el orden de aparición
+    esperado = cortes.resultado()
+    esperado = pd.concat([_ordenar(esperado.iloc[:-1]), esperado.iloc[-1:]], ignore_index=True)
+    pd.testing.assert_frame_equal(cortes_por_agente(cubo), esperado, check_dtype=False)
+    pd.testing.assert_frame_equal(_ordenar(cortes_por_agente_diarios(cubo)), _ordenar(diarios.resultado()),
+                                  check_dtype=False)
+    # El acumulador deja "Turno" como nombre del eje de columnas; no llega al CSV
+    pd.testing.assert_frame_equal(cortes_por_agente_turno(cubo), _ordenar(turnos.resultado()), check_dtype=False,
+                                  check_names=False)
+    pd.testing.assert_frame_equal(llamadas_largas_por_turno(cubo), _ordenar(largas.resultado()),
+                                  check_dtype=False, check_names=False)
+
+
+def test_sin_agentes_en_cero(interacciones):
+    cubo = CuboMediaHora(umbral=60)
+    procesar(interacciones, [cubo])
+    largas = llamadas_largas_por_turno(cubo.resultado())
+    assert "MZA 6" not in set(largas["Nombre Agente"])
+    assert (largas.iloc[:, 1:].sum(axis=1) > 0).all()
@@ -0,0 +1,40 @@
+import pandas as pd
+
+import envivo
+from deduplicacion import ConjuntoIds, descartar_duplicados
+from motor import CortesPorAgenteTurno
+
+
+def _bloque(ids, agentes, inicio="19/2/2025 10:00:00"):
+    return pd.DataFrame({"idInteraccion": ids, "Nombre Agente": agentes, "Origen Corte": "Agente",
+                         "Inicio": inicio})
+
+
+def test_queda_la_primera_aparicion():
+    df = pd.DataFrame({"idInteraccion": ["a", "b", "a", None, None, "b", "c"], "fila": range(7)})
+    resultado = descartar_duplicados(df)
+    assert resultado["fila"].tolist() == [0, 1, 3, 4, 6]
+
+
+def test_duplicados_entre_bloques_con_corridas_en_disco():
+    ids = ConjuntoIds(capacidad=1000, limite_memoria=3)
+    try:
+        assert ids.nuevos(pd.Series(["a", "b", "c", "a"])).tolist() == [True, True, True, False]
+        assert ids.nuevos(pd.Series(["d", "b", "e"])).tolist() == [True, False, True]
+        assert ids.nuevos(pd.Series(["c", "f", "f"])).tolist() == [False, True, False]
+        assert ids.disco and (ids.vistos, ids.duplicados) == (10, 4)
+    finally:
+        ids.cerrar()
+
+
+def test_envivo_descarta_las_filas_reescritas():
+    cortes = CortesPorAgenteTurno(["MZA 1", "MZA 2"])
+    ids = ConjuntoIds(capacidad=1000)
+    try:
+        assert envivo.procesar_bloque(_bloque(["1", "2"], ["MZA 1", "MZA 2"]), [cortes], ids) == 2
+        # El export vuelve a escribir la fila "2" (con otro agente) junto con una nueva
+        assert envivo.procesar_bloque(_bloque(["2", "3"], ["MZA 1", "MZA 1"]), [cortes], ids) == 1
+    finally:
+        ids.cerrar()
+    resultado = cortes.resultado().set_index("Nombre Agente")["Cortes Turno Mañana"]
+    assert resultado.to_dict() == {"MZA 1": 2, "MZA 2": 1}
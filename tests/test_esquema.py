@@ -0,0 +1,23 @@
+import pandas as pd
+
+from esquema import tipar_con_diccionario, tipar_interacciones
+
+
+def test_tiempos_en_el_entero_mas_chico_y_na():
+    chunk = pd.DataFrame({"TalkingTime": ["12", "", "-3", "texto"], "ACW": ["0", "70000", "5", None]})
+    invalidos = {}
+    chunk = tipar_interacciones(chunk, {}, invalidos)
+    assert chunk["TalkingTime"].dtype == "UInt16"
+    assert chunk["ACW"].dtype == "UInt32"
+    assert chunk["TalkingTime"].isna().tolist() == [False, True, True, True]
+    assert invalidos == {"TalkingTime": 3, "ACW": 1}
+
+
+def test_codigos_estables_entre_archivos(tmp_path):
+    ruta = tmp_path / "diccionario.json"
+    primero = tipar_con_diccionario(pd.DataFrame({"Origen Corte": ["Cliente", "Agente"]}), ruta)
+    segundo = tipar_con_diccionario(pd.DataFrame({"Origen Corte": ["Agente", "Sistema"]}), ruta)
+    conocidos = list(primero["Origen Corte"].cat.categories)
+    assert list(segundo["Origen Corte"].cat.categories) == [*conocidos, "Sistema"]
+    assert segundo["Origen Corte"].cat.codes.tolist() == [conocidos.index("Agente"), 2]
+    assert segundo["Origen Corte"].tolist() == ["Agente", "Sistema"]
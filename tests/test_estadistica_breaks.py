@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import estadisticaBreaks
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+
+def _estadisticas(tmp_path, monkeypatch, archivo):
+    monkeypatch.chdir(tmp_path)
+    estadisticaBreaks.guardar_estadisticas(estadisticaBreaks.calcular_totales(archivo))
+    return (tmp_path / estadisticaBreaks.archivo_salida).read_text(encoding='utf8').splitlines()
+
+
+def test_turnos_y_sin_datos_como_el_cuaderno(tmp_path, monkeypatch):
+    archivo = tmp_path / "acumuladores.csv"
+    archivo.write_text(
+        "Intervalo;Agente;Break\n"
+        "19/2/2025 09:30:00;MZA 1;600\n"
+        "19/2/2025 13:30:00;MZA 1;130\n"
+        "19/2/2025 14:00:00;MZA 1;239\n"   # Tarde en el cuaderno
+        "19/2/2025 08:30:00;MZA 2;0\n"     # Antes de las 9: Tarde, con 0 minutos
+        "19/2/2025 10:00:00;MZA 2;59\n"
+        "20/2/2025 11:00:00;MZA 1;120\n",  # Sin intervalos de tarde: "Sin datos"
+        encoding='utf-8-sig'
+    )
+    assert _estadisticas(tmp_path, monkeypatch, archivo) == [
+        "Agente;Fecha;Promedio por Break: 09:30:00 hasta 14:30:00;Promedio por Break: 15:00:00 hasta 20:00:00",
+        "MZA 1;2025-02-19;12.0;3.0",
+        "MZA 1;2025-02-20;2.0;Sin datos",
+        "MZA 2;2025-02-19;0.0;0.0",
+    ]
+
+
+def test_enteros_si_no_falta_ningun_turno(tmp_path, monkeypatch):
+    archivo = tmp_path / "acumuladores.csv"
+    archivo.write_text(
+        "Intervalo;Agente;Break\n"
+        "19/2/2025 10:00:00;MZA 1;600\n"
+        "19/2/2025 16:00:00;MZA 1;0\n",
+        encoding='utf-8-sig'
+    )
+    assert _estadisticas(tmp_path, monkeypatch, archivo)[1:] == ["MZA 1;2025-02-19;10;0"]
+
+
+def test_igual_al_cuaderno_con_el_export_del_repo(tmp_path, monkeypatch):
+    obtenido = _estadisticas(tmp_path, monkeypatch, RAIZ / "Acumuladores de Agentes (2).csv")
+    esperado = (RAIZ / "Estadisticas Febrero" / "Estadisticas.csv").read_text(encoding='utf8').splitlines()
+    assert obtenido == esperado
@@ -0,0 +1,25 @@
+import pandas as pd
+
+from filtros import Filtro
+from indice import IndiceEnConstruccion, construir_indice, leer_indice
+from lectores import leer_csv
+from motor import CortesPorAgenteDiarios, procesar
+from parseo_fechas import parsear_inicio
+
+
+def test_igual_al_construido_aparte(interacciones):
+    construccion = IndiceEnConstruccion(interacciones, filas_por_bloque=64)
+    for chunk in leer_csv(interacciones, ["Inicio"], chunksize=100):
+        construccion.agregar(parsear_inicio(chunk["Inicio"]))
+    armado = construccion.guardar()
+    assert armado["bloques"] == construir_indice(interacciones, filas_por_bloque=64)["bloques"]
+
+
+def test_la_primera_lectura_lo_arma_y_el_rango_lo_usa(interacciones):
+    completo = procesar(interacciones, [CortesPorAgenteDiarios()])[0].resultado()
+    assert leer_indice(interacciones) is not None
+
+    filtro = Filtro(desde="2025-02-18", hasta="2025-02-18")
+    rango = procesar(interacciones, [CortesPorAgenteDiarios()], filtro=filtro)[0].resultado()
+    esperado = completo[completo["Fecha"] == "18/02"].reset_index(drop=True)
+    pd.testing.assert_frame_equal(rango.reset_index(drop=True), esperado)
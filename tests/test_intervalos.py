@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from intervalos import CLAVES, unir
+
+COLUMNAS = ["Connect", "Break"]
+
+
+def _interacciones():
+    return pd.DataFrame({
+        "Intervalo": pd.to_datetime(["2025-02-19 09:00", "2025-02-19 09:30", "2025-02-19 09:30",
+                                     "2025-02-19 10:00", "2025-02-19 11:00"]),
+        "Agente": ["MZA 1", "MZA 1", "MZA 2", "MZA 3", "MZA 1"],
+        "Interacciones": [4, 6, 2, 3, 1],
+        "Cortes Agente": [1, 3, 0, 1, 1],
+        "TalkingTime": [300, 500, 80, 90, 10],
+        "Llamadas Largas": [2, 3, 1, 0, 0],
+    })
+
+
+def _acumuladores(filas):
+    return pd.DataFrame(filas, columns=["Intervalo", "Agente", *COLUMNAS]).astype({"Intervalo": "datetime64[ns]"})
+
+
+def test_clave_repartida_entre_dos_chunks():
+    chunks = [
+        _acumuladores([("2025-02-19 09:00", "MZA 1", 600, 0), ("2025-02-19 09:30", "MZA 1", 300, 60),
+                       ("2025-02-19 09:30", "MZA 4", 120, 0)]),
+        # MZA 1 a las 9:30 sigue en este chunk: se suma con lo del anterior
+        _acumuladores([("2025-02-19 09:30", "MZA 1", 200, 30), ("2025-02-19 10:00", "MZA 2", 900, 0)]),
+    ]
+    unido = pd.concat(unir(_interacciones(), chunks, COLUMNAS), ignore_index=True)
+    unido = unido.set_index(CLAVES)
+
+    assert len(unido) == 7
+    repartida = unido.loc[(pd.Timestamp("2025-02-19 09:30"), "MZA 1")]
+    assert (repartida["Connect"], repartida["Break"]) == (500, 90)
+    assert repartida["Cortes por Minuto Connect"] == round(3 / (500 / 60), 4)
+    assert unido["Origen"].value_counts().to_dict() == {"Ambos": 2, "Solo interacciones": 3, "Solo acumuladores": 2}
+    # Sin acumuladores la tasa de corte sigue, y los minutos de Connect quedan en 0
+    assert unido.loc[(pd.Timestamp("2025-02-19 11:00"), "MZA 1"), "Connect"] == 0
+    assert unido.loc[(pd.Timestamp("2025-02-19 11:00"), "MZA 1"), "Tasa de Corte del Agente"] == 1
+
+
+def test_acumuladores_desordenados():
+    chunks = [
+        _acumuladores([("2025-02-19 09:00", "MZA 1", 600, 0), ("2025-02-19 10:00", "MZA 1", 300, 60)]),
+        _acumuladores([("2025-02-19 09:30", "MZA 1", 200, 30)]),
+    ]
+    with pytest.raises(ValueError, match="no está ordenado por Intervalo"):
+        list(unir(_interacciones(), chunks, COLUMNAS))
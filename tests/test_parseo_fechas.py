@@ -0,0 +1,22 @@
+import pandas as pd
+
+from parseo_fechas import EPOCH_INVALIDO, parsear_epoch, parsear_inicio
+
+
+def test_parsea_igual_que_pandas():
+    valores = pd.Series(["19/2/2025 09:30:00", "1/12/2024 9:05:07", "29/2/2024 23:59:59"])
+    esperado = pd.to_datetime(valores, format="%d/%m/%Y %H:%M:%S")
+    assert parsear_inicio(valores).equals(esperado.astype("datetime64[ns]"))
+
+
+def test_fechas_invalidas_son_nat():
+    valores = pd.Series(["29/2/2025 10:00:00", "19/2/2025 24:00:00", "texto", None])
+    assert parsear_inicio(valores).isna().all()
+
+
+def test_anio_fuera_de_rango_es_nat():
+    valores = pd.Series(["1/1/3000 00:00:00", "1/1/1500 10:00:00", "12/4/2262 00:00:00", "1/1/1678 00:00:00"])
+    fechas = parsear_inicio(valores)
+    assert fechas.iloc[:3].isna().all()
+    assert fechas.iloc[3] == pd.Timestamp("1678-01-01")
+    assert (parsear_epoch(valores)[:3] == EPOCH_INVALIDO).all()
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+from config import FUERA_DE_HORARIO, TURNOS
+
+MINUTOS_DIA = 24 * 60
+
+
+def a_minutos(hora):
+    """Convierte 'HH:MM' a minutos desde la medianoche."""
+    horas, minutos = hora.split(':')
+    return int(horas) * 60 + int(minutos)
+
+
+# Categorías en el orden de la configuración, "Fuera de horario" al final
+NOMBRES_TURNO = [nombre for nombre, _, _ in TURNOS] + [FUERA_DE_HORARIO]
+
+# Columnas de estadistica_mensual/diaria (origenCorte.py, Agendado.py, historico.py, cubo.py)
+# en el orden original (alfabético): las planillas que los leen dependen de él
+RENOMBRAR_HORARIO = {"Mañana": "Cantidad Mañana", "Tarde": "Cantidad Tarde"}
+COLUMNAS_HORARIO = [FUERA_DE_HORARIO, "Cantidad Mañana", "Cantidad Tarde"]
+
+
+def columnas_horario(tabla, clave):
+    """Conteo por turno con los nombres y el orden de columnas de los reportes por horario."""
+    return tabla.rename(columns=RENOMBRAR_HORARIO).reindex(columns=[clave, *COLUMNAS_HORARIO], fill_value=0)
+
+
+def _tabla_minutos():
+    """Arma la tabla minuto del día -> código de turno (una entrada por minuto)."""
+    tabla = np.full(MINUTOS_DIA, len(TURNOS), dtype=np.int8)
+    # Se recorre al revés para que, si dos turnos se solapan, gane el primero
+    for codigo in reversed(range(len(TURNOS))):
+        _, desde, hasta = TURNOS[codigo]
+        tabla[a_minutos(desde):a_minutos(hasta) + 1] = codigo
+    return tabla
+
+
+TABLA_MINUTOS = _tabla_minutos()
+
+
+def minuto_del_dia(fechas):
+    """Devuelve el minuto del día de cada fecha (-1 para NaT)."""
+    fechas = pd.Series(fechas)
+    minutos = fechas.dt.hour * 60 + fechas.dt.minute
+    return minutos.fillna(-1).to_numpy(dtype=np.int64)
+
+
+def clasificar_minutos(minutos):
+    """Asigna el turno a un arreglo de minutos del día con una sola indexación."""
+    minutos = np.asarray(minutos, dtype=np.int64)
+    validos = (minutos >= 0) & (minutos < MINUTOS_DIA)
+    codigos = np.where(validos, TABLA_MINUTOS[np.clip(minutos, 0, MINUTOS_DIA - 1)], -1)
+    return pd.Categorical.from_codes(codigos, categories=NOMBRES_TURNO)
+
+
+def clasificar_turno(fechas):
+    """Clasifica una Serie de fechas en Mañana, Tarde o Fuera de horario (NaT queda nulo)."""
+    fechas = pd.Series(fechas)
+    return pd.Series(clasificar_minutos(minuto_del_dia(fechas)), index=fechas.index, name="Turno")
+
+
+def rango_turno(nombre):
+    """Devuelve el texto 'HH:MM-HH:MM' configurado para un turno."""
+    for turno, desde, hasta in TURNOS:
+        if turno == nombre:
+            return f"{desde}-{hasta}"
+    return ""